@@ -4,11 +4,13 @@ import sys
 from PyQt6.QtWidgets import QApplication
 from .main_window import MainWindow
 from .log_config import setup_logger
+from .web_view_pool import limit_renderer_processes
 import logging
 
 def run_app():
     setup_logger()
     logging.info("애플리케이션 시작.")
+    limit_renderer_processes() # Chromium은 QApplication 생성 전에 설정된 플래그만 읽습니다.
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
@@ -0,0 +1,177 @@
+# oceanocal_v2/async_loader.py
+
+import logging
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+
+
+class AsyncLoader(QObject):
+    """
+    파일 열기, 디코딩, 슬라이스 읽기처럼 오래 걸리는 I/O 작업을 제한된 스레드 풀에서 실행하고
+    결과를 Qt 시그널을 통해 GUI 스레드로 전달합니다.
+    진행 상황과 취소는 status_callback(상태바)으로 보고합니다.
+    """
+    _task_finished = pyqtSignal(int, object)
+    _task_failed = pyqtSignal(int, object)
+
+    def __init__(self, status_callback=None, max_workers=DEFAULT_MAX_WORKERS, parent=None):
+        super().__init__(parent)
+        self.status_callback = status_callback
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="oceanocal-io")
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._tasks = {}  # {task_id: {'future', 'description', 'key', 'on_done', 'on_error', 'on_cancel'}}
+        self._cancelled = {}  # {task_id: on_cancel} 실행 중에 취소되어 결과가 아직 도착하지 않은 작업
+        self._keys = {}  # {key: task_id} 같은 키의 이전 작업은 새 작업이 들어오면 취소
+        # 워커 스레드에서 emit된 시그널은 이 객체가 속한 GUI 스레드에서 처리됩니다 (QueuedConnection).
+        self._task_finished.connect(self._on_task_finished)
+        self._task_failed.connect(self._on_task_failed)
+        logger.info(f"AsyncLoader 초기화. 최대 작업 스레드: {self.max_workers}")
+
+    def _report_status(self, message, timeout=2000):
+        if self.status_callback:
+            self.status_callback(message, timeout)
+
+    def submit(self, func, *args, description="", key=None, on_done=None, on_error=None, on_cancel=None, **kwargs):
+        """
+        func(*args, **kwargs)를 백그라운드에서 실행합니다.
+        on_done(result) / on_error(exception)은 GUI 스레드에서 호출됩니다.
+        key가 주어지면 같은 key로 진행 중인 이전 작업을 취소합니다 (예: 같은 플롯 창의 이전 새로고침).
+        실행 중에 취소된 작업의 결과는 on_done 대신 on_cancel(result)로 전달됩니다.
+        결과가 빌려온 자원(핸들 풀의 핸들 등)을 들고 있다면 on_cancel에서 반환해야 합니다.
+        작업 ID를 반환합니다.
+        """
+        task_id = next(self._ids)
+        if key is not None:
+            previous_id = self._keys.get(key)
+            if previous_id is not None:
+                self.cancel(previous_id, report=False)
+            self._keys[key] = task_id
+
+        with self._lock:
+            self._tasks[task_id] = {
+                'description': description,
+                'key': key,
+                'on_done': on_done,
+                'on_error': on_error,
+                'on_cancel': on_cancel,
+            }
+            # 빠른 작업이 먼저 끝나 항목을 지우기 전에 future를 기록하도록 잠금 안에서 제출합니다.
+            self._tasks[task_id]['future'] = self._executor.submit(self._run, task_id, func, args, kwargs)
+
+        pending = self.pending_count()
+        if description:
+            self._report_status(f"{description} 진행 중... (대기 작업 {pending}개)", 0)
+        logger.debug(f"AsyncLoader: 작업 {task_id} 제출: {description}")
+        return task_id
+
+    def _run(self, task_id, func, args, kwargs):
+        with self._lock:
+            if task_id not in self._tasks:
+                self._cancelled.pop(task_id, None)
+                return  # 시작 전에 취소됨
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._task_failed.emit(task_id, e)
+        else:
+            self._task_finished.emit(task_id, result)
+
+    def _pop_task(self, task_id):
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+        if task and task['key'] is not None and self._keys.get(task['key']) == task_id:
+            del self._keys[task['key']]
+        return task
+
+    @pyqtSlot(int, object)
+    def _on_task_finished(self, task_id, result):
+        task = self._pop_task(task_id)
+        if task is None:
+            with self._lock:
+                on_cancel = self._cancelled.pop(task_id, None)
+            logger.debug(f"AsyncLoader: 취소된 작업 {task_id}의 결과를 무시합니다.")
+            if on_cancel:
+                try:
+                    on_cancel(result)
+                except Exception as e:
+                    logger.error(f"AsyncLoader: 작업 {task_id} 취소 콜백 오류: {e}", exc_info=True)
+            return
+        if task['description']:
+            self._report_status(f"{task['description']} 완료.", 2000)
+        if task['on_done']:
+            try:
+                task['on_done'](result)
+            except Exception as e:
+                logger.error(f"AsyncLoader: 작업 {task_id} 완료 콜백 오류: {e}", exc_info=True)
+
+    @pyqtSlot(int, object)
+    def _on_task_failed(self, task_id, error):
+        task = self._pop_task(task_id)
+        if task is None:
+            with self._lock:
+                self._cancelled.pop(task_id, None)
+            return
+        logger.error(f"AsyncLoader: 작업 {task_id} ({task['description']}) 실패: {error}")
+        if task['description']:
+            self._report_status(f"{task['description']} 실패: {error}", 5000)
+        if task['on_error']:
+            try:
+                task['on_error'](error)
+            except Exception as e:
+                logger.error(f"AsyncLoader: 작업 {task_id} 오류 콜백 오류: {e}", exc_info=True)
+
+    def cancel(self, task_id, report=True):
+        """
+        작업을 취소합니다. 아직 시작하지 않은 작업은 실행되지 않으며,
+        이미 실행 중인 작업의 결과는 도착해도 on_done으로 전달되지 않고 on_cancel(있으면)로 전달됩니다.
+        """
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return False
+            # 이미 실행 중이라 취소할 수 없으면 늦게 도착할 결과를 on_cancel로 넘기도록 기억합니다.
+            if not task['future'].cancel() and task['on_cancel']:
+                self._cancelled[task_id] = task['on_cancel']
+        if task['key'] is not None and self._keys.get(task['key']) == task_id:
+            del self._keys[task['key']]
+        if report and task['description']:
+            self._report_status(f"{task['description']} 취소됨.", 2000)
+        logger.info(f"AsyncLoader: 작업 {task_id} 취소됨.")
+        return True
+
+    def cancel_key(self, key):
+        task_id = self._keys.get(key)
+        if task_id is not None:
+            return self.cancel(task_id)
+        return False
+
+    def cancel_all(self):
+        """진행 중이거나 대기 중인 모든 작업을 취소합니다."""
+        with self._lock:
+            task_ids = list(self._tasks.keys())
+        for task_id in task_ids:
+            self.cancel(task_id, report=False)
+        if task_ids:
+            self._report_status(f"작업 {len(task_ids)}개 취소됨.", 2000)
+        return len(task_ids)
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._tasks)
+
+    def shutdown(self):
+        """애플리케이션 종료 시 대기 중인 작업을 버리고 스레드 풀을 정리합니다."""
+        with self._lock:
+            self._tasks.clear()
+            self._cancelled.clear()
+        self._keys.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("AsyncLoader 종료.")
@@ -1,17 +1,224 @@
 import xarray as xr
 import os
 import logging
+import threading
+from collections import OrderedDict
 from PyQt6.QtWidgets import QMessageBox
 
+from .metadata_index import MetadataIndex
+from .handlers.file_handler import (NetCDFFileHandler, ROOT_GROUP, normalize_group_path, split_variable_path,
+                                    read_group_entry)
+
+try:
+    import dask # noqa: F401 - chunks= 인자로 지연 로딩을 하려면 dask가 필요합니다.
+    HAS_DASK = True
+except ImportError:
+    HAS_DASK = False
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_OPEN_HANDLES = 16
+
+
+def _group_key(filepath, group=None):
+    """루트 그룹은 파일 경로, 하위 그룹은 (파일 경로, 그룹 경로)를 핸들/인덱스 키로 사용합니다."""
+    group = normalize_group_path(group)
+    return filepath if group == ROOT_GROUP else (filepath, group)
+
+
+def load_slice(data_array, indexers=None, keep_dims=None):
+    """
+    DataArray에서 그릴 부분만 잘라 NumPy 배열로 읽어옵니다.
+    indexers에 없는 차원 중 keep_dims에 포함되지 않은 차원은 첫 번째 인덱스로 고정되므로,
+    지연(dask) 모드에서도 실제로 그릴 슬라이스만 디스크에서 읽습니다.
+    """
+    indexers = dict(indexers or {})
+    if keep_dims is not None:
+        for dim in data_array.dims:
+            if dim not in keep_dims and dim not in indexers:
+                indexers[dim] = 0
+    if indexers:
+        data_array = data_array.isel(indexers)
+    return data_array.values
+
+
+class DatasetHandlePool:
+    """
+    파일 경로(하위 그룹은 파일 경로와 그룹 경로)별 xarray Dataset 핸들을 참조 카운트로 공유하는 풀.
+    같은 파일을 여러 곳(트리, 플롯 창 등)에서 요청해도 한 번만 열고,
+    아무도 사용하지 않는 핸들은 최대 개수를 넘을 때 LRU 순서로 닫습니다.
+    """
+    def __init__(self, max_handles=DEFAULT_MAX_OPEN_HANDLES):
+        self.max_handles = max(1, int(max_handles))
+        self._handles = OrderedDict()  # {key: xarray.Dataset}, 앞쪽이 가장 오래 사용되지 않은 핸들
+        self._refcounts = {}  # {key: int}, key는 _group_key() 참고
+        self._opening = {}  # {key: threading.Event} 다른 스레드가 잠금 밖에서 여는 중인 핸들
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, filepath, open_kwargs=None, group=None):
+        """
+        핸들을 빌려오고 참조 카운트를 증가시킵니다. 풀에 없으면 파일(또는 그 하위 그룹)을 엽니다.
+        open_kwargs는 새로 열 때만 xr.open_dataset에 전달됩니다 (예: chunks).
+        사용이 끝나면 반드시 같은 group으로 release()를 호출해야 합니다.
+        파일은 잠금 밖에서 열므로 느린 열기가 다른 핸들의 acquire/release를 막지 않으며,
+        같은 키를 다른 스레드가 여는 중이면 그 결과를 기다려 함께 사용합니다.
+        """
+        key = _group_key(filepath, group)
+        while True:
+            with self._lock:
+                ds = self._handles.get(key)
+                if ds is not None:
+                    self.hits += 1
+                    self._handles.move_to_end(key)
+                    self._refcounts[key] = self._refcounts.get(key, 0) + 1
+                    self._evict_idle()
+                    return ds
+                pending = self._opening.get(key)
+                if pending is None:
+                    pending = self._opening[key] = threading.Event()
+                    self.misses += 1
+                    break
+            pending.wait() # 먼저 연 스레드가 끝나면 다시 확인 (실패했다면 이 스레드가 엽니다)
+
+        open_kwargs = dict(open_kwargs or {})
+        if key != filepath:
+            open_kwargs["group"] = key[1]
+        try:
+            ds = xr.open_dataset(filepath, **open_kwargs)
+        except Exception:
+            with self._lock:
+                self._opening.pop(key, None)
+                pending.set()
+            raise
+
+        duplicate = None
+        with self._lock:
+            self._opening.pop(key, None)
+            pending.set()
+            if key in self._handles:
+                # 다른 스레드가 먼저 넣었다면 그 핸들을 쓰고 이번에 연 핸들은 닫습니다.
+                duplicate, ds = ds, self._handles[key]
+                self._handles.move_to_end(key)
+            else:
+                self._handles[key] = ds
+                logger.debug(f"핸들 풀: 새 핸들 열림: {key}")
+            self._refcounts[key] = self._refcounts.get(key, 0) + 1
+            self._evict_idle()
+        if duplicate is not None:
+            duplicate.close()
+        return ds
+
+    def release(self, filepath, group=None):
+        """참조 카운트를 감소시킵니다. 0이 된 핸들은 즉시 닫지 않고 유휴 상태로 남겨둡니다."""
+        key = _group_key(filepath, group)
+        with self._lock:
+            count = self._refcounts.get(key, 0)
+            if count <= 0:
+                logger.warning(f"핸들 풀: 빌려가지 않은 핸들을 반환하려고 했습니다: {key}")
+                return
+            self._refcounts[key] = count - 1
+            self._evict_idle()
+
+    def peek(self, filepath, group=None):
+        """참조 카운트 변경 없이 이미 열린 핸들을 반환합니다. 없으면 None."""
+        with self._lock:
+            return self._handles.get(_group_key(filepath, group))
+
+    def refcount(self, filepath, group=None):
+        with self._lock:
+            return self._refcounts.get(_group_key(filepath, group), 0)
+
+    def close_all(self):
+        """사용 여부와 관계없이 모든 핸들을 닫습니다 (애플리케이션 종료 시)."""
+        with self._lock:
+            for key in list(self._handles.keys()):
+                self._close_handle(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "open_handles": len(self._handles),
+                "in_use": sum(1 for c in self._refcounts.values() if c > 0),
+                "max_handles": self.max_handles,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _evict_idle(self):
+        """최대 개수를 넘는 동안, 사용 중이지 않은 핸들을 오래된 순서로 닫습니다."""
+        if len(self._handles) <= self.max_handles:
+            return
+        for key in list(self._handles.keys()):
+            if len(self._handles) <= self.max_handles:
+                break
+            if self._refcounts.get(key, 0) == 0:
+                self._close_handle(key)
+                self.evictions += 1
+        if len(self._handles) > self.max_handles:
+            logger.debug(f"핸들 풀: 모든 핸들이 사용 중이어서 최대 개수({self.max_handles})를 초과했습니다.")
+
+    def _close_handle(self, key):
+        ds = self._handles.pop(key, None)
+        self._refcounts.pop(key, None)
+        if ds is not None:
+            try:
+                ds.close()
+                logger.debug(f"핸들 풀: 핸들 닫힘: {key}")
+            except Exception as e:
+                logger.error(f"핸들 풀: 핸들을 닫는 중 오류 발생 ({key}): {e}")
+
+
 class DatasetManager:
-    def __init__(self, status_callback=None):
+    def __init__(self, status_callback=None, max_open_handles=DEFAULT_MAX_OPEN_HANDLES,
+                 lazy=False, chunks=None, loader=None, metadata_cache=None, pyramid_cache=None,
+                 slice_cache=None):
         self.open_datasets = {}  # {filepath: xarray.Dataset}
         self.current_file_path = None # 현재 활성화된 파일 경로 추가
         self.status_callback = status_callback
+        self.loader = loader # AsyncLoader: 설정되면 파일 열기/슬라이스 읽기를 백그라운드에서 수행
+        self.metadata_indexes = {} # {filepath 또는 (filepath, group): MetadataIndex} 트리/정보 패널용 메타데이터 캐시
+        self.group_datasets = {} # {(filepath, group): xarray.Dataset} 펼쳤거나 플롯한 하위 그룹만 열림
+        self.group_handlers = {} # {filepath: NetCDFFileHandler} 그룹 구조/변수 경로 캐시
+        self.metadata_cache = metadata_cache # MetadataCache: 파일을 열기 전에 쓸 수 있는 영구 캐시
+        self.pyramid_cache = pyramid_cache # PyramidCache: 큰 2D 변수의 다중 해상도 개요 (플롯 창에서 사용)
+        self.slice_cache = slice_cache # SliceCache: 시간/깊이 슬라이스 LRU와 이웃 미리 읽기 (플롯 창에서 사용)
+        self.handle_pool = DatasetHandlePool(max_open_handles) # 플롯 창과 공유하는 핸들 풀
+        self.lazy = lazy # True이면 dask 청크 기반으로 지연 로딩
+        self.default_chunks = dict(chunks or {}) # {dim: chunk_size}, 비어 있으면 디스크 청크 사용
+        self.file_chunks = {} # {filepath: {dim: chunk_size}} 파일별 청크 설정
+        if self.lazy and not HAS_DASK:
+            logger.warning("dask가 설치되어 있지 않아 지연(청크) 모드를 사용할 수 없습니다. 기본 모드로 엽니다.")
         logger.info("DatasetManager 초기화.")
 
+    def set_lazy_mode(self, lazy, chunks=None):
+        """
+        지연(청크) 열기 모드를 설정합니다. chunks는 모든 파일에 적용할 차원별 청크 크기입니다.
+        이미 풀에 열려 있는 핸들에는 적용되지 않습니다.
+        """
+        self.lazy = lazy
+        if chunks is not None:
+            self.default_chunks = dict(chunks)
+        logger.info(f"지연 모드 설정: {lazy}, 청크: {self.default_chunks}")
+
+    def set_file_chunks(self, filepath, chunks):
+        """특정 파일에 대한 차원별 청크 크기를 설정합니다. None이면 파일별 설정을 제거합니다."""
+        if chunks is None:
+            self.file_chunks.pop(filepath, None)
+        else:
+            self.file_chunks[filepath] = dict(chunks)
+
+    def _open_kwargs(self, filepath):
+        """xr.open_dataset에 전달할 인자를 만듭니다."""
+        if not (self.lazy and HAS_DASK):
+            return {}
+        # 빈 dict는 디스크에 저장된 청크 구조를 그대로 사용하라는 의미입니다.
+        chunks = {**self.default_chunks, **self.file_chunks.get(filepath, {})}
+        return {"chunks": chunks}
+
     def _report_status(self, message, timeout=2000):
         if self.status_callback:
             self.status_callback(message, timeout)
@@ -32,18 +239,253 @@ class DatasetManager:
             return self.open_datasets[filepath]
 
         try:
-            ds = xr.open_dataset(filepath)
-            self.open_datasets[filepath] = ds
-            self.current_file_path = filepath # 새로 열었을 때 현재 파일로 설정
-            self._report_status(f"'{os.path.basename(filepath)}' 파일 열림.", 2000)
-            logger.info(f"파일 열림: {filepath}")
-            return ds
+            ds = self.handle_pool.acquire(filepath, self._open_kwargs(filepath))
+            return self._register_opened(filepath, ds)
         except Exception as e:
             msg = f"파일 로드 중 오류 발생: {e}"
             self._report_status(msg, 5000)
             logger.error(msg)
             raise IOError(msg)
 
+    def open_file_async(self, filepath, on_done=None, on_error=None):
+        """
+        open_file()과 같지만 파일 열기와 디코딩을 AsyncLoader의 작업 스레드에서 수행합니다.
+        on_done(dataset) / on_error(exception)은 GUI 스레드에서 호출됩니다.
+        loader가 없으면 동기적으로 엽니다.
+        """
+        if self.loader is None or filepath in self.open_datasets:
+            try:
+                ds = self.open_file(filepath)
+            except (FileNotFoundError, IOError) as e:
+                if on_error:
+                    on_error(e)
+                return None
+            if on_done:
+                on_done(ds)
+            return None
+
+        def _on_opened(result):
+            ds, metadata_index, entry = result
+            self.metadata_indexes.setdefault(filepath, metadata_index)
+            self._remember_group(filepath, ROOT_GROUP, entry)
+            ds = self._register_opened(filepath, ds)
+            if on_done:
+                on_done(ds)
+
+        return self.loader.submit(
+            self._open_in_worker, filepath,
+            description=f"'{os.path.basename(filepath)}' 불러오기",
+            key=("open", filepath),
+            on_done=_on_opened,
+            on_error=on_error,
+            on_cancel=lambda result: self.handle_pool.release(filepath), # 취소된 열기가 빌린 핸들 반환
+        )
+
+    def _open_in_worker(self, filepath):
+        """
+        작업 스레드에서 실행: 핸들 풀에서 파일을 열고 메타데이터를 미리 디코딩합니다.
+        (dataset, MetadataIndex, 루트 그룹 구조)를 반환합니다. 그룹 구조는 GUI 스레드에서 _remember_group()으로 저장합니다.
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
+        try:
+            ds = self.handle_pool.acquire(filepath, self._open_kwargs(filepath))
+        except Exception as e:
+            raise IOError(f"파일 로드 중 오류 발생: {e}")
+        try:
+            # 1D 좌표는 트리/플롯에서 바로 쓰이므로 GUI 스레드가 디스크를 읽지 않도록 여기서 읽어둡니다.
+            for coord in ds.coords.values():
+                if coord.ndim <= 1:
+                    coord.load()
+            entry = self._read_group_entry(filepath, ROOT_GROUP)
+            return ds, self._build_metadata_index(filepath, ds, groups=entry[0] if entry else ()), entry
+        except Exception:
+            self.handle_pool.release(filepath)
+            raise
+
+    def _build_metadata_index(self, filepath, ds, group=ROOT_GROUP, groups=None):
+        """
+        영구 캐시에 유효한 인덱스가 있으면 사용하고, 없으면 만들어 캐시에 저장합니다.
+        작업 스레드에서는 group_handlers를 건드리지 않도록 하위 그룹 이름(groups)을 넘겨받습니다.
+        """
+        if self.metadata_cache is not None:
+            metadata_index = self.metadata_cache.get(filepath, group)
+            if metadata_index is not None:
+                return metadata_index
+        if groups is None:
+            groups = self.list_groups(filepath, group)
+        metadata_index = MetadataIndex.from_dataset(filepath, ds, group=group, groups=groups)
+        if self.metadata_cache is not None:
+            self.metadata_cache.put(metadata_index)
+        return metadata_index
+
+    # --- NetCDF4/HDF5 그룹 ---
+
+    def _group_handler(self, filepath):
+        handler = self.group_handlers.get(filepath)
+        if handler is None:
+            handler = NetCDFFileHandler(filepath)
+            self.group_handlers[filepath] = handler
+        return handler
+
+    def _read_group_entry(self, filepath, group):
+        """
+        작업 스레드에서 실행: group의 (하위 그룹, 변수 이름)을 읽습니다. 이미 읽은 구조는 캐시에서 가져오며,
+        group_handlers는 GUI 스레드에서만 바꾸므로 여기서는 읽기만 합니다. 읽을 수 없으면 None.
+        """
+        handler = self.group_handlers.get(filepath)
+        entry = handler.peek_group(group) if handler is not None else None
+        if entry is not None:
+            return entry
+        try:
+            return read_group_entry(filepath, group)
+        except Exception as e:
+            logger.debug(f"그룹 구조를 읽을 수 없습니다 ({filepath}{group}): {e}")
+            return None
+
+    def _remember_group(self, filepath, group, entry):
+        """작업 스레드에서 읽은 그룹 구조를 파일의 NetCDFFileHandler 캐시에 넣습니다 (GUI 스레드)."""
+        if entry is not None:
+            self._group_handler(filepath).add_group(group, entry)
+
+    def list_groups(self, filepath, group=ROOT_GROUP):
+        """group 바로 아래의 하위 그룹 이름을 반환합니다. 그룹을 지원하지 않는 파일이면 빈 tuple."""
+        try:
+            return self._group_handler(filepath).list_groups(group)
+        except Exception as e:
+            logger.debug(f"그룹 목록을 읽을 수 없습니다 ({filepath}{group}): {e}")
+            return ()
+
+    def open_group(self, filepath, group):
+        """
+        파일의 하위 그룹을 핸들 풀에서 열어 반환합니다. 루트 그룹이면 open_file()과 같습니다.
+        그룹은 파일이 닫힐 때 함께 닫힙니다.
+        """
+        group = normalize_group_path(group)
+        if group == ROOT_GROUP:
+            return self.open_file(filepath)
+        ds = self.group_datasets.get((filepath, group))
+        if ds is not None:
+            return ds
+        try:
+            ds = self.handle_pool.acquire(filepath, self._open_kwargs(filepath), group=group)
+        except Exception as e:
+            msg = f"그룹 '{group}' 로드 중 오류 발생: {e}"
+            self._report_status(msg, 5000)
+            logger.error(msg)
+            raise IOError(msg)
+        return self._register_group(filepath, group, ds)
+
+    def open_group_async(self, filepath, group, on_done=None, on_error=None):
+        """
+        open_group()과 같지만 그룹 열기와 메타데이터 디코딩을 작업 스레드에서 수행합니다.
+        트리에서 그룹 노드를 펼칠 때 사용됩니다. on_done(dataset)은 GUI 스레드에서 호출됩니다.
+        """
+        group = normalize_group_path(group)
+        if self.loader is None or group == ROOT_GROUP or (filepath, group) in self.group_datasets:
+            try:
+                ds = self.open_group(filepath, group)
+            except (FileNotFoundError, IOError) as e:
+                if on_error:
+                    on_error(e)
+                return None
+            if on_done:
+                on_done(ds)
+            return None
+
+        def _on_opened(result):
+            ds, metadata_index, entry = result
+            self.metadata_indexes.setdefault((filepath, group), metadata_index)
+            self._remember_group(filepath, group, entry)
+            ds = self._register_group(filepath, group, ds)
+            if on_done:
+                on_done(ds)
+
+        return self.loader.submit(
+            self._open_group_in_worker, filepath, group,
+            description=f"그룹 '{group}' 불러오기",
+            key=("open", filepath, group),
+            on_done=_on_opened,
+            on_error=on_error,
+            on_cancel=lambda result: self.handle_pool.release(filepath, group),
+        )
+
+    def _open_group_in_worker(self, filepath, group):
+        try:
+            ds = self.handle_pool.acquire(filepath, self._open_kwargs(filepath), group=group)
+        except Exception as e:
+            raise IOError(f"그룹 '{group}' 로드 중 오류 발생: {e}")
+        try:
+            for coord in ds.coords.values():
+                if coord.ndim <= 1:
+                    coord.load()
+            entry = self._read_group_entry(filepath, group)
+            return ds, self._build_metadata_index(filepath, ds, group, groups=entry[0] if entry else ()), entry
+        except Exception:
+            self.handle_pool.release(filepath, group)
+            raise
+
+    def _register_group(self, filepath, group, ds):
+        key = (filepath, group)
+        if key in self.group_datasets:
+            self.handle_pool.release(filepath, group)
+            return self.group_datasets[key]
+        self.group_datasets[key] = ds
+        logger.info(f"그룹 열림: {filepath}{group}")
+        return ds
+
+    def _close_groups(self, filepath):
+        """파일의 열린 하위 그룹과 그룹 캐시를 정리합니다."""
+        for key in [key for key in self.group_datasets if key[0] == filepath]:
+            del self.group_datasets[key]
+            self.handle_pool.release(filepath, key[1])
+        for key in [key for key in self.metadata_indexes if isinstance(key, tuple) and key[0] == filepath]:
+            del self.metadata_indexes[key]
+        handler = self.group_handlers.pop(filepath, None)
+        if handler is not None:
+            handler.close_file()
+
+    def resolve_variable_path(self, filepath, var_path):
+        """
+        '/그룹/변수' 형태의 경로를 (그룹 경로, 변수 이름)으로 해석합니다. 찾을 수 없으면 None.
+        하위 그룹 경로는 파일별 NetCDFFileHandler의 get_variable_by_path 캐시를 통해 해석됩니다.
+        """
+        group, var_name = split_variable_path(var_path)
+        if group == ROOT_GROUP:
+            return group, var_name
+        return self._group_handler(filepath).get_variable_by_path(var_path)
+
+    def get_variable_by_path(self, filepath, var_path):
+        """
+        변수 경로로 DataArray를 가져옵니다. 하위 그룹이 아직 열리지 않았다면 이때 엽니다.
+        """
+        resolved = self.resolve_variable_path(filepath, var_path)
+        if resolved is None:
+            return None
+        group, var_name = resolved
+        ds = self.get_dataset(filepath, group)
+        if ds is None and group != ROOT_GROUP:
+            try:
+                ds = self.open_group(filepath, group)
+            except IOError:
+                return None
+        if ds is None or var_name not in ds.variables:
+            return None
+        return ds[var_name]
+
+    def _register_opened(self, filepath, ds):
+        """풀에서 빌려온 핸들을 열린 파일 목록에 등록하고 현재 파일로 설정합니다 (GUI 스레드)."""
+        if filepath in self.open_datasets:
+            # 다른 요청이 먼저 등록했다면 이번에 빌린 참조는 반환합니다.
+            self.handle_pool.release(filepath)
+            ds = self.open_datasets[filepath]
+        else:
+            self.open_datasets[filepath] = ds
+            self._report_status(f"'{os.path.basename(filepath)}' 파일 열림.", 2000)
+            logger.info(f"파일 열림: {filepath}")
+        self.current_file_path = filepath # 새로 열었을 때 현재 파일로 설정
+        return ds
+
     def close_file(self, filepath=None):
         """
         주어진 경로의 파일을 닫거나, filepath가 None이면 현재 활성화된 파일을 닫습니다.
@@ -52,8 +494,12 @@ class DatasetManager:
 
         if target_filepath and target_filepath in self.open_datasets:
             try:
-                self.open_datasets[target_filepath].close()
                 del self.open_datasets[target_filepath]
+                self.metadata_indexes.pop(target_filepath, None)
+                self._close_groups(target_filepath)
+                self.handle_pool.release(target_filepath) # 플롯 창이 사용 중이면 핸들은 유지됩니다.
+                if self.slice_cache is not None:
+                    self.slice_cache.invalidate(target_filepath)
                 logger.info(f"파일 닫기 성공: {target_filepath}")
                 self._report_status(f"파일 닫힘: {os.path.basename(target_filepath)}", 2000)
                 
@@ -67,16 +513,93 @@ class DatasetManager:
             logger.info("닫을 파일이 없습니다.")
             # self._report_status("닫을 파일이 없습니다.", 2000) # 주석 처리 또는 위와 같이 변경
 
-    def get_dataset(self, filepath=None):
+    def get_dataset(self, filepath=None, group=None):
         """
         주어진 경로의 데이터셋을 반환하거나, filepath가 None이면 현재 활성화된 데이터셋을 반환합니다.
+        group이 하위 그룹이면 열려 있는 그룹의 데이터셋을 반환합니다.
         """
+        if normalize_group_path(group) != ROOT_GROUP:
+            return self.group_datasets.get((filepath or self.current_file_path, normalize_group_path(group)))
         if filepath:
             return self.open_datasets.get(filepath)
         elif self.current_file_path:
             return self.open_datasets.get(self.current_file_path)
         return None
 
+    def acquire_dataset(self, filepath, group=None):
+        """
+        플롯 창처럼 파일을 오래 사용하는 쪽에서 핸들 풀의 데이터셋(또는 하위 그룹)을 빌려옵니다.
+        사용이 끝나면 같은 group으로 release_dataset()을 호출해야 합니다.
+        """
+        if not os.path.exists(filepath):
+            msg = f"파일을 찾을 수 없습니다: {filepath}"
+            logger.error(msg)
+            raise FileNotFoundError(msg)
+        try:
+            return self.handle_pool.acquire(filepath, self._open_kwargs(filepath), group=group)
+        except Exception as e:
+            msg = f"파일 로드 중 오류 발생: {e}"
+            logger.error(msg)
+            raise IOError(msg)
+
+    def release_dataset(self, filepath, group=None):
+        """acquire_dataset()으로 빌려온 데이터셋을 반환합니다."""
+        self.handle_pool.release(filepath, group)
+
+    def get_handle_pool_stats(self):
+        """핸들 풀의 적중/실패 횟수 등 통계를 반환합니다."""
+        return self.handle_pool.stats()
+
+    def close_all(self):
+        """열린 모든 파일과 풀의 핸들을 닫습니다."""
+        self.open_datasets.clear()
+        self.metadata_indexes.clear()
+        self.group_datasets.clear()
+        for handler in self.group_handlers.values():
+            handler.close_file()
+        self.group_handlers.clear()
+        self.current_file_path = None
+        self.handle_pool.close_all()
+        if self.metadata_cache is not None:
+            self.metadata_cache.close()
+        if self.pyramid_cache is not None:
+            self.pyramid_cache.clear()
+        if self.slice_cache is not None:
+            self.slice_cache.invalidate()
+        logger.info("모든 데이터셋 핸들 닫힘.")
+
+    def get_metadata_index(self, filepath=None, group=None):
+        """
+        열린 파일(또는 열린 하위 그룹)의 MetadataIndex를 반환합니다.
+        한 번 만든 인덱스는 파일이 닫힐 때까지 캐시됩니다.
+        """
+        filepath = filepath if filepath else self.current_file_path
+        group = normalize_group_path(group)
+        key = _group_key(filepath, group)
+        metadata_index = self.metadata_indexes.get(key)
+        if metadata_index is None:
+            ds = self.get_dataset(filepath, group)
+            if ds is None:
+                return None
+            metadata_index = self._build_metadata_index(filepath, ds, group)
+            self.metadata_indexes[key] = metadata_index
+        return metadata_index
+
+    def peek_metadata_index(self, filepath, group=None):
+        """
+        파일을 열지 않고 사용할 수 있는 MetadataIndex를 반환합니다.
+        열린 파일의 캐시나 영구 캐시(크기/mtime이 같은 경우)에 없으면 None.
+        """
+        metadata_index = self.metadata_indexes.get(_group_key(filepath, group))
+        if metadata_index is None and self.metadata_cache is not None:
+            metadata_index = self.metadata_cache.get(filepath, normalize_group_path(group))
+        return metadata_index
+
+    def set_current_file_path(self, filepath):
+        """트리에서 선택된 파일처럼, 이미 열린 파일을 현재 파일로 설정합니다."""
+        if filepath in self.open_datasets:
+            self.current_file_path = filepath
+
     def get_current_file_path(self):
         """
         현재 활성화된 파일의 경로를 반환합니다.
@@ -86,7 +609,10 @@ class DatasetManager:
     def get_variable_data_from_file(self, filepath, var_name):
         """
         주어진 파일 경로에서 특정 변수의 데이터를 가져옵니다.
+        var_name이 '/그룹/변수' 경로이면 get_variable_by_path()로 해석합니다.
         """
+        if "/" in var_name:
+            return self.get_variable_by_path(filepath, var_name)
         ds = self.get_dataset(filepath)
         if ds and var_name in ds.variables:
             return ds.variables[var_name]
@@ -94,17 +620,34 @@ class DatasetManager:
             return ds.coords[var_name]
         return None
 
-    def get_variable_info_from_dataset(self, dataset_path, var_name):
+    def get_variable_slice(self, filepath, var_name, indexers=None, keep_dims=None):
+        """
+        변수에서 주어진 인덱스 범위만 NumPy 배열로 읽어옵니다. (load_slice 참고)
+        """
+        variable = self.get_variable_data_from_file(filepath, var_name)
+        if variable is None:
+            return None
+        return load_slice(variable, indexers, keep_dims)
+
+    def get_variable_info_from_dataset(self, dataset_path, var_name, group=None):
         """
         Gets variable info assuming var_name might be a coordinate or a data variable.
         Used by plot_handler for dimension analysis.
         """
-        ds = self.open_datasets.get(dataset_path)
-        if not ds:
-            try:
-                ds = self.open_file(dataset_path) # 필요시 파일을 엽니다.
-            except (FileNotFoundError, IOError):
-                return None
+        if normalize_group_path(group) != ROOT_GROUP:
+            ds = self.get_dataset(dataset_path, group)
+            if ds is None:
+                try:
+                    ds = self.open_group(dataset_path, group)
+                except IOError:
+                    return None
+        else:
+            ds = self.open_datasets.get(dataset_path)
+            if not ds:
+                try:
+                    ds = self.open_file(dataset_path) # 필요시 파일을 엽니다.
+                except (FileNotFoundError, IOError):
+                    return None
 
         if var_name in ds.variables:
             var = ds.variables[var_name]
@@ -0,0 +1,300 @@
+# oceanocal_v2/dataset_tree_model.py
+
+import os
+import logging
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, pyqtSignal
+
+from .metadata_index import MetadataIndex # noqa: F401 - 트리 모델과 함께 쓰이므로 다시 내보냅니다.
+from .handlers.file_handler import join_group_path
+
+logger = logging.getLogger(__name__)
+
+# 트리 노드 유형. UserRole 데이터로 노출되며 기존 QTreeWidgetItem의 유형 문자열과 같습니다.
+KIND_FILE = "file"
+KIND_DIMENSION = "dimension"
+KIND_COORDINATE = "coordinate"
+KIND_DATA_VARIABLE = "data_variable"
+KIND_ATTRIBUTE = "attribute"
+KIND_GROUP = "group" # NetCDF4/HDF5 하위 그룹. 그룹의 MetadataIndex가 도착해야 자식이 생깁니다.
+# 아래 유형은 자식만 묶는 폴더 노드입니다.
+KIND_DIMENSIONS = "dimensions"
+KIND_COORDINATES = "coordinates"
+KIND_DATA_VARIABLES = "data_variables"
+KIND_ATTRIBUTES = "attributes"
+KIND_GLOBAL_ATTRIBUTES = "global_attributes"
+KIND_GROUPS = "groups"
+
+NameRole = Qt.ItemDataRole.UserRole + 1 # 변수/차원/속성의 실제 이름
+
+MAX_LABEL_LENGTH = 120 # 긴 속성 값(history 등)은 트리에 잘라서 표시하고 전체 값은 툴팁/정보 패널에 표시
+
+def _shorten(text):
+    text = text.replace("\n", " ")
+    if len(text) > MAX_LABEL_LENGTH:
+        return text[:MAX_LABEL_LENGTH] + "…"
+    return text
+
+
+class _TreeNode:
+    """모델 내부 노드. children은 처음 펼쳐질 때(fetchMore) 만들어집니다."""
+    __slots__ = ("label", "kind", "name", "parent", "row", "children", "index", "tooltip")
+
+    def __init__(self, label, kind, name=None, parent=None, row=0, index=None, tooltip=None):
+        self.label = label
+        self.kind = kind
+        self.name = name
+        self.parent = parent
+        self.row = row
+        self.children = None # None이면 아직 자식을 만들지 않은 상태
+        self.index = index # 이 노드가 속한 MetadataIndex
+        self.tooltip = tooltip
+
+
+class DatasetTreeModel(QAbstractItemModel):
+    """
+    MetadataIndex를 기반으로 하는 지연 확장 트리 모델.
+    열린 파일마다 최상위 노드를 하나씩 두며, 노드가 펼쳐질 때만 자식 행을 만들므로
+    변수/속성이 수천 개인 파일도 즉시 표시됩니다.
+    하위 그룹 노드는 처음 펼쳐질 때 group_index_requested(filepath, group)를 보내고,
+    set_group_index()로 그룹의 MetadataIndex가 전달되면 자식을 채웁니다.
+    """
+    group_index_requested = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _TreeNode("", None)
+        self._root.children = []
+        self._group_nodes = {} # {(filepath, group): _TreeNode} 자식을 기다리는 그룹 노드
+        self._requested_groups = set() # 이미 요청을 보낸 (filepath, group)
+
+    # --- 데이터 설정 ---
+
+    def add_file(self, metadata_index):
+        """
+        파일 노드를 트리 끝에 추가하고 그 행 번호를 반환합니다.
+        이미 있는 파일이면 기존 노드를 그대로 두고 행 번호만 반환합니다.
+        """
+        row = self.file_row(metadata_index.filepath)
+        if row >= 0:
+            return row
+        row = len(self._root.children)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._root.children.append(self._make_file_node(metadata_index, row))
+        self.endInsertRows()
+        return row
+
+    def remove_file(self, filepath):
+        """파일 노드와 그 하위 트리만 제거합니다. 제거했으면 True."""
+        row = self.file_row(filepath)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._root.children[row]
+        for new_row, node in enumerate(self._root.children[row:], start=row):
+            node.row = new_row
+        for key in [key for key in self._group_nodes if key[0] == filepath]:
+            del self._group_nodes[key]
+        self._requested_groups = {key for key in self._requested_groups if key[0] != filepath}
+        self.endRemoveRows()
+        return True
+
+    def file_row(self, filepath):
+        for row, node in enumerate(self._root.children):
+            if node.name == filepath:
+                return row
+        return -1
+
+    def file_index(self, filepath):
+        """파일 노드의 QModelIndex를 반환합니다 (없으면 유효하지 않은 인덱스)."""
+        row = self.file_row(filepath)
+        return self.index(row, 0) if row >= 0 else QModelIndex()
+
+    def file_paths(self):
+        return [node.name for node in self._root.children]
+
+    def clear(self):
+        self.beginResetModel()
+        self._root.children = []
+        self._group_nodes.clear()
+        self._requested_groups.clear()
+        self.endResetModel()
+
+    def set_group_index(self, metadata_index):
+        """
+        펼쳐진 그룹 노드에 그룹의 MetadataIndex를 연결하고 자식 행을 만듭니다.
+        해당 그룹 노드가 트리에 없으면(파일이 닫힌 경우 등) 아무것도 하지 않습니다.
+        """
+        key = (metadata_index.filepath, metadata_index.group)
+        self._requested_groups.discard(key)
+        node = self._group_nodes.pop(key, None)
+        if node is None or node.children is not None:
+            return
+        node.index = metadata_index
+        self.fetchMore(self.createIndex(node.row, 0, node))
+
+    def group_load_failed(self, filepath, group):
+        """그룹을 열지 못했을 때 다시 펼치면 재요청하도록 상태를 되돌립니다."""
+        self._requested_groups.discard((filepath, group))
+
+    def _make_file_node(self, metadata_index, row):
+        label = os.path.basename(metadata_index.filepath) if metadata_index.filepath else 'Unknown File'
+        return _TreeNode(label, KIND_FILE, name=metadata_index.filepath, parent=self._root, row=row,
+                         index=metadata_index, tooltip=metadata_index.filepath)
+
+    # --- 노드 접근 ---
+
+    def node(self, index):
+        """QModelIndex에 해당하는 노드를 반환합니다 (유효하지 않으면 루트)."""
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def node_kind(self, index):
+        return self.node(index).kind if index.isValid() else None
+
+    def node_name(self, index):
+        return self.node(index).name if index.isValid() else None
+
+    def metadata_index(self, index):
+        """노드가 속한 파일의 MetadataIndex를 반환합니다."""
+        return self.node(index).index if index.isValid() else None
+
+    # --- 지연 자식 생성 ---
+
+    def _child_specs(self, node):
+        """노드 유형별로 자식 노드의 (label, kind, name, tooltip) 목록을 만듭니다."""
+        meta = node.index
+        if node.kind in (KIND_FILE, KIND_GROUP):
+            specs = [
+                ("Dimensions", KIND_DIMENSIONS, None, None),
+                ("Coordinates", KIND_COORDINATES, None, None),
+                ("Data Variables", KIND_DATA_VARIABLES, None, None),
+            ]
+            if meta.groups:
+                specs.append(("Groups", KIND_GROUPS, None, None))
+            if node.kind == KIND_FILE:
+                specs.append(("Global Attributes", KIND_GLOBAL_ATTRIBUTES, None, None))
+            else:
+                specs.append(("Group Attributes", KIND_GLOBAL_ATTRIBUTES, None, None))
+            return specs
+        if node.kind == KIND_GROUPS:
+            return [(name, KIND_GROUP, join_group_path(meta.group, name), None) for name in meta.groups]
+        if node.kind == KIND_DIMENSIONS:
+            return [(f"{dim}: {size}", KIND_DIMENSION, dim, None) for dim, size in meta.dims]
+        if node.kind == KIND_COORDINATES:
+            return [(name, KIND_COORDINATE, name, None) for name in meta.coords]
+        if node.kind == KIND_DATA_VARIABLES:
+            return [(name, KIND_DATA_VARIABLE, name, None) for name in meta.data_vars]
+        if node.kind in (KIND_COORDINATE, KIND_DATA_VARIABLE):
+            var = meta.get_variable(node.name)
+            return [("Attributes", KIND_ATTRIBUTES, node.name, None)] if var and var.attrs else []
+        if node.kind == KIND_ATTRIBUTES:
+            var = meta.get_variable(node.name)
+            attrs = var.attrs if var else ()
+            return [(_shorten(f"{key}: {value}"), KIND_ATTRIBUTE, key, value) for key, value in attrs]
+        if node.kind == KIND_GLOBAL_ATTRIBUTES:
+            return [(_shorten(f"{key}: {value}"), KIND_ATTRIBUTE, key, value) for key, value in meta.global_attrs]
+        return []
+
+    def _group_loaded(self, node):
+        return node.index is not None and node.index.group == node.name
+
+    def _child_count_hint(self, node):
+        """자식을 만들지 않고 자식이 있는지만 판단합니다 (펼침 화살표 표시용)."""
+        if node.children is not None:
+            return len(node.children)
+        meta = node.index
+        if node.kind in (KIND_FILE, KIND_GROUP):
+            return 4 # 그룹은 내용을 읽기 전이므로 항상 펼칠 수 있게 표시
+        if node.kind == KIND_GROUPS:
+            return len(meta.groups)
+        if node.kind == KIND_DIMENSIONS:
+            return len(meta.dims)
+        if node.kind == KIND_COORDINATES:
+            return len(meta.coords)
+        if node.kind == KIND_DATA_VARIABLES:
+            return len(meta.data_vars)
+        if node.kind in (KIND_COORDINATE, KIND_DATA_VARIABLE, KIND_ATTRIBUTES):
+            var = meta.get_variable(node.name)
+            if not var or not var.attrs:
+                return 0
+            return 1 if node.kind != KIND_ATTRIBUTES else len(var.attrs)
+        if node.kind == KIND_GLOBAL_ATTRIBUTES:
+            return len(meta.global_attrs)
+        return 0
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return node.children is None
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        if node.children is not None:
+            return
+        if node.kind == KIND_GROUP and not self._group_loaded(node):
+            # 그룹 내용은 아직 모릅니다. 요청만 보내고 set_group_index()에서 자식을 만듭니다.
+            key = (node.index.filepath, node.name)
+            self._group_nodes[key] = node
+            if key not in self._requested_groups:
+                self._requested_groups.add(key)
+                self.group_index_requested.emit(*key)
+            return
+        specs = self._child_specs(node)
+        node.children = []
+        if not specs:
+            return
+        self.beginInsertRows(parent, 0, len(specs) - 1)
+        node.children = [
+            _TreeNode(label, kind, name=name, parent=node, row=row, index=node.index, tooltip=tooltip)
+            for row, (label, kind, name, tooltip) in enumerate(specs)
+        ]
+        self.endInsertRows()
+
+    # --- QAbstractItemModel 인터페이스 ---
+
+    def hasChildren(self, parent=QModelIndex()):
+        return self._child_count_hint(self.node(parent)) > 0
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self.node(parent)
+        return len(node.children) if node.children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        node = self.node(parent)
+        if node.children is None or row >= len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.label
+        if role == Qt.ItemDataRole.UserRole:
+            return node.kind
+        if role == NameRole:
+            return node.name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node.tooltip
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole and section == 0:
+            return "파일/변수"
+        return None
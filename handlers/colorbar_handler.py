@@ -1,28 +1,157 @@
 # oceanocal_v2/handlers/colorbar_handler.py
 
 import os
+import logging
+import threading
+
+import numpy as np
+import matplotlib
+from matplotlib.colors import ListedColormap
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COLORBAR_DIR = os.path.join(BASE_DIR, "resources", "colorbars")
+LUT_SIZE = 256 # RGBA 렌더링 등에 쓰는 색 조회표 크기
+BUILTIN_SAMPLES = 32 # .pal이 아닌 matplotlib 기본 컬러맵을 RGB 배열로 만들 때의 색 개수
+FALLBACK_COLORS = np.array([[0, 0, 255], [0, 255, 0], [255, 0, 0]], dtype=np.uint8)
+
+
+def _parse_pal(path):
+    """Panoply .pal 파일('R G B' 행)을 (n, 3) uint8 배열로 읽습니다."""
+    rows = []
+    with open(path, "r") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                continue
+            parts = line.split()
+            if len(parts) == 3:
+                rows.append([int(x) for x in parts])
+    return np.clip(np.array(rows, dtype=np.int64).reshape(-1, 3), 0, 255).astype(np.uint8)
+
+
+class ColormapRegistry:
+    """
+    resources/colorbars의 .pal 컬러맵을 한 번만 스캔하고 파싱해 NumPy RGB 배열로 보관합니다.
+    같은 배열에서 Plotly colorscale, matplotlib ListedColormap, 256색 uint8 LUT를 만들어 캐시합니다.
+    .pal 파일이 없는 이름은 matplotlib 기본 컬러맵(jet, viridis 등)에서, 그것도 없으면 기본 3색에서 만듭니다.
+    """
+    def __init__(self, directory=COLORBAR_DIR):
+        self.directory = directory
+        self._paths = None # {name: .pal 경로}
+        self._rgb = {}
+        self._plotly = {}
+        self._mpl = {}
+        self._lut = {}
+        self._lock = threading.Lock() # 플롯 데이터는 작업 스레드에서도 만들어집니다.
+
+    def _scan(self):
+        if self._paths is None:
+            paths = {}
+            if os.path.isdir(self.directory):
+                for filename in os.listdir(self.directory):
+                    if filename.endswith(".pal"):
+                        paths[filename[:-len(".pal")]] = os.path.join(self.directory, filename)
+            else:
+                logging.warning(f"컬러바 디렉토리를 찾을 수 없습니다: {self.directory}")
+            self._paths = paths
+        return self._paths
+
+    def names(self):
+        """.pal 컬러맵 이름 목록 (정렬됨)."""
+        return sorted(self._scan())
+
+    def __contains__(self, name):
+        return self._normalize(name) in self._scan()
+
+    @staticmethod
+    def _normalize(name):
+        return name[:-len(".pal")] if name and name.endswith(".pal") else name
+
+    def rgb(self, name):
+        """컬러맵의 (n, 3) uint8 RGB 배열을 반환합니다. 반환된 배열은 수정하지 마십시오."""
+        name = self._normalize(name)
+        with self._lock:
+            rgb = self._rgb.get(name)
+            if rgb is not None:
+                return rgb
+            path = self._scan().get(name)
+            rgb = None
+            if path is not None:
+                try:
+                    rgb = _parse_pal(path)
+                except (OSError, ValueError) as e:
+                    logging.warning(f"컬러맵 '{name}' 로드 실패: {e}. 기본 컬러맵 사용.")
+            elif name in matplotlib.colormaps:
+                samples = matplotlib.colormaps[name](np.linspace(0.0, 1.0, BUILTIN_SAMPLES))
+                rgb = np.round(samples[:, :3] * 255).astype(np.uint8)
+            if rgb is None or len(rgb) < 2:
+                rgb = FALLBACK_COLORS
+            rgb.setflags(write=False)
+            self._rgb[name] = rgb
+            return rgb
+
+    def plotly_colorscale(self, name):
+        """Plotly colorscale: [(fraction, '#rrggbb'), ...]"""
+        name = self._normalize(name)
+        colorscale = self._plotly.get(name)
+        if colorscale is None:
+            rgb = self.rgb(name)
+            colorscale = [(i / (len(rgb) - 1), '#%02x%02x%02x' % tuple(int(c) for c in color))
+                          for i, color in enumerate(rgb)]
+            self._plotly[name] = colorscale
+        return list(colorscale)
+
+    def mpl_colormap(self, name):
+        """matplotlib 컬러맵. .pal 컬러맵은 256색 ListedColormap으로, 기본 컬러맵은 matplotlib 객체 그대로 반환합니다."""
+        name = self._normalize(name)
+        cmap = self._mpl.get(name)
+        if cmap is None:
+            if name not in self._scan() and name in matplotlib.colormaps:
+                cmap = matplotlib.colormaps[name]
+            else:
+                # Plotly colorscale처럼 연속적으로 보이도록 보간한 LUT로 만듭니다.
+                cmap = ListedColormap(self.lut(name) / 255.0, name=name)
+            self._mpl[name] = cmap
+        return cmap
+
+    def lut(self, name, size=LUT_SIZE):
+        """RGB 배열을 선형 보간한 (size, 3) uint8 색 조회표."""
+        name = self._normalize(name)
+        key = (name, size)
+        lut = self._lut.get(key)
+        if lut is None:
+            rgb = self.rgb(name).astype(np.float64)
+            source = np.linspace(0.0, 1.0, len(rgb))
+            target = np.linspace(0.0, 1.0, size)
+            lut = np.column_stack([np.interp(target, source, rgb[:, channel]) for channel in range(3)])
+            lut = np.round(lut).astype(np.uint8)
+            lut.setflags(write=False)
+            self._lut[key] = lut
+        return lut
+
+
+_registry = None
+
+
+def get_colormap_registry():
+    global _registry
+    if _registry is None:
+        _registry = ColormapRegistry()
+    return _registry
+
+
+def list_colormaps():
+    """resources/colorbars의 컬러맵 이름 목록 (설정/레이블 다이얼로그용)."""
+    return get_colormap_registry().names()
+
 
 def get_colormap(name):
-    # Panoply .pal 파일을 Plotly colorscale로 변환 (예시)
-    # resources/colorbars 디렉토리를 기준으로 경로 설정
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    path = os.path.join(BASE_DIR, "resources", "colorbars", name)
-    if not path.endswith('.pal'):
-        path += ".pal"
-    colors = []
-    try:
-        with open(path, "r") as f:
-            for line in f:
-                if line.startswith("#") or not line.strip(): continue
-                parts = line.strip().split()
-                if len(parts) == 3:
-                    r, g, b = [int(x) for x in parts]
-                    hexcol = '#%02x%02x%02x' % (r, g, b)
-                    colors.append(hexcol)
-    except Exception as e:
-        #logging.warning(f"컬러맵 '{name}' 로드 실패: {e}. 기본 컬러맵 사용.", exc_info=True)
-        colors = ['#0000ff', '#00ff00', '#ff0000']  # fallback
-    # Plotly colorscale: list of (fraction, color)
-    if not colors:
-        colors = ['#0000ff', '#00ff00', '#ff0000'] # Ensure fallback if file is empty
-    return [(i/(len(colors)-1), color) for i, color in enumerate(colors)]
\ No newline at end of file
+    """Panoply .pal 컬러맵을 Plotly colorscale로 반환합니다."""
+    return get_colormap_registry().plotly_colorscale(name)
+
+
+def get_mpl_colormap(name):
+    return get_colormap_registry().mpl_colormap(name)
+
+
+def get_colormap_lut(name, size=LUT_SIZE):
+    return get_colormap_registry().lut(name, size)
@@ -0,0 +1,105 @@
+# oceanocal_v2/handlers/decimation_handler.py
+
+import logging
+
+import numpy as np
+
+DEFAULT_PLOT_PIXELS = 1000 # 캔버스 너비를 알 수 없을 때 사용하는 픽셀 수
+DECIMATION_FACTOR = 4 # 픽셀당 점(처음/최소/최대/마지막) 수. 이보다 점이 적으면 줄이지 않습니다.
+
+
+def minmax_indices(values, n_bins):
+    """
+    값 배열을 n_bins개의 연속 구간으로 나누고 각 구간의 처음/최소/최대/마지막 인덱스를 정렬해 반환합니다 (M4 방식).
+    한 구간이 화면의 한 픽셀 열에 해당하므로 선의 모양과 극값이 그대로 보존됩니다. NaN 구간은 결측 간격으로 남습니다.
+    """
+    n = len(values)
+    n_bins = max(int(n_bins), 1)
+    if n <= DECIMATION_FACTOR * n_bins:
+        return np.arange(n)
+    chunk = -(-n // n_bins)
+    n_bins = -(-n // chunk)
+    values = np.asarray(values, dtype=np.float64)
+    nan = np.isnan(values)
+    # 마지막 구간의 빈 자리와 NaN은 최소/최대로 뽑히지 않도록 +inf/-inf로 채웁니다.
+    low = np.full(n_bins * chunk, np.inf)
+    low[:n] = np.where(nan, np.inf, values)
+    high = np.full(n_bins * chunk, -np.inf)
+    high[:n] = np.where(nan, -np.inf, values)
+    starts = np.arange(n_bins) * chunk
+    argmin = low.reshape(n_bins, chunk).argmin(axis=1) + starts
+    argmax = high.reshape(n_bins, chunk).argmax(axis=1) + starts
+    last = np.minimum(starts + chunk - 1, n - 1)
+    indices = np.unique(np.concatenate([starts, argmin, argmax, last]))
+    return indices[indices < n]
+
+
+def thin_indices(values, max_points):
+    """
+    순서가 의미 없는 산점 데이터(관측 지점 등)에서 일정한 간격으로 최대 max_points개의 인덱스를 고릅니다.
+    색 범위가 유지되도록 최소/최대값 지점은 항상 포함합니다.
+    """
+    n = len(values)
+    max_points = max(int(max_points), 2)
+    if n <= max_points:
+        return np.arange(n)
+    indices = np.linspace(0, n - 1, max_points - 2).astype(np.intp)
+    values = np.asarray(values, dtype=np.float64)
+    if np.isfinite(values).any():
+        indices = np.append(indices, [np.nanargmin(values), np.nanargmax(values)])
+    return np.unique(indices)
+
+
+def coord_sort_key(coord):
+    """비교용 숫자 배열 (시간 좌표는 int64 나노초)."""
+    coord = np.asarray(coord)
+    if np.issubdtype(coord.dtype, np.datetime64):
+        return coord.astype("datetime64[ns]").astype(np.int64)
+    return coord
+
+
+class DecimatedSeries:
+    """
+    전체 해상도의 1D 시계열/프로파일을 보관하고, 보이는 구간만 잘라 화면 픽셀 수에 맞게 줄여 돌려줍니다.
+    coord는 독립 변수(시간, 인덱스, 깊이), values는 그 위의 값입니다. 확대/이동할 때마다 view()를 다시 부릅니다.
+    """
+    def __init__(self, coord, values):
+        self.coord = np.asarray(coord)
+        if np.ma.isMaskedArray(values):
+            values = np.ma.filled(values.astype(np.float64), np.nan)
+        self.values = np.asarray(values)
+        self._key = coord_sort_key(self.coord)
+        steps = np.diff(self._key) if len(self._key) > 1 else np.zeros(0)
+        self._ascending = bool(np.all(steps >= 0))
+        self._descending = not self._ascending and bool(np.all(steps <= 0))
+
+    def __len__(self):
+        return len(self.values)
+
+    def _window(self, lo, hi):
+        """[lo, hi] 구간의 인덱스 (단조 좌표는 이분 탐색, 양 옆 한 점 포함)."""
+        if lo is None or hi is None:
+            return slice(None)
+        lo, hi = coord_sort_key(np.array([lo, hi]))
+        if lo > hi:
+            lo, hi = hi, lo
+        key = self._key
+        if self._ascending:
+            start = max(np.searchsorted(key, lo, side="left") - 1, 0)
+            stop = np.searchsorted(key, hi, side="right") + 1
+            return slice(start, stop)
+        if self._descending:
+            start = max(len(key) - np.searchsorted(key[::-1], hi, side="right") - 1, 0)
+            stop = len(key) - np.searchsorted(key[::-1], lo, side="left") + 1
+            return slice(start, stop)
+        return np.flatnonzero((key >= lo) & (key <= hi))
+
+    def view(self, lo=None, hi=None, pixels=DEFAULT_PLOT_PIXELS):
+        """보이는 구간 [lo, hi](좌표 단위, None이면 전체)를 pixels 열에 맞게 줄인 (coord, values)."""
+        window = self._window(lo, hi)
+        coord, values = self.coord[window], self.values[window]
+        indices = minmax_indices(values, max(int(pixels or DEFAULT_PLOT_PIXELS), 1))
+        if len(indices) < len(values):
+            logging.debug(f"1D 데이터 축소: {len(values)} -> {len(indices)} 점")
+            return coord[indices], values[indices]
+        return coord, values
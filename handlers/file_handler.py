@@ -1,100 +1,122 @@
 # oceanocal_v2/handlers/file_handler.py
 
 import netCDF4
-import os
+import threading
 import logging
 
+try:
+    # xarray의 netCDF4 백엔드와 같은 잠금을 사용해야 작업 스레드끼리 HDF5 라이브러리를 동시에 호출하지 않습니다.
+    from xarray.backends.locks import HDF5_LOCK
+except ImportError:
+    HDF5_LOCK = threading.Lock()
+
+ROOT_GROUP = "/"
+
+
+def normalize_group_path(group):
+    """그룹 경로를 '/a/b' 형태로 맞춥니다. None이나 빈 문자열은 루트 그룹('/')입니다."""
+    if not group:
+        return ROOT_GROUP
+    return "/" + group.strip("/") if group.strip("/") else ROOT_GROUP
+
+
+def join_group_path(parent, name):
+    parent = normalize_group_path(parent)
+    return f"/{name}" if parent == ROOT_GROUP else f"{parent}/{name}"
+
+
+def split_variable_path(var_path):
+    """
+    '/그룹/하위그룹/변수' 경로를 (그룹 경로, 변수 이름)으로 나눕니다.
+    '/'가 없는 이름은 루트 그룹의 변수로 취급합니다.
+    """
+    parts = var_path.strip("/").split("/")
+    return normalize_group_path("/".join(parts[:-1])), parts[-1]
+
+
+def read_group_entry(filepath, group_path):
+    """
+    파일을 열어 group_path 그룹의 바로 아래 (하위 그룹 이름 tuple, 변수 이름 tuple)을 읽습니다.
+    핸들러 캐시를 건드리지 않으므로 작업 스레드에서 읽고 결과만 GUI 스레드에서 add_group()으로 넣을 수 있습니다.
+    """
+    group_path = normalize_group_path(group_path)
+    with HDF5_LOCK:
+        with netCDF4.Dataset(filepath) as root:
+            group = root
+            for part in group_path.strip("/").split("/") if group_path != ROOT_GROUP else []:
+                group = group.groups.get(part)
+                if group is None:
+                    raise KeyError(f"경로에 그룹을 찾을 수 없습니다: {group_path}")
+            return tuple(group.groups.keys()), tuple(group.variables.keys())
+
+
 class NetCDFFileHandler:
-    def __init__(self):
-        self.dataset = None
-        logging.info("NetCDFFileHandler 초기화.")
+    """
+    NetCDF4/HDF5 파일의 그룹 구조를 필요할 때만 읽는 핸들러.
+    그룹이 처음 요청될 때 그 그룹의 하위 그룹/변수 이름만 읽어 캐시하며,
+    속성이나 데이터는 읽지 않습니다 (데이터셋은 DatasetManager가 그룹별로 엽니다).
+    """
+    def __init__(self, filepath=None):
+        self.filepath = filepath
+        self._groups = {} # {group_path: (하위 그룹 이름 tuple, 변수 이름 tuple)}
+        self._path_index = {} # {var_path: (group_path, var_name)} get_variable_by_path 캐시
+        logging.debug("NetCDFFileHandler 초기화.")
 
     def load_file(self, filepath):
-        """
-        NetCDF 파일을 로드하고 그룹 및 변수 구조를 재귀적으로 파싱합니다.
-        Xarray로의 전환으로 인해 이 핸들러는 더 이상 사용되지 않을 수 있습니다.
-        DatasetManager가 대신 xarray를 사용하여 파일을 관리합니다.
-        """
-        logging.warning("NetCDFFileHandler.load_file은 DatasetManager로 대체되었을 수 있습니다.")
-        try:
-            self.dataset = netCDF4.Dataset(filepath)
-            return self._parse_group(self.dataset)
-        except Exception as e:
-            logging.error(f"NetCDF 파일 로드 오류: {e}", exc_info=True)
-            self.dataset = None
-            raise
-
-    def _parse_group(self, group):
-        """
-        NetCDF4 그룹의 내부 구조를 재귀적으로 파싱합니다.
-        """
-        tree = []
-        # 그룹
-        for name, subgroup in getattr(group, 'groups', {}).items():
-            tree.append({
-                'name': name,
-                'type': 'group',
-                'children': self._parse_group(subgroup)
-            })
-        # 변수
-        for name, var in getattr(group, 'variables', {}).items():
-            attrs = {attr: str(getattr(var, attr)) for attr in var.ncattrs()}
-            tree.append({
-                'name': name,
-                'type': 'variable',
-                'dimensions': list(var.dimensions),
-                'shape': var.shape,
-                'dtype': str(var.dtype),
-                'attributes': attrs,
-                'children': [{'name': f"[속성] {attr}: {value}"} for attr, value in attrs.items()]
-            })
-        return tree
-
-    def get_variable_path(self, item):
-        """
-        QTreeWidgetItem에서 변수 경로 추출 (루트 ~ 리프 경로)
-        """
-        path = []
-        while item:
-            item_data = item.data(0, Qt.ItemDataRole.UserRole)
-            if item_data and item_data.get('type') in ['variable', 'group']:
-                path.insert(0, item.text(0))
-            item = item.parent()
-        # Join path components, skipping the file root (if it's just the file name)
-        if len(path) > 1 and path[0].endswith(('.nc', '.netcdf')):
-            return '/' + '/'.join(path[1:])
-        return '/' + '/'.join(path) if path else ''
+        """파일을 대상으로 설정하고 루트 그룹 구조만 읽습니다."""
+        self.filepath = filepath
+        self._groups.clear()
+        self._path_index.clear()
+        return self.list_groups(ROOT_GROUP)
+
+    def _scan_group(self, group_path):
+        """group_path 그룹의 바로 아래 하위 그룹과 변수 이름을 읽습니다 (캐시 사용)."""
+        group_path = normalize_group_path(group_path)
+        cached = self._groups.get(group_path)
+        if cached is not None:
+            return cached
+        if not self.filepath:
+            raise ValueError("NetCDFFileHandler: 파일이 설정되지 않았습니다.")
+        entry = read_group_entry(self.filepath, group_path)
+        self._groups[group_path] = entry
+        return entry
+
+    def peek_group(self, group_path):
+        """이미 읽은 그룹 구조를 반환합니다. 아직 읽지 않았으면 None (파일을 열지 않습니다)."""
+        return self._groups.get(normalize_group_path(group_path))
+
+    def add_group(self, group_path, entry):
+        """read_group_entry()로 따로 읽은 그룹 구조를 캐시에 넣습니다."""
+        self._groups.setdefault(normalize_group_path(group_path), entry)
+
+    def list_groups(self, group_path=ROOT_GROUP):
+        """하위 그룹 이름을 반환합니다."""
+        return self._scan_group(group_path)[0]
+
+    def list_variables(self, group_path=ROOT_GROUP):
+        return self._scan_group(group_path)[1]
 
     def get_variable_by_path(self, var_path):
         """
-        변수 경로를 사용하여 NetCDF4 Dataset에서 변수 객체를 가져옵니다.
+        변수 경로를 (그룹 경로, 변수 이름)으로 해석합니다. 변수가 없으면 None.
+        한 번 해석한 경로는 캐시되어 다시 파일을 읽지 않습니다.
         """
-        if not self.dataset:
-            logging.error("데이터셋이 로드되지 않았습니다.")
-            return None
-
-        parts = var_path.strip('/').split('/')
-        current_group = self.dataset
+        resolved = self._path_index.get(var_path)
+        if resolved is not None:
+            return resolved
+        group_path, var_name = split_variable_path(var_path)
         try:
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1: # 마지막 부분은 변수 이름
-                    return current_group.variables.get(part)
-                else: # 그룹 이름
-                    current_group = current_group.groups.get(part)
-                    if not current_group:
-                        logging.warning(f"경로에 그룹을 찾을 수 없습니다: {var_path}")
-                        return None
-            return None
-        except Exception as e:
-            logging.error(f"변수 경로 '{var_path}'로 변수를 가져오는 중 오류 발생: {e}", exc_info=True)
+            if var_name not in self.list_variables(group_path):
+                logging.warning(f"경로에 변수를 찾을 수 없습니다: {var_path}")
+                return None
+        except (KeyError, OSError) as e:
+            logging.warning(f"변수 경로 '{var_path}'를 해석할 수 없습니다: {e}")
             return None
+        resolved = (group_path, var_name)
+        self._path_index[var_path] = resolved
+        return resolved
 
     def close_file(self):
-        if self.dataset:
-            try:
-                self.dataset.close()
-                logging.info("NetCDF 파일 닫힘.")
-            except Exception as e:
-                logging.error(f"NetCDF 파일을 닫는 중 오류 발생: {e}", exc_info=True)
-            finally:
-                self.dataset = None
\ No newline at end of file
+        self._groups.clear()
+        self._path_index.clear()
+        self.filepath = None
@@ -0,0 +1,32 @@
+# oceanocal_v2/handlers/option_change_handler.py
+
+# 옵션 변경의 종류. 값이 클수록 비싼 갱신이며, 여러 종류가 함께 바뀌면 가장 큰 값을 따릅니다.
+OPTION_CHANGE_NONE = 0 # 바뀐 것이 없음
+OPTION_CHANGE_STYLE = 1 # 제목/레이블/글꼴/격자: 레이블만 다시 적용
+OPTION_CHANGE_COLOR = 2 # 컬러맵/값 범위/로그 스케일: 이미 읽은 데이터의 색만 다시 적용
+OPTION_CHANGE_DATA = 3 # 그 밖의 모든 옵션 (슬라이스, 렌더링 방식, 오버레이 등): 데이터를 다시 읽음
+
+STYLE_OPTIONS = frozenset({
+    'title', 'xlabel', 'ylabel', 'colorbar_label', 'grid',
+    'title_text', 'xaxis_label', 'yaxis_label', 'cbar_label', 'theme', # PlotLabelDialog/Plotly 이름
+    'plot_font_family', 'plot_font_size', 'title_font_family', 'title_font_size',
+})
+COLOR_OPTIONS = frozenset({'cmap', 'vmin', 'vmax', 'log_scale'})
+
+
+def changed_options(old_options, new_options):
+    """new_options 중 old_options와 값이 다른 키 (old에 없던 키는 None과 비교)."""
+    return {key for key, value in new_options.items() if old_options.get(key) != value}
+
+
+def classify_option_change(old_options, new_options):
+    """옵션 변경에 필요한 가장 싼 갱신 종류(OPTION_CHANGE_*)를 반환합니다. 모르는 옵션은 데이터 변경으로 봅니다."""
+    change = OPTION_CHANGE_NONE
+    for key in changed_options(old_options, new_options):
+        if key in STYLE_OPTIONS:
+            change = max(change, OPTION_CHANGE_STYLE)
+        elif key in COLOR_OPTIONS:
+            change = max(change, OPTION_CHANGE_COLOR)
+        else:
+            return OPTION_CHANGE_DATA
+    return change
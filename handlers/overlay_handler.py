@@ -1,99 +1,528 @@
 # oceanocal_v2/handlers/overlay_handler.py
 
 import plotly.graph_objs as go
+import numpy as np
+from matplotlib.collections import LineCollection
 import os
+import re
 import json
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 
-def get_overlay_traces(filename):
-    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    path = os.path.join(BASE_DIR, "resources", "overlays", filename)
-    traces = []
+from ..bookmarks import APP_DATA_DIR
 
-    if not os.path.exists(path):
-        logging.warning(f"오버레이 파일이 존재하지 않습니다: {path}")
-        return []
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OVERLAY_DIR = os.path.join(BASE_DIR, "resources", "overlays")
+OVERLAY_CACHE_DIR = os.path.join(APP_DATA_DIR, "overlay_cache") # 컴파일된 .npz 오버레이 저장 위치
+OVERLAY_FORMAT_VERSION = 2 # 컴파일 형식이 바뀌면 올려서 이전 .npz를 무효화합니다.
+OVERLAY_LRU_SIZE = 8 # 메모리에 유지할 컴파일된 오버레이 개수
+# 단순화 단계별 허용 오차(도). 0은 원본 해상도이며, 그리는 시점에 화면 한 픽셀 크기에 맞는 단계를 고릅니다.
+SIMPLIFY_LEVELS = (0.0, 0.002, 0.01, 0.05, 0.25)
+DEFAULT_OVERLAY_PIXELS = 1000 # 플롯 크기를 모를 때 가정하는 가로 픽셀 수
+GRID_CELL_DEGREES = 10.0 # 선분 공간 인덱스의 격자 칸 크기(도)
 
-    try:
-        # (1) GeoJSON 지원
-        if filename.lower().endswith((".geojson", ".json")):
-            with open(path, "r", encoding="utf-8") as f:
-                geo = json.load(f)
-                for feat in geo["features"]:
-                    coords = feat["geometry"]["coordinates"]
-                    prop = feat.get("properties", {})
-                    feat_type = feat["geometry"]["type"]
-
-                    if feat_type == "Polygon":
-                        for poly in coords:
-                            # For simple polygons, coords is [exterior_ring, interior_ring1, ...]
-                            # We only plot the exterior ring for now.
-                            lons, lats = zip(*poly[0])
-                            traces.append(go.Scattergeo(
-                                lon=list(lons), lat=list(lats), mode="lines", line=dict(width=1, color="black"),
-                                name=prop.get("name", filename), hoverinfo="text",
-                                text=f"{prop.get('name', '')}"
-                            ))
-                    elif feat_type == "MultiPolygon":
-                        for multi_poly in coords:
-                            for poly in multi_poly:
-                                lons, lats = zip(*poly[0])
-                                traces.append(go.Scattergeo(
-                                    lon=list(lons), lat=list(lats), mode="lines", line=dict(width=1, color="black"),
-                                    name=prop.get("name", filename), hoverinfo="text",
-                                    text=f"{prop.get('name', '')}"
-                                ))
-                    elif feat_type == "LineString":
-                        lons, lats = zip(*coords)
-                        traces.append(go.Scattergeo(
-                            lon=list(lons), lat=list(lats), mode="lines", line=dict(width=1, color="blue"),
-                            name=prop.get("name", filename), hoverinfo="text",
-                            text=f"{prop.get('name', '')}"
-                        ))
-                    elif feat_type == "MultiLineString":
-                        for line_str in coords:
-                            lons, lats = zip(*line_str)
-                            traces.append(go.Scattergeo(
-                                lon=list(lons), lat=list(lats), mode="lines", line=dict(width=1, color="blue"),
-                                name=prop.get("name", filename), hoverinfo="text",
-                                text=f"{prop.get('name', '')}"
-                            ))
-            logging.info(f"GeoJSON 오버레이 로드됨: {filename}")
-            return traces
-
-        # (2) CSV/ASCII(위도,경도) 지원
-        elif filename.lower().endswith((".txt", ".csv")):
-            with open(path, "r", encoding="utf-8") as f:
-                for i, line in enumerate(f):
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    parts = line.split(",")
-                    if len(parts) % 2 != 0:
-                        logging.warning(f"오버레이 파일 '{filename}'의 {i+1}번째 줄이 유효하지 않습니다 (홀수 개수).")
-                        continue
-                    lats, lons = [], []
-                    for j in range(0, len(parts), 2):
-                        try:
-                            lats.append(float(parts[j]))
-                            lons.append(float(parts[j+1]))
-                        except ValueError:
-                            logging.warning(f"오버레이 파일 '{filename}'의 {i+1}번째 줄에서 숫자 변환 오류 발생.")
-                            continue
-                    if lats and lons:
-                        traces.append(go.Scattergeo(
-                            lat=lats, lon=lons, mode="lines",
-                            line=dict(width=1, color="green"), # Default color for CSV lines
-                            name=f"{filename}_line_{i+1}", hoverinfo="text",
-                            text=f"Overlay Line {i+1}"
-                        ))
-            logging.info(f"CSV/ASCII 오버레이 로드됨: {filename}")
-            return traces
+POLYGON_COLOR = "black"
+LINE_COLOR = "blue"
+CSV_LINE_COLOR = "green"
+
+# CIA World DataBank 형식의 선분 헤더 ('segment 1  rank 1  points 991')
+# 'segment' 문자열로 시작하게 두어야 정규식 엔진이 줄마다가 아니라 헤더 위치로 바로 건너뜁니다.
+_SEGMENT_HEADER = re.compile(r"segment[ \t]+\S+[ \t]+rank[ \t]+\S+[ \t]+points[ \t]+(\d+)")
+
+
+class CompiledOverlay:
+    """
+    오버레이의 모든 선분을 하나의 (N, 2) [lon, lat] 배열에 이어 붙이고,
+    offsets[i]:offsets[i+1] 범위로 i번째 선분을 나타내는 압축 형식.
+    """
+    __slots__ = ("coords", "offsets", "names", "colors", "importance", "_merged", "_levels", "_index")
+
+    def __init__(self, coords, offsets, names, colors, importance=None):
+        self.coords = coords # float64 (N, 2) [lon, lat]
+        self.offsets = offsets # int64 (선분 수 + 1,)
+        self.names = names # 선분별 이름 (str 배열)
+        self.colors = colors # 선분별 선 색 (str 배열)
+        # 점별 Douglas–Peucker 중요도(도): 허용 오차 t로 단순화하면 importance >= t인 점만 남습니다.
+        self.importance = _dp_importance(coords, offsets) if importance is None else importance
+        self._merged = None
+        self._levels = {}
+        self._index = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def n_points(self):
+        return len(self.coords)
+
+    def segments(self):
+        """(lon, lat, name, color)를 선분마다 반환합니다. lon/lat은 복사하지 않은 뷰입니다."""
+        for i in range(len(self)):
+            start, end = self.offsets[i], self.offsets[i + 1]
+            yield self.coords[start:end, 0], self.coords[start:end, 1], str(self.names[i]), str(self.colors[i])
+
+    def merged(self):
+        """
+        같은 색의 선분들을 NaN 행으로 구분해 하나의 (lon, lat) 배열로 잇습니다.
+        {color: (lon, lat)}를 반환하며, 결과는 오버레이 객체에 캐시됩니다.
+        """
+        if self._merged is not None:
+            return self._merged
+        merged = {}
+        for color in np.unique(self.colors):
+            selected = np.flatnonzero(self.colors == color)
+            starts = self.offsets[selected]
+            lengths = self.offsets[selected + 1] - starts
+            total = int(lengths.sum())
+            segment_id = np.repeat(np.arange(len(selected)), lengths)
+            within = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            # 앞선 선분마다 NaN 구분 행이 하나씩 들어가므로 출력 위치는 segment_id만큼 밀립니다.
+            out = np.full((total + len(selected) - 1, 2), np.nan)
+            out[np.arange(total) + segment_id] = self.coords[np.repeat(starts, lengths) + within]
+            merged[str(color)] = (out[:, 0], out[:, 1])
+        self._merged = merged
+        return merged
+
+    def simplified(self, tolerance):
+        """
+        tolerance(도) 이하에서 가장 거친 미리 정한 단순화 단계를 반환합니다.
+        단계별 결과는 오버레이 객체에 캐시됩니다.
+        """
+        level = max(t for t in SIMPLIFY_LEVELS if t <= max(tolerance, 0.0))
+        if level == 0.0:
+            return self
+        simplified = self._levels.get(level)
+        if simplified is None:
+            simplified = self._subset(self.importance >= level, split_gaps=False)
+            self._levels[level] = simplified
+        return simplified
+
+    def clipped(self, lon_range, lat_range):
+        """
+        경위도 범위 안의 점(과 선이 범위 밖으로 이어지도록 바로 앞뒤 점)만 남깁니다.
+        범위 밖에서 끊긴 선분은 여러 선분으로 나뉩니다.
+        """
+        if len(self.coords) == 0:
+            return self
+        lon, lat = self.coords[:, 0], self.coords[:, 1]
+        inside = ((lon >= min(lon_range)) & (lon <= max(lon_range)) &
+                  (lat >= min(lat_range)) & (lat <= max(lat_range)))
+        if inside.all():
+            return self
+        keep = inside.copy()
+        keep[:-1] |= inside[1:]
+        keep[1:] |= inside[:-1]
+        return self._subset(keep)
+
+    def _subset(self, keep, split_gaps=True):
+        """
+        점 마스크로 새 오버레이를 만듭니다. 점이 1개만 남은 선분은 버립니다.
+        split_gaps=True(잘라내기)이면 중간 점이 빠진 곳에서 선분을 나누고,
+        False(단순화)이면 원래 선분 단위를 유지합니다.
+        """
+        segment_id = np.repeat(np.arange(len(self)), np.diff(self.offsets))
+        kept = np.flatnonzero(keep)
+        if len(kept) == 0:
+            return CompiledOverlay(np.empty((0, 2)), np.zeros(1, dtype=np.int64), self.names[:0], self.colors[:0],
+                                   np.empty(0))
+        kept_segment = segment_id[kept]
+        # 원래 선분이 바뀌는 곳(split_gaps이면 중간 점이 빠진 곳도)에서 새 선분이 시작됩니다.
+        breaks = np.diff(kept_segment) != 0
+        if split_gaps:
+            breaks |= np.diff(kept) != 1
+        starts = np.flatnonzero(np.concatenate(([True], breaks)))
+        run_lengths = np.diff(np.append(starts, len(kept)))
+        source_segment = kept_segment[starts]
+        long_enough = run_lengths >= 2
+        if not long_enough.all():
+            kept = kept[np.repeat(long_enough, run_lengths)]
+            run_lengths = run_lengths[long_enough]
+            source_segment = source_segment[long_enough]
+        offsets = np.zeros(len(run_lengths) + 1, dtype=np.int64)
+        np.cumsum(run_lengths, out=offsets[1:])
+        return CompiledOverlay(self.coords[kept], offsets, self.names[source_segment],
+                               self.colors[source_segment], self.importance[kept])
+
+    @property
+    def spatial_index(self):
+        """선분 경계 상자의 격자 인덱스 (처음 사용할 때 만듭니다)."""
+        if self._index is None:
+            self._index = SegmentGridIndex(self.segment_bounds())
+        return self._index
 
+    def segment_bounds(self):
+        """선분별 경계 상자 (S, 4) [lon_min, lat_min, lon_max, lat_max]."""
+        if len(self) == 0:
+            return np.empty((0, 4))
+        starts = self.offsets[:-1]
+        return np.column_stack((
+            np.minimum.reduceat(self.coords[:, 0], starts), np.minimum.reduceat(self.coords[:, 1], starts),
+            np.maximum.reduceat(self.coords[:, 0], starts), np.maximum.reduceat(self.coords[:, 1], starts),
+        ))
+
+    def select(self, lon_range, lat_range):
+        """공간 인덱스로 경위도 범위와 겹치는 선분만 골라 새 오버레이로 반환합니다."""
+        segment_ids = self.spatial_index.query(lon_range, lat_range)
+        if len(segment_ids) == len(self):
+            return self
+        return self._take_segments(segment_ids)
+
+    def _take_segments(self, segment_ids):
+        starts = self.offsets[segment_ids]
+        lengths = self.offsets[segment_ids + 1] - starts
+        offsets = np.zeros(len(segment_ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        points = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return CompiledOverlay(self.coords[points], offsets, self.names[segment_ids], self.colors[segment_ids],
+                               self.importance[points])
+
+    def view(self, lon_range=None, lat_range=None, pixels=DEFAULT_OVERLAY_PIXELS):
+        """
+        플롯 범위와 픽셀 수에 맞는 오버레이를 반환합니다.
+        범위가 주어지면 공간 인덱스로 겹치는 선분만 꺼낸 뒤 단순화하고 범위 밖을 잘라냅니다.
+        범위가 없으면 전체(지구)를 기준으로 단순화만 합니다.
+        """
+        lon_span = abs(lon_range[1] - lon_range[0]) if lon_range is not None else 360.0
+        lat_span = abs(lat_range[1] - lat_range[0]) if lat_range is not None else 180.0
+        tolerance = max(lon_span, lat_span) / max(int(pixels or DEFAULT_OVERLAY_PIXELS), 1)
+        if lon_range is None or lat_range is None:
+            return self.simplified(tolerance)
+        return self.select(lon_range, lat_range).simplified(tolerance).clipped(lon_range, lat_range)
+
+    def line_segments(self):
+        """선분별 (n, 2) 배열 목록 (matplotlib LineCollection 입력, 복사 없음)."""
+        return np.split(self.coords, self.offsets[1:-1])
+
+    @classmethod
+    def from_segments(cls, segments):
+        """[(coords (n, 2) [lon, lat], name, color), ...] 목록을 압축 형식으로 묶습니다."""
+        segments = [seg for seg in segments if len(seg[0])]
+        lengths = np.array([len(seg[0]) for seg in segments], dtype=np.int64)
+        offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if segments:
+            coords = np.concatenate([np.asarray(seg[0], dtype=np.float64).reshape(-1, 2) for seg in segments])
         else:
-            logging.warning(f"지원되지 않는 오버레이 파일 형식: {filename}")
-            return []
+            coords = np.empty((0, 2), dtype=np.float64)
+        names = np.array([seg[1] for seg in segments], dtype=str)
+        colors = np.array([seg[2] for seg in segments], dtype=str)
+        return cls(coords, offsets, names, colors)
+
+
+class SegmentGridIndex:
+    """
+    선분 경계 상자를 GRID_CELL_DEGREES 크기의 경위도 격자 칸에 등록한 공간 인덱스.
+    칸별 선분 목록은 (cell_starts, segment_ids) CSR 배열로 보관합니다.
+    """
+    def __init__(self, bounds, cell_size=GRID_CELL_DEGREES):
+        self.bounds = bounds
+        self.cell_size = cell_size
+        self.n_lon = int(np.ceil(360.0 / cell_size))
+        self.n_lat = int(np.ceil(180.0 / cell_size))
+        ix0, iy0 = self._cell(bounds[:, 0], bounds[:, 1])
+        ix1, iy1 = self._cell(bounds[:, 2], bounds[:, 3])
+        width, height = ix1 - ix0 + 1, iy1 - iy0 + 1
+        counts = width * height
+        # 선분마다 걸치는 모든 칸을 한 번에 펼칩니다.
+        segment = np.repeat(np.arange(len(bounds)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = ((np.repeat(iy0, counts) + local // np.repeat(width, counts)) * self.n_lon +
+                 np.repeat(ix0, counts) + local % np.repeat(width, counts))
+        order = np.argsort(cells, kind="stable")
+        self.segment_ids = segment[order]
+        self.cell_starts = np.searchsorted(cells[order], np.arange(self.n_lon * self.n_lat + 1))
+
+    def _cell(self, lon, lat):
+        # 격자 밖 좌표(예: 0~360 경도)는 가장자리 칸에 넣어 누락되지 않게 합니다.
+        ix = np.clip(np.floor((np.asarray(lon) + 180.0) / self.cell_size).astype(np.int64), 0, self.n_lon - 1)
+        iy = np.clip(np.floor((np.asarray(lat) + 90.0) / self.cell_size).astype(np.int64), 0, self.n_lat - 1)
+        return ix, iy
+
+    def query(self, lon_range, lat_range):
+        """경계 상자가 범위와 겹치는 선분 번호를 오름차순으로 반환합니다."""
+        lon_min, lon_max = min(lon_range), max(lon_range)
+        lat_min, lat_max = min(lat_range), max(lat_range)
+        ix0, iy0 = self._cell(lon_min, lat_min)
+        ix1, iy1 = self._cell(lon_max, lat_max)
+        rows = np.arange(iy0, iy1 + 1)[:, None] * self.n_lon
+        cells = (rows + np.arange(ix0, ix1 + 1)[None, :]).ravel()
+        candidates = np.unique(np.concatenate(
+            [self.segment_ids[self.cell_starts[c]:self.cell_starts[c + 1]] for c in cells] or [np.empty(0, np.int64)]))
+        b = self.bounds[candidates]
+        hit = (b[:, 0] <= lon_max) & (b[:, 2] >= lon_min) & (b[:, 1] <= lat_max) & (b[:, 3] >= lat_min)
+        return candidates[hit]
+
+
+def _dp_importance(coords, offsets, min_tolerance=None):
+    """
+    Douglas–Peucker 분할 과정에서 각 점이 선택될 때의 거리(부모 값으로 제한)를 구합니다.
+    선분의 양 끝점은 항상 남도록 inf이며, 가장 작은 단순화 단계보다 덜 중요한 점은 0(원본 해상도에서만 표시)입니다.
+    """
+    if min_tolerance is None:
+        min_tolerance = min(t for t in SIMPLIFY_LEVELS if t > 0)
+    importance = np.zeros(len(coords))
+    if len(coords) == 0:
+        return importance
+    importance[offsets[:-1]] = np.inf
+    importance[offsets[1:] - 1] = np.inf
+    stack = [(start, end - 1, np.inf) for start, end in zip(offsets[:-1], offsets[1:]) if end - start > 2]
+    while stack:
+        first, last, parent = stack.pop()
+        rel = coords[first + 1:last] - coords[first]
+        dx, dy = coords[last] - coords[first]
+        norm = np.hypot(dx, dy)
+        if norm == 0: # 닫힌 링은 시작점으로부터의 거리 사용
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(dx * rel[:, 1] - dy * rel[:, 0]) / norm
+        i = int(np.argmax(dist))
+        value = min(dist[i], parent)
+        if value < min_tolerance:
+            continue
+        index = first + 1 + i
+        importance[index] = value
+        if index - first > 1:
+            stack.append((first, index, value))
+        if last - index > 1:
+            stack.append((index, last, value))
+    return importance
+
+
+def resolve_overlay_path(filename):
+    """절대 경로는 그대로, 파일 이름은 resources/overlays 안의 경로로 바꿉니다."""
+    return filename if os.path.isabs(filename) else os.path.join(OVERLAY_DIR, filename)
+
 
+def _parse_geojson(path, filename):
+    with open(path, "r", encoding="utf-8") as f:
+        geo = json.load(f)
+    segments = []
+    for feat in geo["features"]:
+        coords = feat["geometry"]["coordinates"]
+        feat_type = feat["geometry"]["type"]
+        name = feat.get("properties", {}).get("name", filename)
+        if feat_type == "Polygon":
+            # 외곽 링만 그립니다.
+            segments.append((coords[0], name, POLYGON_COLOR))
+        elif feat_type == "MultiPolygon":
+            segments.extend((poly[0], name, POLYGON_COLOR) for poly in coords)
+        elif feat_type == "LineString":
+            segments.append((coords, name, LINE_COLOR))
+        elif feat_type == "MultiLineString":
+            segments.extend((line_str, name, LINE_COLOR) for line_str in coords)
+    # 좌표에 고도 등 세 번째 값이 있으면 버립니다.
+    return [(np.asarray(c, dtype=np.float64)[:, :2], name, color) for c, name, color in segments if len(c)]
+
+
+def _parse_text(path, filename):
+    """
+    두 가지 텍스트 형식을 읽습니다.
+    - 'segment N rank N points N' 헤더 뒤에 'lon lat' 행이 이어지는 경계선 형식
+    - 한 줄이 'lat,lon,lat,lon,...'인 CSV 선 형식
+    """
+    segments = []
+    current = None
+    with open(path, "r", encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("segment"):
+                current = []
+                segments.append((current, f"{filename} {line}", POLYGON_COLOR))
+                continue
+            if "," in line:
+                parts = line.split(",")
+                if len(parts) % 2 != 0:
+                    logging.warning(f"오버레이 파일 '{filename}'의 {i+1}번째 줄이 유효하지 않습니다 (홀수 개수).")
+                    continue
+                try:
+                    values = [float(p) for p in parts]
+                except ValueError:
+                    logging.warning(f"오버레이 파일 '{filename}'의 {i+1}번째 줄에서 숫자 변환 오류 발생.")
+                    continue
+                segments.append((list(zip(values[1::2], values[0::2])), f"{filename}_line_{i+1}", CSV_LINE_COLOR))
+                current = None
+                continue
+            if current is not None:
+                try:
+                    lon, lat = (float(p) for p in line.split()[:2])
+                except ValueError:
+                    logging.warning(f"오버레이 파일 '{filename}'의 {i+1}번째 줄에서 숫자 변환 오류 발생.")
+                    continue
+                current.append((lon, lat))
+    return [(np.asarray(c, dtype=np.float64).reshape(-1, 2), name, color) for c, name, color in segments]
+
+
+def _parse_segment_file(path, filename):
+    """
+    'segment N rank N points N' 형식 전체를 한 번에 읽습니다.
+    헤더 위치만 정규식으로 찾아 그 사이의 점 블록을 이어 붙인 뒤 np.fromstring 한 번으로 변환하고,
+    헤더의 points 값으로 선분을 나눕니다. 점 개수가 헤더와 맞지 않으면 None을 반환합니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    headers = list(_SEGMENT_HEADER.finditer(text))
+    if not headers:
+        return None
+    counts = np.array([int(m.group(1)) for m in headers], dtype=np.int64)
+    blocks = [text[:headers[0].start()]]
+    blocks.extend(text[m.end():n.start()] for m, n in zip(headers, headers[1:]))
+    blocks.append(text[headers[-1].end():])
+    values = np.fromstring(" ".join(blocks), dtype=np.float64, sep=" ")
+    if values.size != 2 * counts.sum():
+        logging.warning(f"오버레이 파일 '{filename}'의 점 개수가 헤더와 다릅니다. 줄 단위로 다시 읽습니다.")
+        return None
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    keep = np.flatnonzero(counts) # 점이 없는 선분은 버립니다.
+    if len(keep) != len(counts):
+        offsets = np.concatenate(([0], offsets[1:][keep]))
+    names = np.array([f"{filename} {headers[i].group(0).strip()}" for i in keep], dtype=str)
+    colors = np.full(len(keep), POLYGON_COLOR)
+    return CompiledOverlay(values.reshape(-1, 2), offsets, names, colors)
+
+
+def compile_overlay(path):
+    """원본 오버레이 파일(GeoJSON, CSV, ASCII)을 읽어 CompiledOverlay로 변환합니다."""
+    filename = os.path.basename(path)
+    if filename.lower().endswith((".geojson", ".json")):
+        segments = _parse_geojson(path, filename)
+    elif filename.lower().endswith((".txt", ".csv")):
+        overlay = _parse_segment_file(path, filename)
+        if overlay is not None:
+            return overlay
+        segments = _parse_text(path, filename)
+    else:
+        raise ValueError(f"지원되지 않는 오버레이 파일 형식: {filename}")
+    return CompiledOverlay.from_segments(segments)
+
+
+def _cache_file_path(path):
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(OVERLAY_CACHE_DIR, f"{os.path.splitext(os.path.basename(path))[0]}-{digest}.npz")
+
+
+def _load_compiled(path, signature):
+    """디스크 캐시의 .npz가 원본의 (mtime, 크기)와 같을 때만 읽습니다."""
+    cache_path = _cache_file_path(path)
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if (int(data["version"]) != OVERLAY_FORMAT_VERSION or
+                    (float(data["source_mtime"]), int(data["source_size"])) != signature):
+                return None
+            return CompiledOverlay(data["coords"], data["offsets"], data["names"], data["colors"],
+                                   data["importance"])
     except Exception as e:
-        logging.error(f"오버레이 파일 '{filename}'을 로드하는 중 오류 발생: {e}", exc_info=True)
-        return []
\ No newline at end of file
+        logging.warning(f"컴파일된 오버레이 캐시를 읽을 수 없습니다 ({cache_path}): {e}")
+        return None
+
+
+def _save_compiled(path, signature, overlay):
+    cache_path = _cache_file_path(path)
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(OVERLAY_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            np.savez(f, coords=overlay.coords, offsets=overlay.offsets, names=overlay.names,
+                     colors=overlay.colors, importance=overlay.importance, version=OVERLAY_FORMAT_VERSION,
+                     source_mtime=signature[0], source_size=signature[1])
+        os.replace(tmp_path, cache_path) # 다른 스레드가 반쯤 쓰인 파일을 읽지 않도록 교체
+    except OSError as e:
+        logging.warning(f"컴파일된 오버레이를 저장할 수 없습니다 ({cache_path}): {e}")
+
+
+_overlay_lru = OrderedDict() # {path: (signature, CompiledOverlay)}
+_overlay_lock = threading.Lock() # 플롯 데이터는 작업 스레드에서 만들어집니다.
+
+
+def load_overlay(filename):
+    """
+    컴파일된 오버레이를 반환합니다. 메모리 LRU → 디스크 .npz 캐시 → 원본 파싱 순으로 찾으며,
+    원본 파일의 수정 시각이나 크기가 바뀌면 다시 컴파일합니다. 파일이 없거나 읽을 수 없으면 None.
+    """
+    path = resolve_overlay_path(filename)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        logging.warning(f"오버레이 파일이 존재하지 않습니다: {path}")
+        return None
+    signature = (stat.st_mtime, stat.st_size)
+
+    with _overlay_lock:
+        cached = _overlay_lru.get(path)
+        if cached is not None and cached[0] == signature:
+            _overlay_lru.move_to_end(path)
+            return cached[1]
+
+    overlay = _load_compiled(path, signature)
+    if overlay is None:
+        try:
+            overlay = compile_overlay(path)
+        except Exception as e:
+            logging.error(f"오버레이 파일 '{filename}'을 로드하는 중 오류 발생: {e}", exc_info=True)
+            return None
+        _save_compiled(path, signature, overlay)
+        logging.info(f"오버레이 컴파일됨: {filename} (선분 {len(overlay)}개, 점 {overlay.n_points}개)")
+
+    with _overlay_lock:
+        _overlay_lru[path] = (signature, overlay)
+        _overlay_lru.move_to_end(path)
+        while len(_overlay_lru) > OVERLAY_LRU_SIZE:
+            _overlay_lru.popitem(last=False)
+    return overlay
+
+
+def get_overlay_traces(filename, merge=True, lon_range=None, lat_range=None, pixels=DEFAULT_OVERLAY_PIXELS):
+    """
+    오버레이를 Plotly Scattergeo 트레이스로 반환합니다.
+    merge=True이면 선 색마다 모든 선분을 NaN으로 구분한 트레이스 하나로 합칩니다 (보통 오버레이당 1개).
+    merge=False이면 이전처럼 선분마다 트레이스를 만듭니다.
+    lon_range/lat_range와 pixels를 주면 그 범위와 해상도에 맞게 단순화하고 잘라냅니다.
+    """
+    overlay = load_overlay(filename)
+    if overlay is None:
+        return []
+    overlay = overlay.view(lon_range, lat_range, pixels)
+    if len(overlay) == 0:
+        return []
+    if merge:
+        name = os.path.basename(filename)
+        return [
+            go.Scattergeo(
+                lon=lons, lat=lats, mode="lines", line=dict(width=1, color=color),
+                name=name, hoverinfo="name", connectgaps=False
+            )
+            for color, (lons, lats) in overlay.merged().items()
+        ]
+    traces = []
+    for lons, lats, name, color in overlay.segments():
+        traces.append(go.Scattergeo(
+            lon=lons, lat=lats, mode="lines", line=dict(width=1, color=color),
+            name=name, hoverinfo="text", text=name
+        ))
+    return traces
+
+
+def get_overlay_line_collection(overlay, swap_xy=False, linewidth=0.8, lon_range=None, lat_range=None,
+                                pixels=DEFAULT_OVERLAY_PIXELS, **kwargs):
+    """
+    matplotlib 축에 추가할 LineCollection을 만듭니다 (오버레이당 아티스트 1개).
+    overlay는 파일 이름이나 CompiledOverlay이며, swap_xy=True이면 x축이 위도인 플롯에 맞게 (lat, lon)으로 그립니다.
+    범위와 pixels는 get_overlay_traces()와 같습니다.
+    """
+    if not isinstance(overlay, CompiledOverlay):
+        overlay = load_overlay(overlay)
+    if overlay is None:
+        return None
+    overlay = overlay.view(lon_range, lat_range, pixels)
+    if len(overlay) == 0:
+        return None
+    segments = overlay.line_segments()
+    if swap_xy:
+        segments = [segment[:, ::-1] for segment in segments]
+    return LineCollection(segments, colors=list(overlay.colors), linewidths=linewidth, **kwargs)
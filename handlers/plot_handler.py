@@ -8,6 +8,14 @@ import os # os.path.basename 사용을 위해 추가
 
 logger = logging.getLogger(__name__)
 
+# PlotLabelDialog의 옵션 이름 -> 플롯 창(PlotWindow) 옵션 이름
+DIALOG_OPTION_NAMES = {
+    'title_text': 'title',
+    'xaxis_label': 'xlabel',
+    'yaxis_label': 'ylabel',
+    'cbar_label': 'colorbar_label',
+}
+
 class PlotHandler:
     def __init__(self, main_window, dataset_manager, plot_manager, settings_manager):
         self.main_window = main_window # MainWindow 인스턴스를 통해 상태바 접근
@@ -81,7 +89,15 @@ class PlotHandler:
         주어진 파일 경로와 변수 이름으로 플롯 창을 생성하거나 업데이트합니다.
         적절한 플롯 타입을 결정하고 PlotWindowManager에 요청합니다.
         """
-        dataset = self.dataset_manager.get_dataset(file_path)
+        # variable_name은 하위 그룹 변수일 때 '/그룹/변수' 경로입니다.
+        resolved = self.dataset_manager.resolve_variable_path(file_path, variable_name)
+        group, dataset_variable = resolved if resolved else (None, variable_name)
+        dataset = self.dataset_manager.get_dataset(file_path, group)
+        if dataset is None and group:
+            try:
+                dataset = self.dataset_manager.open_group(file_path, group) # 아직 펼치지 않은 그룹은 플롯할 때 엽니다.
+            except IOError:
+                dataset = None
         if not dataset:
             msg = f"파일 '{file_path}'에 대한 데이터셋을 찾을 수 없습니다."
             QMessageBox.warning(self.main_window, "데이터셋 오류", msg)
@@ -89,14 +105,14 @@ class PlotHandler:
             logger.warning(f"PlotHandler: 데이터셋을 찾을 수 없음: {file_path}")
             return
 
-        if variable_name not in dataset.data_vars and variable_name not in dataset.coords:
+        if dataset_variable not in dataset.data_vars and dataset_variable not in dataset.coords:
             msg = f"데이터셋에 변수 '{variable_name}'가 없습니다."
             QMessageBox.warning(self.main_window, "변수 오류", msg)
             self._report_status(msg, 3000)
             logger.warning(f"PlotHandler: 변수 '{variable_name}'가 데이터셋에 없음.")
             return
         
-        var_info = self.dataset_manager.get_variable_info_from_dataset(file_path, variable_name)
+        var_info = self.dataset_manager.get_variable_info_from_dataset(file_path, dataset_variable, group)
         
         plot_type = "unknown"
         if var_info:
@@ -104,16 +120,16 @@ class PlotHandler:
             
             # 1D plot: Time series or profile
             if len(dims) == 1:
-                if self._is_time(self.dataset_manager.get_variable_info_from_dataset(file_path, dims[0])):
+                if self._is_time(self.dataset_manager.get_variable_info_from_dataset(file_path, dims[0], group)):
                     plot_type = "time_series"
-                elif self._is_depth(self.dataset_manager.get_variable_info_from_dataset(file_path, dims[0])):
+                elif self._is_depth(self.dataset_manager.get_variable_info_from_dataset(file_path, dims[0], group)):
                     plot_type = "profile"
                 else:
                     plot_type = "1d_generic" # 기타 1D 플롯
             # 2D plot: Map or time-depth
             elif len(dims) == 2:
-                dim1_info = self.dataset_manager.get_variable_info_from_dataset(file_path, dims[0])
-                dim2_info = self.dataset_manager.get_variable_info_from_dataset(file_path, dims[1])
+                dim1_info = self.dataset_manager.get_variable_info_from_dataset(file_path, dims[0], group)
+                dim2_info = self.dataset_manager.get_variable_info_from_dataset(file_path, dims[1], group)
 
                 if self._is_time(dim1_info) and self._is_depth(dim2_info):
                     plot_type = "time_depth_heatmap"
@@ -145,7 +161,10 @@ class PlotHandler:
             'log_scale': False, # Log scale for colorbar
             'time_format': '%Y-%m-%d %H:%M',
             'grid': True,
-            'colorbar_label': var_info.get('attributes', {}).get('long_name', variable_name) # 컬러바 레이블
+            'colorbar_label': var_info.get('attributes', {}).get('long_name', variable_name), # 컬러바 레이블
+            'overlays': self.settings_manager.get_active_overlays() if self.settings_manager and plot_type == "map_2d" else [],
+            'render_mode': self.settings_manager.get_plot_option('render_mode', 'auto') if self.settings_manager else 'auto',
+            'raster_threshold': self.settings_manager.get_plot_option('raster_threshold') if self.settings_manager else None,
         }
         
         # PlotWindowManager에 플롯 요청
@@ -210,10 +229,11 @@ class PlotHandler:
             new_options['plot_type'] = current_options.get('plot_type')
             new_options['filepath'] = current_options.get('filepath')
             new_options['var_name'] = current_options.get('var_name')
-            new_options['xlabel'] = new_options.get('xlabel', current_options.get('xlabel')) # Fallback to current if not set
-            new_options['ylabel'] = new_options.get('ylabel', current_options.get('ylabel'))
-            new_options['title'] = new_options.get('title', current_options.get('title'))
-            new_options['colorbar_label'] = new_options.get('colorbar_label', current_options.get('colorbar_label'))
+            # 다이얼로그의 제목/레이블 이름을 플롯 창이 읽는 이름으로 옮깁니다. 비워 둔 칸은 현재 값을 유지합니다.
+            for dialog_name, option_name in DIALOG_OPTION_NAMES.items():
+                value = new_options.get(dialog_name) or current_options.get(option_name)
+                if value is not None:
+                    new_options[option_name] = value
             new_options['grid'] = new_options.get('grid', current_options.get('grid'))
             new_options['log_scale'] = new_options.get('log_scale', current_options.get('log_scale'))
             new_options['cmap'] = new_options.get('cmap', current_options.get('cmap'))
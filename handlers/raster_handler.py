@@ -0,0 +1,136 @@
+# oceanocal_v2/handlers/raster_handler.py
+
+import base64
+import logging
+import struct
+import zlib
+
+import numpy as np
+
+from .colorbar_handler import get_colormap_lut
+
+RENDER_MODES = ("auto", "mesh", "rgba") # auto: 격자가 크고 좌표 간격이 일정하면 RGBA 이미지로 그립니다.
+DEFAULT_RASTER_THRESHOLD = 1_000_000 # auto 모드에서 RGBA 이미지로 전환하는 격자 셀 수
+RASTER_MAX_SIZE = 4096 # RGBA 이미지 한 변의 최대 픽셀 수 (넘으면 간격을 두고 건너뛰어 줄입니다)
+UNIFORM_RTOL = 1e-3 # 좌표 간격이 이 비율 안에서 같으면 일정한 간격으로 봅니다.
+PNG_COMPRESS_LEVEL = 1 # 색 조회 결과는 반복이 많아 낮은 압축 단계로도 충분히 작아집니다.
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def is_uniform(coord, rtol=UNIFORM_RTOL):
+    """1D 좌표가 단조이고 간격이 일정한지 확인합니다 (imshow/레이아웃 이미지는 간격이 일정해야 정확합니다)."""
+    coord = np.asarray(coord)
+    if coord.ndim != 1 or len(coord) < 2:
+        return False
+    if np.issubdtype(coord.dtype, np.datetime64):
+        coord = coord.astype("datetime64[ns]").astype(np.int64)
+    elif not np.issubdtype(coord.dtype, np.number):
+        return False
+    steps = np.diff(coord.astype(np.float64))
+    if not np.all(np.isfinite(steps)) or steps[0] == 0:
+        return False
+    return bool(np.all(np.abs(steps - steps[0]) <= abs(steps[0]) * rtol))
+
+
+def should_rasterize(z_shape, x, y, render_mode="auto", threshold=DEFAULT_RASTER_THRESHOLD, cells=None):
+    """
+    2D 필드를 RGBA 이미지로 그릴지 결정합니다.
+    'rgba'는 항상, 'mesh'는 절대 사용하지 않으며, 'auto'는 셀 수가 threshold 이상이고 두 좌표 간격이 일정할 때만 사용합니다.
+    z가 화면 해상도로 줄인 개요이면 cells에 원본 필드의 셀 수를 넘겨 원본 크기로 판단합니다.
+    """
+    if len(z_shape) != 2 or render_mode == "mesh":
+        return False
+    if len(x) != z_shape[1] or len(y) != z_shape[0]:
+        return False # 좌표가 셀 경계(N+1개)인 경우는 pcolormesh/Heatmap에 맡깁니다.
+    if render_mode == "rgba":
+        return True
+    if cells is None:
+        cells = z_shape[0] * z_shape[1]
+    return cells >= (threshold or DEFAULT_RASTER_THRESHOLD) and is_uniform(x) and is_uniform(y)
+
+
+def limit_raster_size(x, y, z, max_size=RASTER_MAX_SIZE):
+    """한 변이 max_size 픽셀을 넘지 않도록 일정한 간격으로 행/열을 건너뛰어 (x, y, z)를 줄입니다."""
+    step_y = max(1, -(-z.shape[0] // max_size))
+    step_x = max(1, -(-z.shape[1] // max_size))
+    if step_x == 1 and step_y == 1:
+        return x, y, z
+    return x[::step_x], y[::step_y], z[::step_y, ::step_x]
+
+
+def colorize(z, cmap_name, vmin=None, vmax=None):
+    """
+    2D 배열을 컬러맵 LUT로 한 번에 조회해 (H, W, 4) uint8 RGBA 배열로 만듭니다.
+    NaN 등 유한하지 않은 값은 투명(알파 0)이 됩니다. 실제 사용한 (rgba, vmin, vmax)를 반환합니다.
+    """
+    if np.ma.isMaskedArray(z): # np.asarray()는 마스크를 버리므로 먼저 NaN으로 채웁니다.
+        z = np.ma.filled(z.astype(np.float64), np.nan)
+    z = np.asarray(z)
+    if not np.issubdtype(z.dtype, np.floating):
+        z = z.astype(np.float64)
+    finite = np.isfinite(z)
+    if vmin is None or vmax is None:
+        valid = z[finite]
+        if vmin is None:
+            vmin = float(valid.min()) if valid.size else 0.0
+        if vmax is None:
+            vmax = float(valid.max()) if valid.size else 1.0
+    lut = get_colormap_lut(cmap_name)
+    last = len(lut) - 1
+    scale = last / (vmax - vmin) if vmax > vmin else 0.0
+    index = np.where(finite, z, vmin) - vmin
+    index *= scale
+    np.clip(index, 0, last, out=index)
+    rgba = np.empty(z.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = lut[index.astype(np.intp)]
+    rgba[..., 3] = np.where(finite, 255, 0)
+    return rgba, vmin, vmax
+
+
+def _png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+
+def encode_png(rgba, compress_level=PNG_COMPRESS_LEVEL):
+    """(H, W, 4) uint8 배열을 PNG 바이트로 인코딩합니다 (첫 행이 이미지의 위쪽). 필터 없이 zlib만 사용합니다."""
+    height, width = rgba.shape[:2]
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8) # 각 행 앞의 0은 필터 종류(None)
+    raw[:, 1:] = np.ascontiguousarray(rgba, dtype=np.uint8).reshape(height, width * 4)
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0) # 8비트 RGBA
+    return (_PNG_SIGNATURE + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(raw.tobytes(), compress_level))
+            + _png_chunk(b"IEND", b""))
+
+
+def png_data_uri(rgba, compress_level=PNG_COMPRESS_LEVEL):
+    """Plotly 이미지 source로 쓸 수 있는 'data:image/png;base64,...' 문자열."""
+    return "data:image/png;base64," + base64.b64encode(encode_png(rgba, compress_level)).decode("ascii")
+
+
+def cell_extent(coord):
+    """일정한 간격의 셀 중심 좌표에서 양 끝 셀 경계 (start, stop)를 구합니다. 좌표 순서를 유지합니다."""
+    coord = np.asarray(coord)
+    if np.issubdtype(coord.dtype, np.datetime64):
+        coord = coord.astype("datetime64[ns]") # 일 단위 좌표도 반 칸을 정확히 나타내도록
+    if len(coord) < 2:
+        value = coord[0] if len(coord) else 0
+        return value - 0.5, value + 0.5
+    half_step = (coord[-1] - coord[0]) / (len(coord) - 1) / 2
+    return coord[0] - half_step, coord[-1] + half_step
+
+
+def rasterize(x, y, z, cmap_name, vmin=None, vmax=None, max_size=RASTER_MAX_SIZE):
+    """
+    (x, y, z) 격자를 RGBA 이미지로 바꿉니다. 행은 y가 증가하는 순서로 맞춰 반환합니다 (origin='lower' 기준).
+    반환: {'rgba', 'x_extent', 'y_extent', 'vmin', 'vmax'}
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    x, y, z = limit_raster_size(x, y, np.asanyarray(z), max_size) # 마스크 배열은 colorize()에서 투명 처리
+    if len(x) > 1 and x[-1] < x[0]:
+        x, z = x[::-1], z[:, ::-1]
+    if len(y) > 1 and y[-1] < y[0]:
+        y, z = y[::-1], z[::-1]
+    rgba, vmin, vmax = colorize(z, cmap_name, vmin, vmax)
+    logging.debug(f"RGBA 래스터 생성: {rgba.shape[1]}x{rgba.shape[0]} (컬러맵 {cmap_name})")
+    return {'rgba': rgba, 'x_extent': cell_extent(x), 'y_extent': cell_extent(y), 'vmin': vmin, 'vmax': vmax}
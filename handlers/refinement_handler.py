@@ -0,0 +1,83 @@
+# oceanocal_v2/handlers/refinement_handler.py
+
+import logging
+
+import numpy as np
+
+from ..dataset_manager import load_slice
+from .decimation_handler import coord_sort_key
+
+REFINE_DELAY_MS = 150 # 확대/이동이 끝난 뒤 이 시간 동안 변화가 없으면 보이는 구간을 다시 읽습니다.
+REFINED_ZORDER = 1.5 # 개요(이미지 0, pcolormesh 1) 위, 오버레이 선(2) 아래
+
+
+def screen_step(length, pixels):
+    """length개 셀을 pixels 픽셀에 그릴 때 읽을 간격 (픽셀당 최소 한 셀)."""
+    return max(1, -(-int(length) // max(int(pixels), 1)))
+
+
+def index_window(coord, lo, hi):
+    """1D 좌표에서 [lo, hi] 범위를 덮는 (start, stop) 인덱스. 가장자리 셀이 잘리지 않도록 양 옆 한 칸을 더합니다."""
+    key = coord_sort_key(coord)
+    lo, hi = sorted(coord_sort_key(np.array([lo, hi])))
+    inside = np.flatnonzero((key >= lo) & (key <= hi))
+    if inside.size == 0:
+        # 확대 구간이 두 격자점 사이에 들어간 경우: 가장 가까운 점 주변만 읽습니다.
+        nearest = int(np.argmin(np.abs(key - (lo + hi) / 2)))
+        return max(nearest - 1, 0), min(nearest + 2, len(coord))
+    return max(int(inside[0]) - 1, 0), min(int(inside[-1]) + 2, len(coord))
+
+
+class ViewRefiner:
+    """
+    2D 필드의 전체 좌표를 보관하고, 화면 해상도에 맞춘 개요(overview)와 확대 구간의 인덱스 창을 계산합니다.
+    처음에는 전체 범위를 화면 픽셀 수만큼 건너뛰며 읽고, 확대하면 보이는 인덱스 창만 같은 해상도로 다시 읽습니다.
+    pyramid(y_dim × x_dim의 Pyramid)가 있으면 간격이 2 이상인 창은 원본 대신 알맞은 개요 단계에서 잘라옵니다.
+    원본은 reader(variable, indexers, keep_dims)로 읽습니다 (기본 load_slice, 플롯 창은 슬라이스 캐시를 거침).
+    """
+    def __init__(self, x_dim, y_dim, x_coord, y_coord, pyramid=None, reader=load_slice):
+        self.x_dim = x_dim
+        self.y_dim = y_dim
+        self.x_coord = np.asarray(x_coord)
+        self.y_coord = np.asarray(y_coord)
+        self.pyramid = pyramid
+        self.reader = reader
+        self.overview_steps = (1, 1) # overview()에서 사용한 (y, x) 간격
+
+    def overview(self, pixels_x, pixels_y):
+        """전체 격자를 화면 해상도로 읽는 indexers."""
+        step_y = screen_step(len(self.y_coord), pixels_y)
+        step_x = screen_step(len(self.x_coord), pixels_x)
+        self.overview_steps = (step_y, step_x)
+        return {self.y_dim: slice(None, None, step_y), self.x_dim: slice(None, None, step_x)}
+
+    @property
+    def is_coarse(self):
+        """개요가 전체 해상도보다 성기게 읽혔는지 (확대 시 더 읽을 데이터가 있는지)."""
+        return self.overview_steps != (1, 1)
+
+    def window(self, x_range, y_range, pixels_x, pixels_y):
+        """
+        보이는 범위를 화면 해상도로 읽는 indexers.
+        개요보다 더 자세히 읽을 것이 없으면(전체가 보이는 경우 등) None을 반환합니다.
+        """
+        x_start, x_stop = index_window(self.x_coord, *x_range)
+        y_start, y_stop = index_window(self.y_coord, *y_range)
+        step_x = screen_step(x_stop - x_start, pixels_x)
+        step_y = screen_step(y_stop - y_start, pixels_y)
+        if step_y >= self.overview_steps[0] and step_x >= self.overview_steps[1]:
+            return None
+        return {self.y_dim: slice(y_start, y_stop, step_y), self.x_dim: slice(x_start, x_stop, step_x)}
+
+    def read(self, variable, indexers):
+        """indexers 구간을 (x, y, z)로 읽습니다. 나머지 차원은 첫 번째 인덱스로 고정됩니다."""
+        if self.pyramid is not None:
+            window = self.pyramid.read_window(indexers)
+            if window is not None:
+                y_data, x_data, z_values = window
+                return x_data, y_data, z_values
+        z_values = self.reader(variable, indexers, (self.y_dim, self.x_dim))
+        x_data = self.x_coord[indexers[self.x_dim]]
+        y_data = self.y_coord[indexers[self.y_dim]]
+        logging.debug(f"화면 해상도 구간 읽기: {self.y_dim}={indexers[self.y_dim]}, {self.x_dim}={indexers[self.x_dim]} -> {z_values.shape}")
+        return x_data, y_data, z_values
@@ -3,7 +3,7 @@ import os
 import json
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox,
-    QTreeWidget, QTreeWidgetItem, QTextEdit, QFileDialog, QSplitter
+    QTreeView, QTextEdit, QFileDialog, QSplitter
 )
 from PyQt6.QtCore import Qt
 
@@ -12,6 +12,10 @@ from .dataset_manager import DatasetManager
 from .handlers.plot_handler import PlotHandler
 from .plot_window_manager import PlotWindowManager
 from .settings_manager import SettingsManager
+from .dataset_tree_model import (
+    DatasetTreeModel, KIND_FILE, KIND_DIMENSION, KIND_COORDINATE,
+    KIND_DATA_VARIABLE, KIND_ATTRIBUTE, KIND_DIMENSIONS, KIND_COORDINATES, KIND_DATA_VARIABLES, KIND_GROUP
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +42,13 @@ class MainPanel(QWidget):
     def _setup_ui(self):
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
 
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabels(["파일/변수"])
-        main_splitter.addWidget(self.tree_widget)
+        # 노드를 펼칠 때만 자식 행을 만드는 지연 모델 (MetadataIndex 기반)
+        self.tree_model = DatasetTreeModel(self)
+        self.tree_model.group_index_requested.connect(self._on_group_index_requested)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.tree_model)
+        self.tree_view.setUniformRowHeights(True)
+        main_splitter.addWidget(self.tree_view)
 
         self.info_text_edit = QTextEdit("파일을 열어 데이터를 확인하세요.")
         self.info_text_edit.setReadOnly(True)
@@ -65,44 +73,56 @@ class MainPanel(QWidget):
         logger.info("MainPanel UI 설정 완료.")
 
     def _connect_signals(self):
-        self.tree_widget.itemClicked.connect(self._on_tree_item_clicked)
+        self.tree_view.clicked.connect(self._on_tree_item_clicked)
         logger.info("MainPanel 시그널 연결 완료.")
 
-    def _on_tree_item_clicked(self, item, column):
+    def _on_tree_item_clicked(self, index):
         """
-        트리 위젯의 아이템이 클릭될 때 해당 항목의 정보를 info_text_edit에 표시합니다.
+        트리 뷰의 항목이 클릭될 때 해당 항목의 정보를 info_text_edit에 표시합니다.
+        정보는 xarray 데이터셋이 아니라 모델의 MetadataIndex에서 가져옵니다.
         """
-        item_type = item.data(0, Qt.ItemDataRole.UserRole)
-        item_value = item.text(0)
+        item_type = self.tree_model.node_kind(index)
+        item_name = self.tree_model.node_name(index)
+        item_value = index.data(Qt.ItemDataRole.DisplayRole)
+        metadata = self.tree_model.metadata_index(index)
+        if metadata:
+            # 선택한 노드가 속한 파일을 현재 파일로 설정 (닫기/플롯 대상)
+            self.dataset_manager.set_current_file_path(metadata.filepath)
         
         info_str = f"선택된 항목: {item_value}\n유형: {item_type}\n\n"
 
-        current_file_path = self.dataset_manager.get_current_file_path()
-        dataset = self.dataset_manager.get_dataset(current_file_path)
-
-        if dataset:
-            if item_type == "file":
+        if metadata:
+            if item_type == KIND_FILE:
                 info_str += "--- 파일 전역 속성 ---\n"
-                for attr, val in dataset.attrs.items():
-                    if attr != 'filepath':
+                for attr, val in metadata.global_attrs:
+                    info_str += f"{attr}: {val}\n"
+            elif item_type == KIND_GROUP:
+                info_str += f"그룹 경로: {item_name}\n\n"
+                if metadata.group == item_name:
+                    info_str += "--- 그룹 속성 ---\n"
+                    for attr, val in metadata.global_attrs:
                         info_str += f"{attr}: {val}\n"
-            elif item_type == "dimension":
-                dim_name = item_value.split(':')[0].strip()
-                info_str += f"차원 크기: {dataset.dims.get(dim_name, 'N/A')}\n"
-            elif item_type == "coordinate" or item_type == "data_variable":
-                var_name = item_value
-                if var_name in dataset.coords or var_name in dataset.data_vars:
-                    variable = dataset[var_name]
+                else:
+                    info_str += "그룹을 펼치면 내용을 불러옵니다.\n"
+            elif item_type == KIND_DIMENSION:
+                info_str += f"차원 크기: {metadata.dim_size(item_name) or 'N/A'}\n"
+            elif item_type == KIND_COORDINATE or item_type == KIND_DATA_VARIABLE:
+                variable = metadata.get_variable(item_name)
+                if variable:
                     info_str += f"데이터 타입: {variable.dtype}\n"
                     info_str += f"크기: {variable.shape}\n"
-                    info_str += f"차원: {list(variable.dims)}\n\n"
+                    info_str += f"차원: {list(variable.dims)}\n"
+                    if item_name in metadata.coord_ranges:
+                        range_min, range_max = metadata.coord_ranges[item_name]
+                        info_str += f"범위: {range_min} ~ {range_max}\n"
+                    info_str += "\n"
                     info_str += "--- 속성 ---\n"
-                    for attr, val in variable.attrs.items():
+                    for attr, val in variable.attrs:
                         info_str += f"{attr}: {val}\n"
                 else:
                     info_str += "변수 정보를 찾을 수 없습니다.\n"
-            elif item_type == "attribute":
-                info_str += f"속성 값: {item_value}\n"
+            elif item_type == KIND_ATTRIBUTE:
+                info_str += f"속성 값: {index.data(Qt.ItemDataRole.ToolTipRole)}\n"
             else:
                 info_str += "알 수 없는 항목 유형.\n"
         else:
@@ -115,87 +135,97 @@ class MainPanel(QWidget):
         주어진 파일 경로의 데이터를 로드하여 트리 위젯에 표시합니다.
         """
         if self.dataset_manager:
-            try:
-                self.dataset_manager.open_file(file_path) # 'load_file'을 'open_file'로 변경
-                self._update_tree_widget()
-                if self.update_status_bar_callback:
-                    self.update_status_bar_callback(f"'{os.path.basename(file_path)}' 로드 완료.", 2000)
-                logger.info(f"파일 '{file_path}' 트리 위젯에 로드 완료.")
-            except Exception as e:
-                QMessageBox.critical(self, "파일 로드 오류", f"파일을 로드할 수 없습니다: {e}")
-                if self.update_status_bar_callback:
-                    self.update_status_bar_callback(f"파일 로드 오류: {e}", 5000)
-                logger.error(f"파일 '{file_path}' 로드 중 오류 발생: {e}")
+            # 메타데이터 캐시에 있으면 파일을 열기 전에 트리부터 표시합니다.
+            cached_index = self.dataset_manager.peek_metadata_index(file_path)
+            if cached_index is not None:
+                self._show_metadata_index(cached_index)
+                logger.info(f"파일 '{file_path}' 메타데이터 캐시에서 트리 표시.")
+            # 파일 열기는 백그라운드에서 수행되고, 완료되면 트리가 채워집니다.
+            self.dataset_manager.open_file_async(
+                file_path,
+                on_done=lambda ds: self._on_file_loaded(file_path),
+                on_error=lambda e: self._on_file_load_failed(file_path, e),
+            )
         else:
             logger.warning("DatasetManager가 MainPanel에 설정되지 않았습니다.")
             QMessageBox.warning(self, "오류", "데이터셋 매니저가 초기화되지 않았습니다. 애플리케이션 설정을 확인하세요.")
 
-    def _update_tree_widget(self):
+    def _on_file_loaded(self, file_path):
+        """파일 열기 작업이 끝나면 GUI 스레드에서 호출됩니다."""
+        self._add_file_to_tree(file_path)
+        if self.update_status_bar_callback:
+            self.update_status_bar_callback(f"'{os.path.basename(file_path)}' 로드 완료.", 2000)
+        logger.info(f"파일 '{file_path}' 트리 위젯에 로드 완료.")
+
+    def _on_file_load_failed(self, file_path, error):
+        self.tree_model.remove_file(file_path) # 캐시로 먼저 표시한 노드가 있으면 제거
+        QMessageBox.critical(self, "파일 로드 오류", f"파일을 로드할 수 없습니다: {error}")
+        if self.update_status_bar_callback:
+            self.update_status_bar_callback(f"파일 로드 오류: {error}", 5000)
+        logger.error(f"파일 '{file_path}' 로드 중 오류 발생: {error}")
+
+    def _on_group_index_requested(self, file_path, group):
         """
-        DatasetManager에서 현재 활성화된 데이터를 기반으로 트리 위젯을 업데이트하고
-        각 아이템에 사용자 정의 데이터(타입)를 저장합니다.
+        트리에서 하위 그룹 노드가 처음 펼쳐질 때 호출됩니다.
+        메타데이터 캐시에 있으면 바로 채우고, 그룹 데이터셋은 백그라운드에서 엽니다.
         """
-        self.tree_widget.clear()
-        self.info_text_edit.clear()
+        cached_index = self.dataset_manager.peek_metadata_index(file_path, group)
+        if cached_index is not None:
+            self.tree_model.set_group_index(cached_index)
 
-        current_file_path = self.dataset_manager.get_current_file_path()
-        dataset = self.dataset_manager.get_dataset(current_file_path)
-
-        if dataset:
-            file_name = os.path.basename(current_file_path if current_file_path else 'Unknown File')
-            file_item = QTreeWidgetItem(self.tree_widget, [file_name])
-            file_item.setData(0, Qt.ItemDataRole.UserRole, "file")
-            file_item.setExpanded(True)
-
-            # Dimensions
-            dims_item = QTreeWidgetItem(file_item, ["Dimensions"])
-            for dim, size in dataset.dims.items():
-                dim_sub_item = QTreeWidgetItem(dims_item, [f"{dim}: {size}"])
-                dim_sub_item.setData(0, Qt.ItemDataRole.UserRole, "dimension")
-            dims_item.setExpanded(True)
-
-            # Coordinates
-            coords_item = QTreeWidgetItem(file_item, ["Coordinates"])
-            for coord in dataset.coords:
-                var_item = QTreeWidgetItem(coords_item, [coord])
-                var_item.setData(0, Qt.ItemDataRole.UserRole, "coordinate")
-                attrs_item = QTreeWidgetItem(var_item, ["Attributes"])
-                for attr, value in dataset[coord].attrs.items():
-                    attr_sub_item = QTreeWidgetItem(attrs_item, [f"{attr}: {value}"])
-                    attr_sub_item.setData(0, Qt.ItemDataRole.UserRole, "attribute")
-                attrs_item.setExpanded(False)
-            coords_item.setExpanded(True)
-
-            # Data Variables
-            data_vars_item = QTreeWidgetItem(file_item, ["Data Variables"])
-            for var in dataset.data_vars:
-                var_item = QTreeWidgetItem(data_vars_item, [var])
-                var_item.setData(0, Qt.ItemDataRole.UserRole, "data_variable")
-                attrs_item = QTreeWidgetItem(var_item, ["Attributes"])
-                for attr, value in dataset[var].attrs.items():
-                    attr_sub_item = QTreeWidgetItem(attrs_item, [f"{attr}: {value}"])
-                    attr_sub_item.setData(0, Qt.ItemDataRole.UserRole, "attribute")
-                attrs_item.setExpanded(False)
-            data_vars_item.setExpanded(True)
-
-            # Global Attributes
-            global_attrs_item = QTreeWidgetItem(file_item, ["Global Attributes"])
-            for attr, value in dataset.attrs.items():
-                if attr != 'filepath':
-                    attr_sub_item = QTreeWidgetItem(global_attrs_item, [f"{attr}: {value}"])
-                    attr_sub_item.setData(0, Qt.ItemDataRole.UserRole, "attribute")
-            global_attrs_item.setExpanded(True)
+        def _on_group_loaded(ds):
+            metadata_index = self.dataset_manager.get_metadata_index(file_path, group)
+            if metadata_index is not None:
+                self.tree_model.set_group_index(metadata_index)
+
+        def _on_group_load_failed(error):
+            self.tree_model.group_load_failed(file_path, group)
+            if self.update_status_bar_callback:
+                self.update_status_bar_callback(f"그룹 로드 오류: {error}", 5000)
+            logger.error(f"그룹 '{group}' ({file_path}) 로드 중 오류 발생: {error}")
+
+        self.dataset_manager.open_group_async(file_path, group, on_done=_on_group_loaded,
+                                              on_error=_on_group_load_failed)
+
+    def _add_file_to_tree(self, file_path):
+        """
+        파일의 메타데이터 인덱스(DatasetManager 캐시)로 트리에 파일 노드를 추가합니다.
+        다른 파일의 노드는 그대로 유지되며, 이미 있는 파일이면 해당 노드를 선택만 합니다.
+        """
+        metadata_index = self.dataset_manager.get_metadata_index(file_path)
+        if metadata_index is None:
+            logger.warning(f"트리에 추가할 메타데이터가 없습니다: {file_path}")
+            return
+        self._show_metadata_index(metadata_index)
+
+    def _show_metadata_index(self, metadata_index):
+        self.info_text_edit.clear()
+        row = self.tree_model.add_file(metadata_index)
+        file_index = self.tree_model.index(row, 0)
+        self._expand_default_nodes(file_index)
+        self.tree_view.setCurrentIndex(file_index)
+        self.tree_view.scrollTo(file_index)
         logger.info("트리 위젯 업데이트 완료.")
 
+    def _expand_default_nodes(self, file_index):
+        """파일 노드와 차원/좌표/데이터 변수 폴더를 기본으로 펼칩니다."""
+        self.tree_view.expand(file_index)
+        if self.tree_model.canFetchMore(file_index):
+            self.tree_model.fetchMore(file_index) # 아래에서 폴더 노드에 접근하므로 바로 만듭니다.
+        for child_row in range(self.tree_model.rowCount(file_index)):
+            child_index = self.tree_model.index(child_row, 0, file_index)
+            if self.tree_model.node_kind(child_index) in (KIND_DIMENSIONS, KIND_COORDINATES, KIND_DATA_VARIABLES):
+                self.tree_view.expand(child_index)
+
     def close_current_file(self):
         """
-        현재 로드된 파일을 닫고 트리 위젯을 비웁니다.
+        현재 로드된 파일을 닫고 트리에서 해당 파일의 노드만 제거합니다.
         """
         if self.dataset_manager:
             current_file_path = self.dataset_manager.get_current_file_path()
             if current_file_path:
                 self.dataset_manager.close_file(current_file_path)
-                self.tree_widget.clear()
+                self.tree_model.remove_file(current_file_path)
                 self.info_text_edit.clear()
                 if self.update_status_bar_callback:
                     self.update_status_bar_callback("파일 닫힘.", 2000)
@@ -212,16 +242,16 @@ class MainPanel(QWidget):
         선택된 데이터 변수에 대해 플롯 창을 열도록 plot_handler에 요청합니다.
         """
         if self.plot_handler and self.dataset_manager:
-            selected_item = self.tree_widget.currentItem()
-            if selected_item:
-                item_type = selected_item.data(0, Qt.ItemDataRole.UserRole)
-                if item_type == "data_variable":
-                    variable_name = selected_item.text(0)
-                    
-                    current_file_path = self.dataset_manager.get_current_file_path()
-                    dataset = self.dataset_manager.get_dataset(current_file_path)
-
-                    if dataset and (variable_name in dataset.data_vars or variable_name in dataset.coords):
+            selected_index = self.tree_view.currentIndex()
+            if selected_index.isValid():
+                item_type = self.tree_model.node_kind(selected_index)
+                if item_type == KIND_DATA_VARIABLE:
+                    metadata = self.tree_model.metadata_index(selected_index)
+                    # 하위 그룹의 변수는 '/그룹/변수' 경로로 전달합니다.
+                    variable_name = metadata.variable_path(self.tree_model.node_name(selected_index))
+                    current_file_path = metadata.filepath
+
+                    if self.dataset_manager.get_variable_by_path(current_file_path, variable_name) is not None:
                         self.plot_handler.create_or_update_plot_window(current_file_path, variable_name) # 파일 경로도 함께 전달
                         if self.update_status_bar_callback:
                             self.update_status_bar_callback(f"'{variable_name}' 플롯 생성 요청.", 2000)
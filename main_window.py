@@ -19,6 +19,10 @@ from .dataset_manager import DatasetManager
 from .handlers.plot_handler import PlotHandler
 from .settings_manager import SettingsManager
 from .main_panel import MainPanel
+from .async_loader import AsyncLoader
+from .metadata_cache import MetadataCache
+from .pyramid_cache import PyramidCache
+from .slice_cache import SliceCache
 
 setup_logger()
 logger = logging.getLogger(__name__) # MainWindow 클래스 내에서 로깅 사용
@@ -39,7 +43,17 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(icon('app_icon.png'))
 
         self.settings_manager = SettingsManager(SETTINGS_PATH) 
-        self.dataset_manager = DatasetManager(status_callback=self.update_status_bar)
+        self.async_loader = AsyncLoader(status_callback=self.update_status_bar,
+                                        max_workers=self.settings_manager.get_app_setting('io_workers', 2),
+                                        parent=self) # 파일 열기/슬라이스 읽기용 백그라운드 작업 풀
+        self.dataset_manager = DatasetManager(status_callback=self.update_status_bar,
+                                              max_open_handles=self.settings_manager.get_app_setting('max_open_handles', 16),
+                                              lazy=self.settings_manager.get_app_setting('lazy_loading', False),
+                                              chunks=self.settings_manager.get_app_setting('chunk_sizes'),
+                                              loader=self.async_loader,
+                                              metadata_cache=MetadataCache(),
+                                              pyramid_cache=PyramidCache(use_disk=self.settings_manager.get_app_setting('pyramid_disk_cache', True)),
+                                              slice_cache=SliceCache(max_bytes=self.settings_manager.get_app_setting('slice_cache_mb', 256) * 1024 * 1024))
         self.plot_manager = PlotWindowManager(self, self.settings_manager, status_callback=self.update_status_bar) # PlotWindowManager 초기화
         self.plot_handler = PlotHandler(self, self.dataset_manager, self.plot_manager, self.settings_manager) # PlotHandler 초기화
 
@@ -76,6 +90,11 @@ class MainWindow(QMainWindow):
         self.close_action.setStatusTip("현재 파일을 닫습니다.")
         self.close_action.triggered.connect(self.main_panel.close_current_file)
 
+        self.cancel_loading_action = QAction(icon('close.png'), "작업 취소", self)
+        self.cancel_loading_action.setShortcut("Esc")
+        self.cancel_loading_action.setStatusTip("진행 중인 파일 열기/플롯 읽기 작업을 취소합니다.")
+        self.cancel_loading_action.triggered.connect(self.async_loader.cancel_all)
+
         self.exit_action = QAction(icon('exit.png'), "&종료", self)
         self.exit_action.setShortcut("Ctrl+Q")
         self.exit_action.setStatusTip("애플리케이션을 종료합니다.")
@@ -124,6 +143,7 @@ class MainWindow(QMainWindow):
         file_menu = menu_bar.addMenu("&파일")
         file_menu.addAction(self.open_action)
         file_menu.addAction(self.close_action)
+        file_menu.addAction(self.cancel_loading_action)
         file_menu.addSeparator()
         file_menu.addAction(self.exit_action)
 
@@ -269,7 +289,7 @@ class MainWindow(QMainWindow):
             QToolButton:hover { background-color: #555; }
             QToolButton:pressed { background-color: #666; border: 1px solid #777; }
             QStatusBar { background-color: #3a3a3a; color: #EEE; }
-            QTreeWidget {
+            QTreeWidget, QTreeView {
                 background-color: #333;
                 color: #EEE;
                 border: 1px solid #444;
@@ -277,10 +297,10 @@ class MainWindow(QMainWindow):
                 selection-background-color: #0078d7; /* Windows Blue */
                 selection-color: #FFF;
             }
-            QTreeWidget::item {
+            QTreeWidget::item, QTreeView::item {
                 padding: 3px;
             }
-            QTreeWidget::item:selected {
+            QTreeWidget::item:selected, QTreeView::item:selected {
                 background-color: #0078d7;
             }
             QTextEdit {
@@ -372,5 +392,9 @@ class MainWindow(QMainWindow):
         # 모든 플롯 창 닫기
         if self.plot_manager:
             self.plot_manager.close_all_plot_windows()
+        if self.async_loader:
+            self.async_loader.shutdown()
+        if self.dataset_manager:
+            self.dataset_manager.close_all()
         event.accept()
         logger.info("애플리케이션 종료.")
\ No newline at end of file
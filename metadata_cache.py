@@ -0,0 +1,124 @@
+# oceanocal_v2/metadata_cache.py
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+
+from .bookmarks import APP_DATA_DIR
+from .metadata_index import MetadataIndex
+
+logger = logging.getLogger(__name__)
+
+METADATA_CACHE_FILE_NAME = "oceanocal_metadata_cache.sqlite3"
+METADATA_CACHE_PATH = os.path.join(APP_DATA_DIR, METADATA_CACHE_FILE_NAME)
+CACHE_FORMAT_VERSION = 2 # MetadataIndex.to_dict() 형식이 바뀌면 올려서 이전 항목을 무효화합니다.
+
+
+class MetadataCache:
+    """
+    파일 경로별 MetadataIndex(차원, 변수, 속성, 좌표 범위)를 SQLite에 보관하는 영구 캐시.
+    파일 크기와 수정 시각(mtime)이 저장할 때와 다르면 해당 항목은 무효로 처리됩니다.
+    파일을 열기 전에 트리와 정보 패널을 그릴 수 있게 해줍니다.
+    """
+    def __init__(self, db_path=METADATA_CACHE_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock() # 작업 스레드와 GUI 스레드에서 함께 사용
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+        try:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                " path TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL,"
+                " mtime REAL NOT NULL,"
+                " version INTEGER NOT NULL,"
+                " data TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info(f"메타데이터 캐시 열림: {self.db_path}")
+        except sqlite3.Error as e:
+            logger.error(f"메타데이터 캐시를 열 수 없습니다. 캐시 없이 동작합니다: {e}", exc_info=True)
+            self._conn = None
+
+    @staticmethod
+    def _file_signature(filepath):
+        """(크기, mtime)을 반환합니다. 파일이 없으면 None."""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime
+
+    @staticmethod
+    def _cache_key(filepath, group):
+        """루트 그룹은 파일 경로, 하위 그룹은 '파일 경로#그룹 경로'를 키로 사용합니다."""
+        if not group or group == "/":
+            return filepath
+        return f"{filepath}#{group}"
+
+    def get(self, filepath, group=None):
+        """캐시에 유효한 항목이 있으면 MetadataIndex를, 없거나 파일이 바뀌었으면 None을 반환합니다."""
+        if self._conn is None:
+            return None
+        signature = self._file_signature(filepath)
+        if signature is None:
+            return None
+        key = self._cache_key(filepath, group)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT size, mtime, version, data FROM metadata WHERE path = ?", (key,)
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            size, mtime, version, data = row
+            if (size, mtime) != signature or version != CACHE_FORMAT_VERSION:
+                self.misses += 1
+                self.invalidate(filepath, group)
+                logger.debug(f"메타데이터 캐시 무효화 (파일 변경됨): {key}")
+                return None
+            self.hits += 1
+            return MetadataIndex.from_dict(json.loads(data))
+        except (sqlite3.Error, ValueError, KeyError) as e:
+            logger.error(f"메타데이터 캐시 읽기 오류 ({key}): {e}")
+            return None
+
+    def put(self, metadata_index):
+        """MetadataIndex를 현재 파일 크기/mtime과 함께 저장합니다."""
+        if self._conn is None:
+            return
+        signature = self._file_signature(metadata_index.filepath)
+        if signature is None:
+            return
+        try:
+            data = json.dumps(metadata_index.to_dict(), ensure_ascii=False)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO metadata (path, size, mtime, version, data) VALUES (?, ?, ?, ?, ?)",
+                    (self._cache_key(metadata_index.filepath, metadata_index.group), signature[0], signature[1], CACHE_FORMAT_VERSION, data),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"메타데이터 캐시 저장 오류 ({metadata_index.filepath}): {e}")
+
+    def invalidate(self, filepath, group=None):
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM metadata WHERE path = ?", (self._cache_key(filepath, group),))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"메타데이터 캐시 항목 삭제 오류 ({filepath}): {e}")
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+            logger.info("메타데이터 캐시 닫힘.")
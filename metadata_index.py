@@ -0,0 +1,126 @@
+# oceanocal_v2/metadata_index.py
+
+import logging
+from collections import namedtuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VariableMeta = namedtuple("VariableMeta", ["name", "dims", "shape", "dtype", "attrs"])
+
+
+class MetadataIndex:
+    """
+    트리와 정보 패널을 그리는 데 필요한 데이터셋 메타데이터만 담은 가벼운 인덱스.
+    xarray 객체를 참조하지 않으므로 파일 핸들이 닫혀도 사용할 수 있습니다.
+    """
+    __slots__ = ("filepath", "dims", "coords", "data_vars", "variables", "global_attrs", "coord_ranges",
+                 "group", "groups")
+
+    def __init__(self, filepath, dims, coords, data_vars, variables, global_attrs, coord_ranges=None,
+                 group="/", groups=()):
+        self.filepath = filepath
+        self.group = group # 이 인덱스가 나타내는 그룹 경로 ('/'는 루트 그룹)
+        self.groups = tuple(groups) # 바로 아래 하위 그룹 이름들 (하위 그룹 내용은 펼칠 때 따로 읽음)
+        self.dims = dims # ((name, size), ...)
+        self.coords = coords # (name, ...)
+        self.data_vars = data_vars # (name, ...)
+        self.variables = variables # {name: VariableMeta}
+        self.global_attrs = global_attrs # ((key, str value), ...)
+        self.coord_ranges = coord_ranges or {} # {coord name: (min str, max str)} 1D 좌표의 값 범위
+
+    @classmethod
+    def from_dataset(cls, filepath, ds, group="/", groups=()):
+        """
+        열린 xarray Dataset(파일의 한 그룹)에서 인덱스를 만듭니다. 속성 값은 문자열로 변환해 보관합니다.
+        xarray는 하위 그룹을 보여주지 않으므로 groups는 호출하는 쪽에서 전달합니다.
+        """
+        variables = {}
+        for name, var in ds.variables.items():
+            variables[name] = VariableMeta(
+                name=name,
+                dims=tuple(var.dims),
+                shape=tuple(var.shape),
+                dtype=str(var.dtype),
+                attrs=tuple((key, str(value)) for key, value in var.attrs.items()),
+            )
+        return cls(
+            filepath=filepath,
+            dims=tuple((name, int(size)) for name, size in ds.sizes.items()),
+            coords=tuple(ds.coords),
+            data_vars=tuple(ds.data_vars),
+            variables=variables,
+            global_attrs=tuple((key, str(value)) for key, value in ds.attrs.items() if key != 'filepath'),
+            coord_ranges=cls._coord_ranges(ds),
+            group=group,
+            groups=groups,
+        )
+
+    @staticmethod
+    def _coord_ranges(ds):
+        """숫자/시간형 1D 좌표의 최솟값과 최댓값을 문자열로 구합니다."""
+        ranges = {}
+        for name, coord in ds.coords.items():
+            if coord.ndim != 1 or coord.size == 0:
+                continue
+            if not (np.issubdtype(coord.dtype, np.number) or np.issubdtype(coord.dtype, np.datetime64)):
+                continue
+            try:
+                values = coord.values
+                ranges[name] = (str(np.nanmin(values)), str(np.nanmax(values)))
+            except Exception as e:
+                logger.debug(f"좌표 '{name}'의 범위를 구할 수 없습니다: {e}")
+        return ranges
+
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 dict로 변환합니다 (메타데이터 캐시용)."""
+        return {
+            "filepath": self.filepath,
+            "group": self.group,
+            "groups": list(self.groups),
+            "dims": [list(item) for item in self.dims],
+            "coords": list(self.coords),
+            "data_vars": list(self.data_vars),
+            "variables": {name: var._asdict() for name, var in self.variables.items()},
+            "global_attrs": [list(item) for item in self.global_attrs],
+            "coord_ranges": {name: list(value) for name, value in self.coord_ranges.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        variables = {}
+        for name, var in data["variables"].items():
+            variables[name] = VariableMeta(
+                name=var["name"],
+                dims=tuple(var["dims"]),
+                shape=tuple(var["shape"]),
+                dtype=var["dtype"],
+                attrs=tuple(tuple(item) for item in var["attrs"]),
+            )
+        return cls(
+            filepath=data["filepath"],
+            dims=tuple(tuple(item) for item in data["dims"]),
+            coords=tuple(data["coords"]),
+            data_vars=tuple(data["data_vars"]),
+            variables=variables,
+            global_attrs=tuple(tuple(item) for item in data["global_attrs"]),
+            coord_ranges={name: tuple(value) for name, value in data.get("coord_ranges", {}).items()},
+            group=data.get("group", "/"),
+            groups=data.get("groups", ()),
+        )
+
+    def variable_path(self, name):
+        """그룹 안의 변수 이름을 파일 전체에서의 경로로 바꿉니다. 루트 그룹의 변수는 이름 그대로 반환합니다."""
+        if self.group == "/":
+            return name
+        return f"{self.group}/{name}"
+
+    def get_variable(self, name):
+        return self.variables.get(name)
+
+    def dim_size(self, name):
+        for dim, size in self.dims:
+            if dim == name:
+                return size
+        return None
@@ -9,6 +9,8 @@ from PyQt6.QtGui import QColor, QFont
 from PyQt6.QtCore import Qt
 import logging
 
+from .handlers.colorbar_handler import list_colormaps
+
 class PlotLabelDialog(QDialog):
     def __init__(self, parent=None, current_options=None, settings_manager=None):
         super().__init__(parent)
@@ -83,14 +85,13 @@ class PlotLabelDialog(QDialog):
         main_layout.addLayout(button_box)
 
     def _populate_colormaps(self):
-        # List .pal files in resources/colorbars
-        colorbar_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "colorbars")
-        if os.path.exists(colorbar_dir):
-            colormaps = [f.split('.')[0] for f in os.listdir(colorbar_dir) if f.endswith('.pal')]
-            self.cmap_combo.addItems(sorted(colormaps))
+        # resources/colorbars의 .pal 목록은 컬러맵 레지스트리가 한 번만 스캔합니다.
+        colormaps = list_colormaps()
+        if colormaps:
+            self.cmap_combo.addItems(colormaps)
         else:
             self.cmap_combo.addItems(["jet", "viridis", "plasma", "inferno", "magma", "cividis"]) # Fallback
-            logging.warning(f"컬러바 디렉토리를 찾을 수 없습니다: {colorbar_dir}. 기본 컬러맵 사용.")
+            logging.warning("컬러바 파일을 찾을 수 없습니다. 기본 컬러맵 사용.")
 
     def _select_font(self):
         initial_font = QFont(self.current_options.get('plot_font_family', 'Arial'),
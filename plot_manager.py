@@ -1,34 +1,289 @@
 # C:\Users\thhan\oceanocal_v2\plot_manager.py
 # This file defines the PlotWindow (a single plot dialog)
 
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QMessageBox, QMenu
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QMessageBox, QMenu, QFileDialog
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import QUrl, QTimer, pyqtSlot, Qt # Import Qt for context menu policy
+from PyQt6.QtWebEngineCore import QWebEnginePage
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtCore import QUrl, QTimer, QObject, QFile, QIODevice, pyqtSlot, pyqtSignal, Qt # Import Qt for context menu policy
 from PyQt6.QtGui import QAction
 import plotly.graph_objects as go
 import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+from plotly.utils import PlotlyJSONEncoder
 import os
+import json
+import base64
 import xarray as xr
 import numpy as np
 import logging
 
 from .handlers.colorbar_handler import get_colormap
 from .handlers.overlay_handler import get_overlay_traces
+from .handlers.raster_handler import RASTER_MAX_SIZE, should_rasterize, rasterize, png_data_uri
+from .handlers.decimation_handler import DecimatedSeries, thin_indices
+from .dataset_manager import load_slice
+from .bookmarks import APP_DATA_DIR
+from .web_view_pool import WebViewPool
+
+PLOT_DIV_ID = "oceanocal-plot"
+# 'local' serves plotly.js from the installed plotly package (works offline); 'cdn' fetches it from cdn.plot.ly.
+PLOTLY_JS_SOURCES = ("local", "cdn")
+PLOTLY_ASSET_DIR = os.path.join(APP_DATA_DIR, "plotly") # plotly-<version>.min.js and the page that loads it
+# Point count from which line/marker traces are drawn with WebGL (Scattergl, Scattermap) instead of SVG.
+DEFAULT_WEBGL_THRESHOLD = 100_000
+# Typed-array element types plotly.js can decode from a {'dtype', 'bdata'} spec.
+PLOTLYJS_TYPED_ARRAY_DTYPES = ("i1", "u1", "i2", "u2", "i4", "u4", "f4", "f8")
+# The page every PlotWindow loads once. Figures arrive over the 'plot' QWebChannel object
+# and are drawn with Plotly.react, so replotting never reloads the page (or hits setHtml's 2 MB limit).
+PLOT_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="__PLOTLY_SRC__"></script>
+<script>__QWEBCHANNEL_JS__</script>
+<style>
+html, body { margin: 0; height: 100%; }
+body { display: flex; flex-direction: column; }
+#oceanocal-plot { flex: 1; min-height: 0; }
+#oceanocal-slices { display: none; padding: 0.5em; }
+#oceanocal-slider { width: 80%; }
+#oceanocal-slice-label { margin-left: 1em; }
+</style>
+</head>
+<body>
+<div id="oceanocal-plot"></div>
+<div id="oceanocal-slices"><input id="oceanocal-slider" type="range" min="0" step="1" value="0"><span id="oceanocal-slice-label"></span></div>
+<script>__PAGE_SCRIPT__</script>
+</body>
+</html>
+"""
+PAGE_SCRIPT = """
+(function() {
+    var gd = document.getElementById('oceanocal-plot');
+    var bar = document.getElementById('oceanocal-slices');
+    var slider = document.getElementById('oceanocal-slider');
+    var label = document.getElementById('oceanocal-slice-label');
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        var plot = channel.objects.plot;
+        var listening = false;
+        plot.figureReady.connect(function(payload) {
+            var message = JSON.parse(payload);
+            var slices = message.slices;
+            bar.style.display = slices ? 'block' : 'none';
+            if (slices) {
+                slider.max = slices.max;
+                slider.value = 0;
+                label.textContent = slices.label;
+            }
+            Plotly.react(gd, message.figure.data, message.figure.layout, {responsive: true}).then(function() {
+                if (!listening) { // gd.on exists only once Plotly has drawn into the div
+                    gd.on('plotly_relayout', function(e) { plot.relayout(JSON.stringify(e)); });
+                    listening = true;
+                }
+            });
+        });
+        plot.sliceReady.connect(function(index, payload) {
+            if (index !== parseInt(slider.value)) { return; } // the slider has already moved on
+            var data = JSON.parse(payload);
+            Plotly.restyle(gd, {z: [data.z]}, [0]);
+            label.textContent = data.label;
+        });
+        plot.traceReady.connect(function(payload) { Plotly.restyle(gd, JSON.parse(payload), [0]); });
+        plot.cleared.connect(function() { // the view is going back to the pool
+            Plotly.purge(gd); // also drops the relayout listener
+            listening = false;
+            bar.style.display = 'none';
+        });
+        slider.addEventListener('input', function() { plot.requestSlice(parseInt(slider.value)); });
+        plot.pageLoaded();
+    });
+})();
+"""
+_qwebchannel_js = None
+_local_plot_page = None # path of the page written to PLOTLY_ASSET_DIR, or "" if it could not be written
+_shared_web_view_pools = {} # {plotly.js source: WebViewPool}
+
+
+def _qwebchannel_script():
+    """qwebchannel.js from Qt's resources, inlined into the plot page (it must load before PAGE_SCRIPT)."""
+    global _qwebchannel_js
+    if _qwebchannel_js is None:
+        resource = QFile(":/qtwebchannel/qwebchannel.js")
+        if resource.open(QIODevice.OpenModeFlag.ReadOnly):
+            _qwebchannel_js = bytes(resource.readAll()).decode("utf-8")
+            resource.close()
+        else:
+            logging.error("qwebchannel.js resource not found; plots cannot be shown.")
+            _qwebchannel_js = ""
+    return _qwebchannel_js
+
+
+def _plot_page_html(plotly_src):
+    """The persistent plot page (PLOT_PAGE_TEMPLATE) loading plotly.js from plotly_src."""
+    return (PLOT_PAGE_TEMPLATE.replace("__PLOTLY_SRC__", plotly_src)
+            .replace("__QWEBCHANNEL_JS__", _qwebchannel_script())
+            .replace("__PAGE_SCRIPT__", PAGE_SCRIPT))
+
+
+def _write_asset(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path) # another process never sees a half-written file
+
+
+def _local_plot_page_path():
+    """
+    Write the bundled plotly.js (once per version) and the plot page next to it in PLOTLY_ASSET_DIR.
+    Every window then loads the same file, so Chromium reads plotly.js from disk instead of the network.
+    Returns None if the files cannot be written.
+    """
+    global _local_plot_page
+    if _local_plot_page is None:
+        js_name = f"plotly-{get_plotlyjs_version()}.min.js"
+        page_path = os.path.join(PLOTLY_ASSET_DIR, "plot_page.html")
+        try:
+            os.makedirs(PLOTLY_ASSET_DIR, exist_ok=True)
+            js_path = os.path.join(PLOTLY_ASSET_DIR, js_name)
+            if not os.path.exists(js_path):
+                _write_asset(js_path, get_plotlyjs())
+                logging.info(f"Bundled plotly.js written to {js_path}")
+            _write_asset(page_path, _plot_page_html(js_name)) # rewritten per run: it inlines Qt's qwebchannel.js
+            _local_plot_page = page_path
+        except OSError as e:
+            logging.error(f"Cannot write local plotly.js assets to {PLOTLY_ASSET_DIR}, falling back to the CDN: {e}")
+            _local_plot_page = ""
+    return _local_plot_page or None
+
+
+def load_plot_page(browser, source="local"):
+    """Load the persistent plot page into a QWebEngineView, with plotly.js from the given PLOTLY_JS_SOURCES entry."""
+    page_path = _local_plot_page_path() if source == "local" else None
+    if page_path:
+        browser.load(QUrl.fromLocalFile(page_path))
+    else:
+        browser.setHtml(_plot_page_html(f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"))
+
+
+def _typed_array(values):
+    """Encode a numeric array as a plotly.js typed-array spec ({'dtype', 'bdata', 'shape'}); other values pass through."""
+    if np.ma.isMaskedArray(values):
+        # Masked cells become NaN, which integer arrays cannot hold: widen them to float64 first.
+        values = np.ma.filled(values if values.dtype.kind == "f" else values.astype(np.float64), np.nan)
+    values = np.asarray(values)
+    if values.dtype.kind not in "iuf" or values.size == 0:
+        return values
+    if values.dtype.str[1:] not in PLOTLYJS_TYPED_ARRAY_DTYPES:
+        # plotly.js has no 64-bit integer (or half/long float) arrays: int32 when the values fit, else float64.
+        fits_int32 = values.dtype.kind in "iu" and \
+            np.iinfo(np.int32).min <= values.min() and values.max() <= np.iinfo(np.int32).max
+        values = values.astype(np.int32 if fits_int32 else np.float64)
+    # Typed arrays are little-endian; NetCDF variables are often stored big-endian.
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+    spec = {'dtype': values.dtype.str[1:], 'bdata': base64.b64encode(values.tobytes()).decode("ascii")}
+    if values.ndim > 1:
+        spec['shape'] = ", ".join(map(str, values.shape))
+    return spec
+
+
+class PlotBuildError(Exception):
+    """Raised while building a figure when the variable cannot be drawn as requested."""
+
+
+class _PlotBridge(QObject):
+    """
+    QWebChannel object ('plot') between a PlotWindow and its persistent page.
+    Python sends figures, slices and trace updates as JSON with base64 typed arrays;
+    the page reports when it is ready, slider moves and zoom/pan.
+    The bridge belongs to the pooled view, so a recycled view keeps its loaded page and channel.
+    """
+    figureReady = pyqtSignal(str) # {'figure': {'data', 'layout'}, 'slices': {'max', 'label'} or null}
+    sliceReady = pyqtSignal(int, str) # index, {'z': ..., 'label': ...}
+    traceReady = pyqtSignal(str) # restyle update for trace 0, e.g. {'x': [...], 'y': [...]}
+    cleared = pyqtSignal()
+    loaded = pyqtSignal()
+    sliceRequested = pyqtSignal(int)
+    relayoutChanged = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ready = False # set once the page has connected to the channel
+
+    @pyqtSlot()
+    def pageLoaded(self):
+        self.ready = True
+        self.loaded.emit()
+
+    @pyqtSlot(int)
+    def requestSlice(self, index):
+        self.sliceRequested.emit(index)
+
+    @pyqtSlot(str)
+    def relayout(self, event):
+        try:
+            self.relayoutChanged.emit(json.loads(event))
+        except ValueError:
+            logging.debug(f"Ignoring malformed relayout message: {event}")
+
+
+def _create_plot_view(source):
+    """A QWebEngineView with its own page, channel and _PlotBridge (view.plot_bridge), loading the plot page."""
+    view = QWebEngineView()
+    page = QWebEnginePage(view)
+    view.setPage(page)
+    bridge = _PlotBridge(view)
+    channel = QWebChannel(page)
+    channel.registerObject("plot", bridge)
+    page.setWebChannel(channel)
+    view.plot_bridge = bridge
+    view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+    load_plot_page(view, source)
+    return view
+
+
+def _reset_plot_view(view):
+    view.plot_bridge.cleared.emit()
+
+
+def shared_web_view_pool(source="local"):
+    """The WebViewPool shared by every PlotWindow loading plotly.js from source (see PLOTLY_JS_SOURCES)."""
+    pool = _shared_web_view_pools.get(source)
+    if pool is None:
+        pool = WebViewPool(lambda: _create_plot_view(source), reset=_reset_plot_view)
+        _shared_web_view_pools[source] = pool
+    return pool
+
 
 class PlotWindow(QDialog):
-    def __init__(self, parent=None, settings_manager=None, var_name=None, plot_type=None, options=None, filepath=None):
+    def __init__(self, parent=None, settings_manager=None, var_name=None, plot_type=None, options=None, filepath=None,
+                 dataset_manager=None, web_view_pool=None):
         super().__init__(parent)
         self.setWindowTitle(f"Plot: {var_name}")
         self.settings_manager = settings_manager
+        self.dataset_manager = dataset_manager
         self.filepath = filepath
         self.var_name = var_name
         self.plot_type = plot_type
         self.options = options if options is not None else {}
         self.data_var = None # xarray DataArray for the current variable
         self.ds = None # xarray Dataset for the current file
-
-        self.browser = QWebEngineView()
-        self.browser.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._closed = False
+        self._plot_pixels = 1000
+        self._plot_height = 1000
+        self._series = None # (DecimatedSeries, axis 'x'/'y') of a decimated 1D trace, re-decimated on zoom
+        self._slice_stream = None # {'dim', 'plane', 'coords'} of a streamed 3D variable
+        self._figure = None # last figure shown, kept for export
+        self._payload = None # last figureReady payload, (re)sent whenever the page reports it is loaded
+
+        # Views come from a pool with the plot page already loaded, and go back to it on close,
+        # so opening a window does not start a new Chromium renderer process.
+        self._web_view_pool = web_view_pool if web_view_pool is not None else shared_web_view_pool(self._plotly_js_source())
+        self.browser = self._web_view_pool.acquire()
+        self._bridge = self.browser.plot_bridge
+        self._bridge.loaded.connect(self._on_page_loaded)
+        self._bridge.sliceRequested.connect(self._on_slice_requested)
+        self._bridge.relayoutChanged.connect(self._on_relayout)
         self.browser.customContextMenuRequested.connect(self._create_web_context_menu)
 
         layout = QVBoxLayout(self)
@@ -44,20 +299,53 @@ class PlotWindow(QDialog):
 
         logging.info(f"PlotWindow for '{var_name}' initialized.")
 
+    def _plotly_js_source(self):
+        source = self.settings_manager.get_app_setting('plotly_js_source', 'local') if self.settings_manager else 'local'
+        return source if source in PLOTLY_JS_SOURCES else 'local'
+
+    def _loader(self):
+        """The shared AsyncLoader, or None when work must run on the GUI thread."""
+        return self.dataset_manager.loader if self.dataset_manager is not None else None
+
     def _load_data_and_plot(self):
+        loader = self._loader()
+        if loader is None:
+            try:
+                self._on_data_loaded(self._open_data())
+            except Exception as e:
+                self._on_load_error(e)
+            return
+        loader.submit(self._open_data,
+                      description=f"'{os.path.basename(self.filepath)}' 불러오기",
+                      key=("plotly-open", id(self)),
+                      on_done=self._on_data_loaded,
+                      on_error=self._on_load_error)
+
+    def _open_data(self):
+        """Runs on a worker thread when an AsyncLoader is available."""
+        # Borrow the dataset from the DatasetManager handle pool so that several
+        # plot windows on the same file share one open handle.
+        # Without a DatasetManager, fall back to a private handle closed in closeEvent.
+        if self.dataset_manager is not None:
+            return self.dataset_manager.acquire_dataset(self.filepath)
+        return xr.open_dataset(self.filepath)
+
+    def _on_data_loaded(self, ds):
+        self.ds = ds
+        if self._closed:
+            # The window was closed while the file was opening.
+            self._release_data()
+            return
         try:
-            # Re-open the dataset to ensure it's available for this PlotWindow
-            # Or, better, DatasetManager should provide a way to get already open dataset
-            # For simplicity, for now, let's assume direct xarray load in this window.
-            # In a full application, pass the DatasetManager instance to PlotWindowManager,
-            # and then to PlotWindow, so it can use already opened datasets.
-            # For now, this will open the file again for each plot window.
-            self.ds = xr.open_dataset(self.filepath)
             self.data_var = self.ds[self.var_name]
-            self.plot_data()
-        except Exception as e:
-            QMessageBox.critical(self, "데이터 로드 오류", f"데이터를 로드하는 중 오류 발생:\\n{e}")
-            logging.error(f"PlotWindow data load error for {self.filepath}, {self.var_name}: {e}", exc_info=True)
+        except KeyError as e:
+            self._on_load_error(e)
+            return
+        self.plot_data()
+
+    def _on_load_error(self, error):
+        QMessageBox.critical(self, "데이터 로드 오류", f"데이터를 로드하는 중 오류 발생:\\n{error}")
+        logging.error(f"PlotWindow data load error for {self.filepath}, {self.var_name}: {error}")
 
 
     def _create_web_context_menu(self, pos):
@@ -68,13 +356,157 @@ class PlotWindow(QDialog):
         menu.exec(self.browser.mapToGlobal(pos))
 
     def plot_data(self):
+        """Build the figure (on a worker thread if possible) and show it when ready."""
         if self.data_var is None:
             logging.warning("No data_var to plot in PlotWindow.")
             return
 
+        self._plot_pixels = max(self.width(), 1) # read on the GUI thread; used for overlay level of detail
+        self._plot_height = max(self.height(), 1)
+        loader = self._loader()
+        if loader is None:
+            try:
+                result = self._build_payload()
+            except PlotBuildError as e:
+                self._on_plot_error(e)
+                return
+            self._show_figure(result)
+            return
+        loader.submit(self._build_payload,
+                      description=f"'{self.var_name}' 플롯 생성",
+                      key=("plotly", id(self)),
+                      on_done=self._show_figure,
+                      on_error=self._on_plot_error)
+
+    def _build_payload(self):
+        """
+        Build the figure and serialise it for the page (numeric arrays become base64 typed arrays).
+        Also returns the figure's series/slice-stream state, which _show_figure adopts on the GUI thread.
+        """
+        fig, state = self._build_figure()
+        slices = None
+        stream = state['slice_stream']
+        if stream is not None:
+            slices = {'max': len(stream['coords']) - 1, 'label': self._slice_label(0, stream)}
+        payload = '{"figure": ' + fig.to_json() + ', "slices": ' + json.dumps(slices, cls=PlotlyJSONEncoder) + '}'
+        return fig, payload, state
+
+    def _slice_label(self, index, stream):
+        return f"{stream['dim']}: {stream['coords'][index]}"
+
+    def _slice_cache(self):
+        return self.dataset_manager.slice_cache if self.dataset_manager is not None else None
+
+    def _read_slice(self, index, stream):
+        """Read one 2D slice of the streamed variable; dims other than the plane are fixed at 0."""
+        indexers = {stream['dim']: index}
+        slice_cache = self._slice_cache()
+        if slice_cache is None:
+            return load_slice(self.data_var, indexers, keep_dims=stream['plane'])
+        return slice_cache.read((self.filepath, self.var_name), self.data_var, indexers, stream['plane'])
+
+    def _slice_payload(self, index, stream):
+        return json.dumps({'z': _typed_array(self._read_slice(index, stream)), 'label': self._slice_label(index, stream)},
+                          cls=PlotlyJSONEncoder)
+
+    def _on_slice_requested(self, index):
+        """Send the requested slice to the page and prefetch ahead in the direction the slider moves."""
+        if self._slice_stream is None or self._closed:
+            return
+        stream = self._slice_stream
+        index = min(max(int(index), 0), len(stream['coords']) - 1)
+        loader = self._loader()
+        if loader is None:
+            self._bridge.sliceReady.emit(index, self._slice_payload(index, stream))
+        else:
+            loader.submit(self._slice_payload, index, stream,
+                          description=f"'{self.var_name}' 슬라이스 {index} 읽기",
+                          key=("plotly-slice", id(self)), # only the latest slider position matters
+                          on_done=lambda payload: self._send_slice(index, payload))
+        slice_cache = self._slice_cache()
+        if slice_cache is not None:
+            slice_cache.prefetch(loader, (self.filepath, self.var_name), self.data_var,
+                                 {stream['dim']: index}, stream['plane'], stream['dim'])
+
+    def _send_slice(self, index, payload):
+        if not self._closed:
+            self._bridge.sliceReady.emit(index, payload)
+
+    def _decimated(self, state, coord, values, axis='x'):
+        """Keep the full-resolution series in state for zooming and return the part drawn at the current pixel width."""
+        series = DecimatedSeries(coord, values)
+        state['series'] = (series, axis)
+        return series.view(pixels=self._plot_pixels)
+
+    def _on_relayout(self, event):
+        """Re-decimate the 1D trace from full resolution for the zoomed axis range."""
+        if self._series is None or self._closed:
+            return
+        series, axis = self._series
+        if event.get(f'{axis}axis.autorange'):
+            lo = hi = None
+        elif f'{axis}axis.range[0]' in event:
+            lo, hi = event[f'{axis}axis.range[0]'], event[f'{axis}axis.range[1]']
+        elif f'{axis}axis.range' in event:
+            lo, hi = event[f'{axis}axis.range']
+        else:
+            return
+        if np.issubdtype(series.coord.dtype, np.datetime64) and lo is not None:
+            # Plotly reports date ranges as 'YYYY-MM-DD hh:mm:ss.sss' strings.
+            lo, hi = (np.datetime64(str(v).replace(' ', 'T')) for v in (lo, hi))
+        pixels = max(self.width(), 1)
+        loader = self._loader()
+        if loader is None:
+            self._apply_series_view(series.view(lo, hi, pixels), axis)
+            return
+        loader.submit(series.view, lo, hi, pixels,
+                      description=f"'{self.var_name}' 확대 구간 다시 그리기",
+                      key=("plotly-series", id(self)),
+                      on_done=lambda view: self._apply_series_view(view, axis))
+
+    def _apply_series_view(self, view, axis):
+        if self._closed:
+            return
+        coord, values = view
+        x, y = (coord, values) if axis == 'x' else (values, coord)
+        self._bridge.traceReady.emit(json.dumps({'x': [_typed_array(x)], 'y': [_typed_array(y)]}, cls=PlotlyJSONEncoder))
+
+    def _show_figure(self, result):
+        if self._closed:
+            return
+        self._figure, self._payload, state = result
+        # Assigned here rather than in _build_figure so a rebuild in flight never resets them under the
+        # slice/zoom slots, which read them on this thread.
+        self._series = state['series']
+        self._slice_stream = state['slice_stream']
+        if self._bridge.ready:
+            self._bridge.figureReady.emit(self._payload)
+        logging.info(f"Plot for '{self.var_name}' displayed successfully.")
+
+    def _on_page_loaded(self):
+        """The page's channel is connected; send the figure built while it was loading (or before a reload)."""
+        if self._payload is not None and not self._closed:
+            self._bridge.figureReady.emit(self._payload)
+
+    def _on_plot_error(self, error):
+        if self._closed:
+            return
+        if isinstance(error, PlotBuildError):
+            QMessageBox.warning(self, "플롯 오류", str(error))
+        else:
+            QMessageBox.critical(self, "플롯 오류", f"플롯 생성 중 오류 발생:\\n{error}")
+            logging.error(f"PlotWindow plot build error for {self.var_name}: {error}")
+
+    def _build_figure(self):
+        """
+        Build the Plotly figure for the current variable and options.
+        Runs on a worker thread, so it must not touch widgets or window state; problems are raised as
+        PlotBuildError. Returns (figure, {'series', 'slice_stream'}) for the GUI thread to adopt.
+        """
         fig = go.Figure()
         dims = self.data_var.dims
-        data_values = self.data_var.values
+        # Each branch below reads only the slice it draws (see load_slice), so lazily
+        # opened (dask-backed) variables are never pulled into memory in full.
 
         # Get default plot options from settings if not explicitly provided
         default_plot_options = self.settings_manager.get_default_plot_options() if self.settings_manager else {}
@@ -89,55 +521,42 @@ class PlotWindow(QDialog):
         cmap_name = current_options.get('cmap', 'jet')
         colorscale = get_colormap(cmap_name)
 
+        state = {'series': None, 'slice_stream': None}
         if self.plot_type == "1D_time_series" and 'time' in dims:
-            x_data = self.data_var['time'].values
-            fig.add_trace(go.Scatter(x=x_data, y=data_values, mode='lines+markers', name=self.var_name))
+            data_values = load_slice(self.data_var, keep_dims=('time',))
+            x_data, data_values = self._decimated(state, self.data_var['time'].values, data_values)
+            fig.add_trace(self._line_trace(current_options, state, x=x_data, y=data_values, mode='lines+markers', name=self.var_name))
             fig.update_layout(xaxis_title=xaxis_label, yaxis_title=yaxis_label)
         elif self.plot_type == "1D_profile" and ('depth' in dims or 'pressure' in dims):
-            x_data = data_values
-            y_data = self.data_var['depth'].values if 'depth' in dims else self.data_var['pressure'].values
-            fig.add_trace(go.Scatter(x=x_data, y=y_data, mode='lines+markers', name=self.var_name))
+            profile_dim = 'depth' if 'depth' in dims else 'pressure'
+            x_data = load_slice(self.data_var, keep_dims=(profile_dim,))
+            y_data, x_data = self._decimated(state, self.data_var[profile_dim].values, x_data, axis='y')
+            fig.add_trace(self._line_trace(current_options, state, x=x_data, y=y_data, mode='lines+markers', name=self.var_name))
             fig.update_layout(xaxis_title=xaxis_label, yaxis_title=yaxis_label, yaxis_autorange="reversed")
+        elif self.plot_type == "2D_map" and self.data_var.ndim == 1 and 'lat' in self.data_var.coords and 'lon' in self.data_var.coords:
+            # Scattered points (stations, tracks) located by lat/lon coordinates rather than a grid.
+            self._add_point_map(fig, load_slice(self.data_var), colorscale, cbar_label, current_options)
+            return fig, state
         elif self.plot_type == "2D_map" and 'lat' in dims and 'lon' in dims:
-            lat_data = self.data_var['lat'].values
-            lon_data = self.data_var['lon'].values
-
-            if self.data_var.ndim > 2:
-                slice_dim = [d for d in dims if d not in ['lat', 'lon']]
-                if slice_dim:
-                    data_values = self.data_var.isel({slice_dim[0]: 0}).values
-                else:
-                    data_values = self.data_var.squeeze().values
-
-            if self.data_var.ndim == 1 and 'lat' in self.data_var.coords and 'lon' in self.data_var.coords:
-                fig.add_trace(go.Scattergeo(
-                    lat=self.data_var['lat'].values,
-                    lon=self.data_var['lon'].values,
-                    mode='markers',
-                    marker=dict(
-                        color=data_values,
-                        colorscale=colorscale,
-                        cmin=np.nanmin(data_values),
-                        cmax=np.nanmax(data_values),
-                        colorbar=dict(title=cbar_label)
-                    ),
-                    name=self.var_name
-                ))
-                fig.update_layout(geo_scope='world')
-                html = pio.to_html(fig, include_plotlyjs='cdn')
-                self.browser.setHtml(html)
-                return
+            # Extra dims (e.g. time/depth) are fixed at their first index.
+            coords, data_values = self._load_field(('lat', 'lon'))
+            lat_data, lon_data = coords['lat'], coords['lon']
 
-            fig.add_trace(go.Heatmap(
-                x=lon_data, y=lat_data, z=data_values,
-                colorscale=colorscale,
-                colorbar=dict(title=cbar_label)
-            ))
+            if not self._add_raster(fig, lon_data, lat_data, data_values, current_options, cbar_label, y_reversed=True):
+                fig.add_trace(go.Heatmap(
+                    x=lon_data, y=lat_data, z=data_values,
+                    colorscale=colorscale,
+                    colorbar=dict(title=cbar_label)
+                ))
             fig.update_layout(xaxis_title=xaxis_label, yaxis_title=yaxis_label)
             fig.update_yaxes(autorange="reversed")
 
+            lon_range = [float(np.nanmin(lon_data)), float(np.nanmax(lon_data))]
+            lat_range = [float(np.nanmin(lat_data)), float(np.nanmax(lat_data))]
             for overlay_filename in self.settings_manager.get_active_overlays():
-                overlay_traces = get_overlay_traces(overlay_filename)
+                # Simplify and clip the overlay to the plotted extent at the window's pixel width.
+                overlay_traces = get_overlay_traces(overlay_filename, lon_range=lon_range, lat_range=lat_range,
+                                                    pixels=self._plot_pixels)
                 for trace in overlay_traces:
                     fig.add_trace(trace)
 
@@ -149,19 +568,18 @@ class PlotWindow(QDialog):
 
         elif self.plot_type == "2D_section" and len(dims) == 2:
             x_dim, y_dim = dims[0], dims[1]
-            x_data = self.data_var[x_dim].values
-            y_data = self.data_var[y_dim].values
+            coords, data_values = self._load_field((x_dim, y_dim))
+            x_data, y_data = coords[x_dim], coords[y_dim]
+            y_reversed = 'depth' in y_dim.lower() or 'pressure' in y_dim.lower()
 
-            if self.data_var.ndim > 2:
-                data_values = self.data_var.squeeze().values
-
-            fig.add_trace(go.Heatmap(
-                x=x_data, y=y_data, z=data_values,
-                colorscale=colorscale,
-                colorbar=dict(title=cbar_label)
-            ))
+            if not self._add_raster(fig, x_data, y_data, data_values, current_options, cbar_label, y_reversed=y_reversed):
+                fig.add_trace(go.Heatmap(
+                    x=x_data, y=y_data, z=data_values,
+                    colorscale=colorscale,
+                    colorbar=dict(title=cbar_label)
+                ))
             fig.update_layout(xaxis_title=xaxis_label, yaxis_title=yaxis_label)
-            if 'depth' in y_dim.lower() or 'pressure' in y_dim.lower():
+            if y_reversed:
                 fig.update_yaxes(autorange="reversed")
         elif self.plot_type == "3D_time_map" or self.plot_type == "3D_depth_map" or self.plot_type == "3D_time_section" or self.plot_type == "3D_generic":
             if len(dims) >= 3:
@@ -174,91 +592,56 @@ class PlotWindow(QDialog):
                     slice_dim = dims[0]
 
                 if slice_dim and slice_dim in self.data_var.coords:
-                    slice_coords = self.data_var[slice_dim].values
-
-                    frames = []
-                    buttons = []
-                    max_slices_for_buttons = min(len(slice_coords), 50)
-
-                    for i in range(max_slices_for_buttons):
-                        sliced_data_var = self.data_var.isel({slice_dim: i})
-                        if len(sliced_data_var.dims) == 2:
-                            if 'lat' in sliced_data_var.dims and 'lon' in sliced_data_var.dims:
-                                x_data = sliced_data_var['lon'].values
-                                y_data = sliced_data_var['lat'].values
-                                z_data = sliced_data_var.values
-                                frame_trace = go.Heatmap(x=x_data, y=y_data, z=z_data, colorscale=colorscale,
-                                                         colorbar=dict(title=cbar_label))
-                                frame_name = f"{slice_dim}={slice_coords[i]}"
-                                frames.append(go.Frame(data=[frame_trace], name=frame_name))
-                                buttons.append(dict(label=str(slice_coords[i]),
-                                                    method="animate",
-                                                    args=[[frame_name], {"mode": "immediate", "frame": {"redraw": True, "duration": 0}, "transition": {"duration": 0}}]))
-                            elif len(sliced_data_var.dims) == 2:
-                                x_data = sliced_data_var[sliced_data_var.dims[0]].values
-                                y_data = sliced_data_var[sliced_data_var.dims[1]].values
-                                z_data = sliced_data_var.values
-                                frame_trace = go.Heatmap(x=x_data, y=y_data, z=z_data, colorscale=colorscale,
-                                                         colorbar=dict(title=cbar_label))
-                                frame_name = f"{slice_dim}={slice_coords[i]}"
-                                frames.append(go.Frame(data=[frame_trace], name=frame_name))
-                                buttons.append(dict(label=str(slice_coords[i]),
-                                                    method="animate",
-                                                    args=[[frame_name], {"mode": "immediate", "frame": {"redraw": True, "duration": 0}, "transition": {"duration": 0}}]))
-                                if 'depth' in sliced_data_var.dims[1].lower() or 'pressure' in sliced_data_var.dims[1].lower():
-                                    fig.update_yaxes(autorange="reversed")
-
-                    if frames:
-                        fig.frames = frames
-                        sliders = [dict(
-                            steps=[dict(method='animate',
-                                        args=[[f.name], dict(mode='immediate', frame=dict(redraw=True, duration=0), transition=dict(duration=0))],
-                                        label=f.name.split('=')[-1]) for f in fig.frames],
-                            transition=dict(duration=0),
-                            x=0.1,
-                            len=0.9,
-                            currentvalue=dict(font=dict(size=12), prefix=f"{slice_dim}: ", xanchor='right'),
-                            yanchor='top'
-                        )]
-                        fig.update_layout(sliders=sliders)
-                        if frames:
-                            fig.add_trace(frames[0].data[0])
-                        if len(dims) >= 2:
-                            fig.update_layout(xaxis_title=dims[0], yaxis_title=dims[1])
+                    # Streaming slice mode: the page holds only the current slice and requests others
+                    # over the QWebChannel bridge as its slider moves (see _on_slice_requested).
+                    other_dims = [d for d in dims if d != slice_dim]
+                    is_map = 'lat' in other_dims and 'lon' in other_dims
+                    plane_dims = ('lat', 'lon') if is_map else tuple(other_dims[:2])
+                    stream = state['slice_stream'] = {'dim': slice_dim, 'plane': plane_dims,
+                                                      'coords': self.data_var[slice_dim].values}
+                    if is_map:
+                        x_data, y_data = self.data_var['lon'].values, self.data_var['lat'].values
+                    else:
+                        x_data, y_data = self.data_var[plane_dims[0]].values, self.data_var[plane_dims[1]].values
+                    fig.add_trace(go.Heatmap(x=x_data, y=y_data, z=self._read_slice(0, stream), colorscale=colorscale,
+                                             colorbar=dict(title=cbar_label)))
+                    if not is_map and ('depth' in plane_dims[1].lower() or 'pressure' in plane_dims[1].lower()):
+                        fig.update_yaxes(autorange="reversed")
+                    fig.update_layout(xaxis_title=dims[0], yaxis_title=dims[1])
             else:
-                QMessageBox.warning(self, "플롯 오류", f"3D 변수 '{self.var_name}'에 대한 슬라이스를 생성할 수 없습니다.")
                 logging.warning(f"Could not create slices for 3D variable {self.var_name}.")
-                return
+                raise PlotBuildError(f"3D 변수 '{self.var_name}'에 대한 슬라이스를 생성할 수 없습니다.")
 
         elif self.plot_type == "1D_generic":
+            data_values = load_slice(self.data_var, keep_dims=dims[:1])
             x_data = np.arange(len(data_values))
             if len(dims) > 0:
                 try:
                     x_data = self.data_var[dims[0]].values
                 except KeyError:
                     pass
-            fig.add_trace(go.Scatter(x=x_data, y=data_values, mode='lines+markers', name=self.var_name))
+            x_data, data_values = self._decimated(state, x_data, data_values)
+            fig.add_trace(self._line_trace(current_options, state, x=x_data, y=data_values, mode='lines+markers', name=self.var_name))
             fig.update_layout(xaxis_title=xaxis_label, yaxis_title=yaxis_label)
 
         elif self.plot_type == "2D_generic":
             if len(dims) == 2:
-                x_data = self.data_var[dims[0]].values
-                y_data = self.data_var[dims[1]].values
-                fig.add_trace(go.Heatmap(
-                    x=x_data, y=y_data, z=data_values,
-                    colorscale=colorscale,
-                    colorbar=dict(title=cbar_label)
-                ))
+                coords, data_values = self._load_field(dims[:2])
+                x_data, y_data = coords[dims[0]], coords[dims[1]]
+                if not self._add_raster(fig, x_data, y_data, data_values, current_options, cbar_label):
+                    fig.add_trace(go.Heatmap(
+                        x=x_data, y=y_data, z=data_values,
+                        colorscale=colorscale,
+                        colorbar=dict(title=cbar_label)
+                    ))
                 fig.update_layout(xaxis_title=xaxis_label, yaxis_title=yaxis_label)
             else:
-                QMessageBox.warning(self, "플롯 오류", f"2D 변수 '{self.var_name}' 플롯에 실패했습니다. 차원: {dims}")
                 logging.warning(f"Failed to plot 2D variable {self.var_name}. Dims: {dims}")
-                return
+                raise PlotBuildError(f"2D 변수 '{self.var_name}' 플롯에 실패했습니다. 차원: {dims}")
 
         else:
-            QMessageBox.warning(self, "플롯 오류", f"플롯 유형 '{self.plot_type}'을(를) 처리할 수 없습니다.")
             logging.warning(f"Unhandled plot type: {self.plot_type} for variable {self.var_name}.")
-            return
+            raise PlotBuildError(f"플롯 유형 '{self.plot_type}'을(를) 처리할 수 없습니다.")
 
         fig.update_layout(
             title=title_text,
@@ -272,25 +655,162 @@ class PlotWindow(QDialog):
             hovermode="closest",
             template="plotly_white" if self.settings_manager.get_app_setting('theme') != 'dark' else "plotly_dark"
         )
-        html = pio.to_html(fig, include_plotlyjs='cdn')
-        self.browser.setHtml(html)
-        logging.info(f"Plot for '{self.var_name}' displayed successfully.")
+        return fig, state
+
+    def _webgl_threshold(self, current_options):
+        return current_options.get('webgl_threshold') or DEFAULT_WEBGL_THRESHOLD
+
+    def _line_trace(self, current_options, state, **kwargs):
+        """
+        Trace for a decimated 1D series. Series of webgl_threshold points or more (at full resolution)
+        use Scattergl so zooming, which restyles the trace with a re-decimated view, stays off the SVG DOM.
+        """
+        n_points = len(state['series'][0]) if state['series'] is not None else len(kwargs['x'])
+        trace_class = go.Scattergl if n_points >= self._webgl_threshold(current_options) else go.Scatter
+        return trace_class(**kwargs)
+
+    def _add_point_map(self, fig, values, colorscale, cbar_label, current_options):
+        """
+        Draw scattered lat/lon points. Small sets use Scattergeo; from webgl_threshold points on they are
+        thinned to that many points and drawn with the WebGL Scattermap on a tile-free ('white-bg') map.
+        """
+        lat = np.asarray(self.data_var['lat'].values)
+        lon = np.asarray(self.data_var['lon'].values)
+        values = np.asarray(np.ma.filled(values, np.nan) if np.ma.isMaskedArray(values) else values, dtype=np.float64)
+        marker = dict(color=values, colorscale=colorscale, cmin=np.nanmin(values), cmax=np.nanmax(values),
+                      colorbar=dict(title=cbar_label))
+        threshold = self._webgl_threshold(current_options)
+        if len(values) < threshold:
+            fig.add_trace(go.Scattergeo(lat=lat, lon=lon, mode='markers', marker=marker, name=self.var_name))
+            fig.update_layout(geo_scope='world')
+            return
+        keep = thin_indices(values, threshold)
+        logging.debug(f"Thinned {len(values)} map points to {len(keep)} for Scattermap.")
+        marker['color'] = values[keep]
+        fig.add_trace(go.Scattermap(lat=lat[keep], lon=lon[keep], mode='markers', marker=marker, name=self.var_name))
+        fig.update_layout(map=dict(style='white-bg',
+                                   center=dict(lat=float(np.nanmean(lat)), lon=float(np.nanmean(lon))), zoom=1))
+
+    def _load_field(self, keep_dims):
+        """
+        Read the 2D slice over keep_dims (other dims fixed at index 0) as ({dim: coords}, values).
+        Large variables come from the coarsest pyramid level that still covers the window size.
+        """
+        row_dim, col_dim = [dim for dim in self.data_var.dims if dim in keep_dims]
+        pyramid_cache = self.dataset_manager.pyramid_cache if self.dataset_manager is not None else None
+        if pyramid_cache is not None:
+            pyramid = pyramid_cache.get(self.filepath, self.var_name, self.data_var, row_dim, col_dim)
+            level = pyramid.select(self._plot_height, self._plot_pixels) if pyramid is not None else None
+            if level is not None:
+                return {row_dim: level.rows, col_dim: level.cols}, level.values
+        coords = {row_dim: self.data_var[row_dim].values, col_dim: self.data_var[col_dim].values}
+        return coords, load_slice(self.data_var, keep_dims=keep_dims)
+
+    def _add_raster(self, fig, x_data, y_data, z_values, current_options, cbar_label, y_reversed=False):
+        """
+        Draw a large 2D field as one colormapped PNG layout image instead of a Heatmap z matrix.
+        A marker-only scatter spanning the extent carries the colorbar and drives autorange.
+        Returns False (nothing added) when the field should stay a Heatmap.
+        """
+        x_data = np.asarray(x_data)
+        y_data = np.asarray(y_data)
+        if np.issubdtype(x_data.dtype, np.datetime64) or np.issubdtype(y_data.dtype, np.datetime64):
+            return False # Layout images need numeric axes.
+        if not should_rasterize(np.shape(z_values), x_data, y_data, current_options.get('render_mode', 'auto'),
+                                current_options.get('raster_threshold')):
+            return False
+
+        cmap_name = current_options.get('cmap', 'jet')
+        # No point shipping more pixels than the view can show.
+        raster = rasterize(x_data, y_data, z_values, cmap_name, current_options.get('vmin'), current_options.get('vmax'),
+                           max_size=min(RASTER_MAX_SIZE, 2 * self._plot_pixels))
+        x0, x1 = (float(v) for v in raster['x_extent'])
+        y0, y1 = (float(v) for v in raster['y_extent'])
+        # Rows come back bottom-up; the image is anchored at the top edge of the screen,
+        # which is y1 on a normal axis and y0 on a reversed one.
+        rgba = raster['rgba'] if y_reversed else raster['rgba'][::-1]
+        fig.add_layout_image(
+            source=png_data_uri(rgba), xref="x", yref="y",
+            x=x0, y=y0 if y_reversed else y1, sizex=x1 - x0, sizey=y1 - y0,
+            xanchor="left", yanchor="top", sizing="stretch", layer="below"
+        )
+        fig.add_trace(go.Scatter(
+            x=[x0, x1], y=[y0, y1], mode='markers', hoverinfo='skip', showlegend=False,
+            marker=dict(
+                opacity=0, color=[raster['vmin'], raster['vmax']],
+                colorscale=get_colormap(cmap_name), cmin=raster['vmin'], cmax=raster['vmax'],
+                showscale=True, colorbar=dict(title=cbar_label)
+            ),
+            name=self.var_name
+        ))
+        fig.update_xaxes(showgrid=False)
+        fig.update_yaxes(showgrid=False)
+        return True
 
     def get_current_plot_options(self):
         return self.options
 
+    def closeEvent(self, event):
+        self._shutdown()
+        super().closeEvent(event)
+
+    def done(self, result):
+        # Esc and reject()/accept() hide the dialog through done() without a closeEvent.
+        self._shutdown()
+        super().done(result)
+
+    def _shutdown(self):
+        """Cancel pending work and hand the pooled view and dataset handle back. Runs once per window."""
+        if self._closed:
+            return
+        self._closed = True
+        loader = self._loader()
+        if loader is not None:
+            loader.cancel_key(("plotly", id(self)))
+            loader.cancel_key(("plotly-series", id(self)))
+            loader.cancel_key(("plotly-slice", id(self)))
+        self._release_view()
+        self._release_data()
+
+    def _release_view(self):
+        """Disconnect from the pooled view and hand it back for the next window."""
+        if self.browser is None:
+            return
+        self._bridge.loaded.disconnect(self._on_page_loaded)
+        self._bridge.sliceRequested.disconnect(self._on_slice_requested)
+        self._bridge.relayoutChanged.disconnect(self._on_relayout)
+        self.browser.customContextMenuRequested.disconnect(self._create_web_context_menu)
+        self.layout().removeWidget(self.browser)
+        self._web_view_pool.release(self.browser)
+        self.browser = None
+
+    def _release_data(self):
+        """Return the dataset handle to the pool (or close the private handle)."""
+        if self.ds is not None:
+            if self.dataset_manager is not None:
+                self.dataset_manager.release_dataset(self.filepath)
+            else:
+                self.ds.close()
+            self.ds = None
+            self.data_var = None
+
     def update_plot_options(self, new_options):
         self.options.update(new_options)
         self.plot_data()
         logging.info(f"Plot options updated for '{self.var_name}'.")
 
     def export_plot(self):
-        file_name, _ = QMessageBox.getSaveFileName(self, "플롯 내보내기", f"{self.var_name}_plot.html", "HTML Files (*.html)")
+        if self._figure is None:
+            return
+        file_name, _ = QFileDialog.getSaveFileName(self, "플롯 내보내기", f"{self.var_name}_plot.html", "HTML Files (*.html)")
         if file_name:
             try:
-                # Get the current HTML content from the QWebEngineView page
-                self.browser.page().toHtml(lambda html_content: self._save_html_content(file_name, html_content))
-                logging.info(f"Plot export initiated for {self.var_name} to {file_name}")
+                # The page only holds the data pushed to it, so write the figure out as a standalone document.
+                # In local mode plotly.js is embedded so the file also opens offline.
+                include_plotlyjs = 'cdn' if self._plotly_js_source() == 'cdn' else True
+                self._save_html_content(file_name, pio.to_html(self._figure, include_plotlyjs=include_plotlyjs,
+                                                               div_id=PLOT_DIV_ID))
+                logging.info(f"Plot exported for {self.var_name} to {file_name}")
             except Exception as e:
                 QMessageBox.critical(self, "내보내기 오류", f"플롯 내보내기 중 오류 발생:\\n{e}")
                 logging.error(f"Error exporting plot: {e}", exc_info=True)
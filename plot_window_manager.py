@@ -2,7 +2,12 @@
 
 import logging
 from PyQt6.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QMessageBox, QFileDialog
+from PyQt6.QtCore import QTimer
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from matplotlib.artist import Artist
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize, LogNorm
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 import xarray as xr
@@ -14,7 +19,17 @@ logger = logging.getLogger(__name__)
 
 # MainPanel이나 PlotHandler에서 DatasetManager와 PlotWindowManager를 임포트할 때
 # 상위 디렉토리에서 임포트하므로 . 대신 ..을 사용합니다.
-from .dataset_manager import DatasetManager
+from .dataset_manager import DatasetManager, load_slice
+from .handlers.file_handler import split_variable_path
+from .handlers.overlay_handler import load_overlay, get_overlay_line_collection
+from .handlers.colorbar_handler import get_mpl_colormap
+from .handlers.raster_handler import should_rasterize, rasterize
+from .handlers.decimation_handler import DEFAULT_PLOT_PIXELS, DecimatedSeries
+from .handlers.refinement_handler import REFINE_DELAY_MS, REFINED_ZORDER, ViewRefiner
+from .handlers.option_change_handler import (OPTION_CHANGE_NONE, OPTION_CHANGE_STYLE, OPTION_CHANGE_DATA,
+                                             classify_option_change)
+
+SERIES_UPDATE_DELAY_MS = 50 # 확대/이동 중 연속된 축 범위 변경을 모아 한 번만 다시 줄입니다.
 
 class PlotWindow(QMainWindow):
     """
@@ -29,9 +44,29 @@ class PlotWindow(QMainWindow):
         self.dataset_manager = dataset_manager
         self.file_path = file_path
         self.variable_name = variable_name
+        # 하위 그룹 변수는 '/그룹/변수' 경로로 전달되며, 해당 그룹의 데이터셋을 빌려옵니다.
+        self.group, self.dataset_variable = split_variable_path(variable_name)
         self.plot_type = plot_type
         self.options = options # 플롯 옵션 저장
         self.update_status_bar_callback = update_status_bar_callback
+        self.dataset = None # 핸들 풀에서 빌려온 데이터셋 (창이 닫힐 때 반환)
+        self._plot_pixels = DEFAULT_PLOT_PIXELS # 1D 데이터를 줄일 캔버스 너비 (GUI 스레드에서 갱신)
+        self._plot_height = DEFAULT_PLOT_PIXELS # 2D 개요를 읽을 캔버스 높이
+        self._series = None # (Line2D, DecimatedSeries, 축 'x'/'y') 확대 시 전체 해상도에서 다시 줄이는 선
+        self._refine = None # 2D 플롯의 확대 구간 다시 읽기 상태 (ViewRefiner, 컬러맵, 범위 등)
+        self._refined_artist = None # 개요 위에 그린 확대 구간의 이미지/메쉬
+        self._last_read = None # 마지막으로 그린 플롯의 (indexers, keep_dims), 이웃 슬라이스 미리 읽기용 (GUI 스레드)
+        self._artist = None # 현재 데이터를 그린 Line2D/QuadMesh/AxesImage (제자리 갱신 대상)
+        self._mappable = None # 컬러바에 연결된 mappable (래스터는 별도의 ScalarMappable)
+        self._colorbar = None # 창마다 하나만 유지하는 컬러바
+        self._grid = None # 제자리 갱신 판단용 격자: mesh는 (x, y, z 모양), raster는 (x 범위, y 범위)
+        self._field = None # raster 개요의 (x, y, z), 색 옵션 변경 시 다시 색을 입히는 데 사용
+        self._kind = None # 현재 그려진 데이터 종류 ('line', 'profile', 'mesh', 'raster', 'image')
+        self._data_labels = {} # 데이터에서 정해진 축 레이블 (1D의 'Time', 'Depth' 등)
+        self._render_key_value = None
+        self._view_cids = [] # 축 범위 변경 콜백 id (제자리 갱신 때 중복 연결하지 않도록)
+        self._drawn = False # 캔버스가 한 번 이상 그려졌는지 (blit 가능 여부)
+        # 데이터셋은 파일 열기가 GUI를 멈추지 않도록 첫 새로고침 작업 안에서 빌려옵니다 (_read_plot_data).
         
         self.setWindowTitle(title)
         self.setGeometry(100, 100, 800, 600)
@@ -46,155 +81,702 @@ class PlotWindow(QMainWindow):
         self.layout = QVBoxLayout(self.central_widget)
 
         self.figure, self.ax = plt.subplots(figsize=(10, 6)) # Figure size for better resolution
+        self._ax_subplotspec = self.ax.get_subplotspec() # 컬러바를 없앨 때 축 크기를 되돌리기 위해 보관
         self.canvas = FigureCanvas(self.figure)
         self.layout.addWidget(self.canvas)
 
         self.toolbar = NavigationToolbar(self.canvas, self)
         self.layout.addWidget(self.toolbar)
+
+        self.canvas.mpl_connect('key_press_event', self._on_key_press) # PageUp/PageDown: 시간/깊이 슬라이스 이동
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self._view_timer = QTimer(self) # 축 범위 변경이 잠잠해지면 _on_view_changed 호출
+        self._view_timer.setSingleShot(True)
+        self._view_timer.timeout.connect(self._on_view_changed)
         logger.debug("PlotWindow UI 설정 완료.")
 
+    def _acquire_dataset(self):
+        """DatasetManager의 핸들 풀에서 이 창이 사용할 데이터셋을 빌려옵니다 (작업 스레드). 실패하면 None."""
+        try:
+            return self.dataset_manager.acquire_dataset(self.file_path, self.group)
+        except (FileNotFoundError, IOError) as e:
+            logger.error(f"PlotWindow: 데이터셋을 가져올 수 없습니다. File: {self.file_path}, {e}")
+            return None
+
+    def _adopt_dataset(self, dataset):
+        """작업 스레드에서 빌려온 데이터셋을 창에 연결합니다 (GUI 스레드). 이미 있으면 중복으로 빌린 참조를 반환합니다."""
+        if dataset is None:
+            return
+        if self.dataset is None:
+            self.dataset = dataset
+        else:
+            self.dataset_manager.release_dataset(self.file_path, self.group)
+
+    def _release_dataset(self):
+        if self.dataset is not None:
+            self.dataset_manager.release_dataset(self.file_path, self.group)
+            self.dataset = None
+
     def refresh_plot(self):
         """
         현재 설정된 변수와 옵션을 사용하여 플롯을 새로 그립니다.
+        데이터 읽기는 AsyncLoader의 작업 스레드에서 수행하고, 결과가 도착하면 GUI 스레드에서 그립니다.
+        """
+        self._plot_pixels = max(self.canvas.width(), 1) # 작업 스레드에서는 위젯을 읽지 않도록 미리 저장
+        self._plot_height = max(self.canvas.height(), 1)
+        loader = self.dataset_manager.loader
+        if loader is None:
+            self._on_plot_data(self._read_plot_data())
+            return
+        loader.submit(
+            self._read_plot_data,
+            description=f"'{self.variable_name}' 데이터 읽기",
+            key=("plot", self.plot_id), # 같은 창의 이전 새로고침은 취소
+            on_done=self._on_plot_data,
+            on_error=lambda e: self._display_error_message(f"데이터 읽기 오류: {e}"),
+            on_cancel=self._discard_plot_data, # 창이 닫혔거나 새로고침이 대체됨
+        )
+
+    def _on_plot_data(self, data):
+        self._adopt_dataset(data.pop('dataset', None))
+        if 'slice' in data:
+            self._last_read = data.pop('slice') # 작업 스레드는 창 상태를 바꾸지 않고 결과로만 넘깁니다.
+        self._render_plot(data)
+
+    def _discard_plot_data(self, data):
+        """취소된 새로고침이 빌려온 데이터셋을 반환합니다."""
+        if data.get('dataset') is not None:
+            self.dataset_manager.release_dataset(self.file_path, self.group)
+
+    def _read_plot_data(self) -> dict:
+        """
+        작업 스레드에서 실행: 창에 아직 데이터셋이 없으면 핸들 풀에서 빌려온 뒤 그릴 데이터를 읽습니다.
+        새로 빌려온 데이터셋은 결과의 'dataset'으로 넘겨 GUI 스레드에서 창에 연결합니다.
+        """
+        dataset = self.dataset
+        if dataset is not None:
+            return self._read_variable_data(dataset)
+        dataset = self._acquire_dataset()
+        try:
+            data = self._read_variable_data(dataset)
+        except Exception:
+            if dataset is not None:
+                self.dataset_manager.release_dataset(self.file_path, self.group)
+            raise
+        data['dataset'] = dataset
+        return data
+
+    def _read_variable_data(self, dataset) -> dict:
+        """
+        플롯 유형에 맞게 그릴 데이터만 읽어 dict로 반환합니다.
+        작업 스레드에서 실행되므로 Qt/Matplotlib 객체는 건드리지 않으며, 오류는 {'error': 메시지}로 반환합니다.
+        읽은 위치는 'slice'(indexers, keep_dims)로 넘겨 GUI 스레드에서 _last_read에 기록합니다.
         """
-        self.ax.clear()
-        
-        dataset = self.dataset_manager.get_dataset(self.file_path)
         if not dataset:
-            self._display_error_message("데이터셋을 찾을 수 없습니다.")
             logger.warning(f"PlotWindow: 데이터셋을 찾을 수 없어 플롯 새로고침 실패. File: {self.file_path}")
-            return
+            return {'error': "데이터셋을 찾을 수 없습니다."}
 
-        if self.variable_name not in dataset.data_vars and self.variable_name not in dataset.coords:
-            self._display_error_message(f"변수 '{self.variable_name}'를 찾을 수 없습니다.")
+        if self.dataset_variable not in dataset.data_vars and self.dataset_variable not in dataset.coords:
             logger.warning(f"PlotWindow: 변수 '{self.variable_name}'를 찾을 수 없어 플롯 새로고침 실패. File: {self.file_path}")
-            return
-        
-        variable = dataset[self.variable_name]
-        
-        # 공통 옵션 적용
-        title = self.options.get('title', self.variable_name)
-        xlabel = self.options.get('xlabel', 'X-axis')
-        ylabel = self.options.get('ylabel', 'Y-axis')
-        zlabel = self.options.get('colorbar_label', self.variable_name) # 2D 플롯의 값 축 레이블
-        grid = self.options.get('grid', True)
-        cmap = self.options.get('cmap', 'viridis')
-        vmin = self.options.get('vmin')
-        vmax = self.options.get('vmax')
-        log_scale = self.options.get('log_scale', False)
-        time_format = self.options.get('time_format', '%Y-%m-%d %H:%M')
+            return {'error': f"변수 '{self.variable_name}'를 찾을 수 없습니다."}
+
+        variable = dataset[self.dataset_variable]
 
         # 플롯 타입에 따른 로직 분기
         if self.plot_type == "time_series" or self.plot_type == "1d_generic":
             # 1D 데이터 플롯 (시간 또는 일반 1D)
-            x_data = None
+            keep_dims = ('time',) if 'time' in variable.dims else variable.dims[:1]
+            y_values = self._read(variable, keep_dims=keep_dims) # 그릴 1D 데이터만 읽기
+            read = (self._slice_indexers(variable, keep_dims), keep_dims)
             if 'time' in variable.dims and 'time' in dataset.coords:
                 x_data = dataset['time'].values
-                if len(x_data) != len(variable.values):
-                     x_data = np.arange(len(variable.values)) # 길이가 다르면 인덱스 사용
-                     xlabel = 'Index'
-                else:
-                    xlabel = 'Time'
-                    self.figure.autofmt_xdate() # 시간 축 레이블 회전
-            else:
-                x_data = np.arange(len(variable.values))
-                xlabel = 'Index'
-            
-            self.ax.plot(x_data, variable.values)
-            self.ax.set_title(title)
-            self.ax.set_xlabel(xlabel)
-            self.ax.set_ylabel(ylabel)
-            self.ax.grid(grid)
+                if len(x_data) != len(y_values):
+                    return self._line_data('line', np.arange(len(y_values)), y_values, xlabel='Index', slice=read) # 길이가 다르면 인덱스 사용
+                return self._line_data('line', x_data, y_values, xlabel='Time', time_axis=True, slice=read)
+            return self._line_data('line', np.arange(len(y_values)), y_values, xlabel='Index', slice=read)
 
         elif self.plot_type == "profile":
             # 1D 프로파일 플롯 (깊이 vs 값)
             if 'depth' in variable.dims and 'depth' in dataset.coords:
+                x_values = self._read(variable, keep_dims=('depth',))
                 y_data = dataset['depth'].values
-                if len(y_data) != len(variable.values):
-                    y_data = np.arange(len(variable.values))
-                    ylabel = 'Index'
-                else:
-                    ylabel = 'Depth'
-                self.ax.plot(variable.values, y_data) # 값 vs 깊이
-                self.ax.set_xlabel(xlabel) # 보통 값
-                self.ax.set_ylabel(ylabel)
-                self.ax.invert_yaxis() # 깊이 플롯은 Y축을 반전하는 경우가 많음
-                self.ax.set_title(title)
-                self.ax.grid(grid)
-            else:
-                self._display_error_message(f"프로파일 플롯을 위한 'depth' 차원을 찾을 수 없습니다.")
-                logger.warning(f"PlotWindow: 'depth' 차원 없음 for profile plot of {self.variable_name}.")
+                read = (self._slice_indexers(variable, ('depth',)), ('depth',))
+                if len(y_data) != len(x_values):
+                    return self._line_data('profile', np.arange(len(x_values)), x_values, ylabel='Index', slice=read)
+                return self._line_data('profile', y_data, x_values, ylabel='Depth', slice=read)
+            logger.warning(f"PlotWindow: 'depth' 차원 없음 for profile plot of {self.variable_name}.")
+            return {'error': f"프로파일 플롯을 위한 'depth' 차원을 찾을 수 없습니다."}
 
         elif self.plot_type == "time_depth_heatmap" or self.plot_type == "2d_heatmap" or self.plot_type == "map_2d":
             # 2D 데이터 플롯 (시간-깊이, 일반 2D 히트맵, 지도)
             if variable.ndim < 2:
-                self._display_error_message(f"2D 플롯을 위한 차원 수가 부족합니다: {variable.ndim}D")
                 logger.warning(f"PlotWindow: 2D 플롯을 위한 차원 수 부족 ({variable.ndim}) for {self.variable_name}.")
-                self.canvas.draw()
-                return
+                return {'error': f"2D 플롯을 위한 차원 수가 부족합니다: {variable.ndim}D"}
 
             dim1_name, dim2_name = variable.dims[0], variable.dims[1]
             x_coords = dataset.coords.get(dim2_name)
             y_coords = dataset.coords.get(dim1_name)
 
             if x_coords is None or y_coords is None:
-                self._display_error_message(f"2D 플롯을 위한 좌표 변수 '{dim1_name}' 또는 '{dim2_name}'를 찾을 수 없습니다.")
+                # 3D 이상 변수는 나머지 차원의 한 슬라이스만 읽습니다 (slice_indices 옵션, 기본 0).
+                z_values = self._read(variable, keep_dims=(dim1_name, dim2_name))
                 logger.warning(f"PlotWindow: 2D 플롯 좌표 변수 없음 for {self.variable_name}.")
-                self.ax.imshow(variable.values, aspect='auto', origin='lower', cmap=cmap, vmin=vmin, vmax=vmax, interpolation=self.options.get('interpolation', 'nearest'))
-                self.ax.set_xlabel('Dimension 2 Index')
-                self.ax.set_ylabel('Dimension 1 Index')
-            else:
-                x_data = x_coords.values
-                y_data = y_coords.values
-
-                # 시간 축 처리
-                if np.issubdtype(x_data.dtype, np.datetime64):
-                    self.figure.autofmt_xdate()
-                    
-                # 깊이 축 처리 (y축이 깊이일 경우 반전)
-                if 'depth' in dim1_name.lower() or 'pressure' in dim1_name.lower():
-                     self.ax.invert_yaxis()
-
-                # Pcolormesh를 사용하여 더 유연하게 플롯
-                try:
-                    pcm = self.ax.pcolormesh(x_data, y_data, variable.values, 
-                                            cmap=cmap, vmin=vmin, vmax=vmax, shading='auto')
-                except ValueError as ve:
-                    # 'shading'이 'auto'일 때 발생하는 오류 처리 (데이터/좌표 불일치)
-                    logger.error(f"Pcolormesh 오류 발생 (shading='auto' 문제): {ve}. shading='flat'으로 재시도.")
-                    try:
-                        pcm = self.ax.pcolormesh(x_data, y_data, variable.values, 
-                                                cmap=cmap, vmin=vmin, vmax=vmax, shading='flat')
-                    except Exception as e:
-                        self._display_error_message(f"플롯 오류 (2D): {e}")
-                        logger.error(f"2D 플롯 최종 실패: {e}")
-                        self.canvas.draw()
-                        return
-
-
-                cb = self.figure.colorbar(pcm, ax=self.ax, label=zlabel)
-                if log_scale:
-                    cb.ax.set_yscale('log')
-
-                self.ax.set_xlabel(xlabel)
-                self.ax.set_ylabel(ylabel)
-                self.ax.set_title(title)
-                self.ax.grid(grid)
+                return {'kind': 'image', 'z': z_values,
+                        'slice': (self._slice_indexers(variable, (dim1_name, dim2_name)), (dim1_name, dim2_name)),
+                        'message': f"2D 플롯을 위한 좌표 변수 '{dim1_name}' 또는 '{dim2_name}'를 찾을 수 없습니다."}
+            # 처음에는 전체 범위를 화면 해상도로 건너뛰며 읽고, 확대하면 보이는 구간만 다시 읽습니다 (_refine_view).
+            # 큰 변수는 처음 플롯할 때 만든 피라미드에서 화면 해상도를 덮는 단계를 잘라옵니다.
+            # 피라미드는 나머지 차원의 첫 번째 슬라이스로 만들어지므로 다른 슬라이스를 볼 때는 원본을 읽습니다.
+            pyramid_cache = self.dataset_manager.pyramid_cache
+            first_slice = not any(self._fixed_indices(variable, (dim1_name, dim2_name)).values())
+            pyramid = pyramid_cache.get(self.file_path, self.variable_name, variable, dim1_name, dim2_name) \
+                if pyramid_cache is not None and first_slice else None
+            refiner = ViewRefiner(dim2_name, dim1_name, x_coords.values, y_coords.values, pyramid, reader=self._read)
+            overview = refiner.overview(self._plot_pixels, self._plot_height)
+            x_data, y_data, z_values = refiner.read(variable, overview)
+            overlays = []
+            if self.plot_type == "map_2d":
+                # 오버레이는 컴파일된 캐시에서 읽으며, 그리기는 GUI 스레드에서 LineCollection 하나로 합니다.
+                overlays = [overlay for overlay in map(load_overlay, self.options.get('overlays', [])) if overlay is not None]
+            data = {
+                'kind': 'mesh', 'x': x_data, 'y': y_data, 'z': z_values, 'refiner': refiner,
+                'time_axis': np.issubdtype(x_data.dtype, np.datetime64), # 시간 축 처리
+                'invert_y': 'depth' in dim1_name.lower() or 'pressure' in dim1_name.lower(), # y축이 깊이일 경우 반전
+                'overlays': overlays,
+                'overlay_swap_xy': 'lat' in dim2_name.lower(), # x축이 위도이면 오버레이도 (lat, lon)으로
+                # 피라미드에서 잘라왔더라도 이웃 슬라이스는 같은 개요 간격으로 원본에서 미리 읽습니다.
+                'slice': (self._slice_indexers(variable, (dim1_name, dim2_name), overview), (dim1_name, dim2_name)),
+            }
+            # 개요는 이미 캔버스 픽셀 수로 줄어 있으므로 auto 모드의 전환 여부는 원본 필드 크기로 판단합니다.
+            if should_rasterize(z_values.shape, x_data, y_data, self.options.get('render_mode', 'auto'),
+                                self.options.get('raster_threshold'),
+                                cells=variable.sizes[dim1_name] * variable.sizes[dim2_name]):
+                # 큰 격자는 pcolormesh 대신 작업 스레드에서 컬러맵을 적용한 RGBA 이미지 하나로 그립니다.
+                data['kind'] = 'raster'
+                data['raster'] = rasterize(x_data, y_data, z_values, self.options.get('cmap', 'viridis'),
+                                           self.options.get('vmin'), self.options.get('vmax'))
+                # 'z'(화면 해상도의 개요)는 남겨 두어 색 옵션만 바뀌면 다시 읽지 않고 색만 입힙니다.
+            return data
 
         elif self.plot_type == "scalar":
-            self._display_error_message(f"스칼라 변수 '{self.variable_name}'는 그래프로 표시할 수 없습니다.")
             logger.info(f"PlotWindow: 스칼라 변수 {self.variable_name}는 플롯할 수 없음.")
+            return {'error': f"스칼라 변수 '{self.variable_name}'는 그래프로 표시할 수 없습니다."}
+        logger.warning(f"PlotWindow: 알 수 없는 플롯 유형 '{self.plot_type}' for {self.variable_name}.")
+        return {'error': f"알 수 없거나 지원되지 않는 플롯 유형: {self.plot_type}"}
+
+    def _fixed_indices(self, variable, keep_dims):
+        """그리지 않는 차원의 인덱스. slice_indices 옵션({dim: index})에 없는 차원은 0입니다."""
+        slice_indices = self.options.get('slice_indices') or {}
+        return {dim: int(slice_indices.get(dim, 0)) for dim in variable.dims if dim not in keep_dims}
+
+    def _slice_indexers(self, variable, keep_dims, indexers=None):
+        """indexers에 그리지 않는 차원의 고정 인덱스(slice_indices 옵션)를 더한 실제 읽기 위치."""
+        return {**self._fixed_indices(variable, keep_dims), **(indexers or {})}
+
+    def _read(self, variable, indexers=None, keep_dims=None):
+        """
+        슬라이스 캐시를 거쳐 variable을 읽습니다. 그리지 않는 차원은 slice_indices 옵션의 인덱스로 고정됩니다.
+        작업 스레드에서 호출되므로 창 상태는 바꾸지 않습니다 (확대 구간 읽기도 이 함수를 거칩니다).
+        """
+        indexers = self._slice_indexers(variable, keep_dims, indexers)
+        slice_cache = self.dataset_manager.slice_cache
+        if slice_cache is None:
+            return load_slice(variable, indexers, keep_dims)
+        return slice_cache.read((self.file_path, self.variable_name), variable, indexers, keep_dims)
+
+    def _slice_dim(self):
+        """PageUp/PageDown으로 넘겨볼 차원: 마지막으로 그린 플롯에서 고정된 첫 번째 차원 (없으면 None)."""
+        if self._last_read is None:
+            return None
+        indexers, keep_dims = self._last_read
+        return next((dim for dim, index in indexers.items() if dim not in keep_dims and isinstance(index, int)), None)
+
+    def step_slice(self, delta):
+        """고정된 첫 번째 차원(시간/깊이 등)의 인덱스를 delta만큼 옮겨 다시 그립니다."""
+        dim = self._slice_dim()
+        if dim is None or self.dataset is None:
+            return
+        variable = self.dataset[self.dataset_variable]
+        slice_indices = dict(self.options.get('slice_indices') or {})
+        current = int(slice_indices.get(dim, 0))
+        index = min(max(current + delta, 0), variable.sizes[dim] - 1)
+        if index == current:
+            return
+        slice_indices[dim] = index
+        self.options['slice_indices'] = slice_indices
+        if self.update_status_bar_callback:
+            label = variable[dim].values[index] if dim in variable.coords else index
+            self.update_status_bar_callback(f"{dim} = {label} ({index + 1}/{variable.sizes[dim]})", 2000)
+        self.refresh_plot()
+
+    def _on_key_press(self, event):
+        if event.key == 'pagedown':
+            self.step_slice(1)
+        elif event.key == 'pageup':
+            self.step_slice(-1)
+
+    def _prefetch_neighbours(self):
+        """방금 그린 슬라이스에서 이동 방향으로 이웃 슬라이스를 미리 읽어 둡니다."""
+        slice_cache = self.dataset_manager.slice_cache
+        dim = self._slice_dim()
+        if slice_cache is None or dim is None or self.dataset is None:
+            return
+        indexers, keep_dims = self._last_read
+        slice_cache.prefetch(self.dataset_manager.loader, (self.file_path, self.variable_name),
+                             self.dataset[self.dataset_variable], indexers, keep_dims, dim)
+
+    def _line_data(self, kind, coord, values, **extra):
+        """
+        1D 플롯 데이터. 전체 해상도 데이터는 DecimatedSeries로 보관하고 캔버스 너비에 맞게 줄인 점만 그립니다.
+        'line'은 x축이, 'profile'은 y축(깊이)이 독립 변수입니다.
+        """
+        series = DecimatedSeries(coord, values)
+        coord, values = series.view(pixels=self._plot_pixels)
+        x, y = (coord, values) if kind == 'line' else (values, coord)
+        return {'kind': kind, 'x': x, 'y': y, 'series': series, **extra}
+
+    def _attach_series(self, line, data):
+        """확대/이동하면 보이는 구간을 전체 해상도 데이터에서 다시 줄여 그리도록 축 범위 콜백을 연결합니다."""
+        axis = 'x' if data['kind'] == 'line' else 'y'
+        self._series = (line, data['series'], axis, data.get('time_axis', False))
+        self._view_timer.setInterval(SERIES_UPDATE_DELAY_MS)
+        self._watch_limits(axis)
+
+    def _attach_refiner(self, data, mappable):
+        """2D 플롯을 확대/이동하면 보이는 구간만 화면 해상도로 다시 읽어 개요 위에 그리도록 연결합니다."""
+        refiner = data['refiner']
+        if not refiner.is_coarse:
+            return # 개요가 이미 전체 해상도입니다.
+        self._refine = {
+            'refiner': refiner, 'time_axis': data['time_axis'], 'raster': data['kind'] == 'raster',
+            'cmap': mappable.cmap, 'cmap_name': self.options.get('cmap', 'viridis'),
+            'vmin': mappable.norm.vmin, 'vmax': mappable.norm.vmax,
+        }
+        self._view_timer.setInterval(REFINE_DELAY_MS)
+        self._watch_limits('x', 'y')
+
+    def _watch_limits(self, *axes):
+        """축 범위가 바뀌면 _view_timer를 시작하도록 연결합니다. 이전에 연결한 콜백은 먼저 끊습니다."""
+        for cid in self._view_cids:
+            self.ax.callbacks.disconnect(cid)
+        self._view_cids = [self.ax.callbacks.connect(f'{axis}lim_changed', lambda ax: self._view_timer.start())
+                           for axis in axes]
+
+    def _on_draw(self, event):
+        self._drawn = True
+
+    def _on_view_changed(self):
+        if self._series is not None:
+            self._update_series_view()
+        elif self._refine is not None:
+            self._refine_view()
+
+    def _axis_limits(self, axis, time_axis=False):
+        """현재 축 범위. 시간 축이면 matplotlib 날짜 숫자(epoch 기준 일 수)를 datetime64로 변환합니다."""
+        lo, hi = self.ax.get_xlim() if axis == 'x' else self.ax.get_ylim()
+        if time_axis:
+            epoch = np.datetime64(mdates.get_epoch())
+            lo, hi = (epoch + np.timedelta64(int(round(v * 86400e6)), 'us') for v in (lo, hi))
+        return lo, hi
+
+    def _refine_view(self):
+        """보이는 인덱스 창을 DatasetManager의 데이터셋에서 화면 해상도로 다시 읽도록 작업을 요청합니다."""
+        refiner = self._refine['refiner']
+        indexers = refiner.window(self._axis_limits('x', self._refine['time_axis']), self._axis_limits('y'),
+                                  max(self.canvas.width(), 1), max(self.canvas.height(), 1))
+        if indexers is None:
+            self._set_refined_artist(None) # 개요만으로 충분합니다 (전체 보기로 돌아온 경우 등).
+            return
+        loader = self.dataset_manager.loader
+        if loader is None:
+            self._apply_refinement(self._read_refined_window(indexers))
+            return
+        loader.submit(self._read_refined_window, indexers,
+                      description=f"'{self.variable_name}' 확대 구간 읽기",
+                      key=("plot-refine", self.plot_id), # 이전 확대 요청은 취소
+                      on_done=self._apply_refinement,
+                      on_error=lambda e: logger.error(f"PlotWindow: 확대 구간 읽기 오류 ({self.variable_name}): {e}"))
+
+    def _read_refined_window(self, indexers):
+        """작업 스레드에서 확대 구간을 읽고, 개요가 이미지였다면 같은 색 범위로 RGBA 이미지까지 만듭니다."""
+        refine = self._refine
+        if refine is None or self.dataset is None:
+            return None
+        x_data, y_data, z_values = refine['refiner'].read(self.dataset[self.dataset_variable], indexers)
+        if refine['raster']:
+            return {'raster': rasterize(x_data, y_data, z_values, refine['cmap_name'], refine['vmin'], refine['vmax'])}
+        return {'x': x_data, 'y': y_data, 'z': z_values}
+
+    def _apply_refinement(self, patch):
+        if patch is None or self._refine is None:
+            return
+        self.ax.set_autoscale_on(False) # 확대 구간을 더해도 현재 보기 범위를 유지
+        if 'raster' in patch:
+            artist = self._draw_raster(patch['raster'], self._refine['time_axis'])
         else:
-            self._display_error_message(f"알 수 없거나 지원되지 않는 플롯 유형: {self.plot_type}")
-            logger.warning(f"PlotWindow: 알 수 없는 플롯 유형 '{self.plot_type}' for {self.variable_name}.")
+            try:
+                artist = self.ax.pcolormesh(patch['x'], patch['y'], patch['z'], cmap=self._refine['cmap'],
+                                            norm=self._mappable.norm, shading='auto') # 개요와 같은 선형/로그 norm
+            except ValueError as e:
+                logger.error(f"PlotWindow: 확대 구간 pcolormesh 오류: {e}")
+                return
+        artist.set_zorder(REFINED_ZORDER)
+        self._set_refined_artist(artist)
 
-        self.canvas.draw()
-        self.figure.tight_layout() # 레이아웃 조정
-        logger.info(f"PlotWindow '{self.windowTitle()}' 플롯 새로고침 완료. Type: {self.plot_type}")
+    def _set_refined_artist(self, artist, redraw=True):
+        if self._refined_artist is None and artist is None:
+            return
+        if self._refined_artist is not None:
+            self._refined_artist.remove()
+        self._refined_artist = artist
+        if redraw:
+            self._redraw(data_only=True) # 확대 구간은 현재 보기 범위 안에서만 바뀝니다.
+
+    def _draw_raster(self, raster, time_axis):
+        """rasterize() 결과를 좌표 범위(extent)에 맞춰 imshow로 그립니다."""
+        x_extent = raster['x_extent']
+        if time_axis:
+            x_extent = mdates.date2num(np.asarray(x_extent))
+        return self.ax.imshow(raster['rgba'], origin='lower', aspect='auto', interpolation='nearest',
+                              extent=(x_extent[0], x_extent[1], raster['y_extent'][0], raster['y_extent'][1]))
+
+    def _update_series_view(self):
+        line, series, axis, time_axis = self._series
+        lo, hi = self._axis_limits(axis, time_axis)
+        coord, values = series.view(lo, hi, pixels=max(self.canvas.width(), 1))
+        if axis == 'x':
+            line.set_data(coord, values)
+        else:
+            line.set_data(values, coord)
+        self.canvas.draw_idle()
+
+    def _render_key(self, data):
+        """제자리 갱신 가능 여부를 판단하는 값: 종류, 축 처리, 오버레이가 같아야 기존 아티스트를 재사용합니다."""
+        return (data['kind'], bool(data.get('time_axis')), bool(data.get('invert_y')), repr(self.options.get('overlays')))
+
+    def _can_update_in_place(self, data):
+        """이전 플롯의 아티스트에 새 데이터만 넣을 수 있는지 (같은 격자의 다른 슬라이스, 같은 종류의 1D 선 등)."""
+        if self._artist is None or self._render_key_value != self._render_key(data):
+            return False
+        kind = data['kind']
+        if kind in ('line', 'profile'):
+            return True
+        if kind == 'mesh':
+            x_old, y_old, shape_old = self._grid
+            return (np.shape(data['z']) == shape_old
+                    and np.array_equal(data['x'], x_old) and np.array_equal(data['y'], y_old))
+        if kind == 'raster':
+            return (tuple(data['raster']['x_extent']), tuple(data['raster']['y_extent'])) == self._grid
+        return False
+
+    def _update_artists(self, data, cmap, vmin, vmax):
+        """기존 아티스트를 set_data/set_array/set_clim/set_cmap으로 갱신하고 컬러바용 mappable을 반환합니다."""
+        self._set_refined_artist(None, redraw=False) # 이전 데이터의 확대 구간은 버리고 새로 읽습니다.
+        kind = data['kind']
+        if kind in ('line', 'profile'):
+            self._artist.set_data(data['x'], data['y'])
+            self._attach_series(self._artist, data)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self._view_timer.start() # 확대된 상태라면 보이는 구간을 새 데이터에서 다시 줄입니다.
+            return None
+        if kind == 'raster':
+            raster = data['raster']
+            self._artist.set_data(raster['rgba'])
+            self._field = (data['x'], data['y'], data['z'])
+            mappable = self._mappable
+            mappable.set_cmap(cmap)
+            mappable.set_clim(raster['vmin'], raster['vmax'])
+        else:
+            mappable = self._artist
+            mappable.set_array(data['z'])
+            mappable.set_cmap(cmap)
+            mappable.norm.vmin = vmin # None이면 아래 autoscale_None()이 새 데이터 범위로 채웁니다.
+            mappable.norm.vmax = vmax
+            mappable.autoscale_None()
+        self._refine = None
+        self._attach_refiner(data, mappable)
+        if self._refine is not None:
+            self._view_timer.start() # 확대된 상태라면 새 슬라이스의 보이는 구간을 다시 읽습니다.
+        return mappable
+
+    def _create_artists(self, data, cmap, vmin, vmax):
+        """
+        축을 비우고 아티스트를 새로 만듭니다. 컬러바에 연결할 mappable(2D) 또는 None(1D)을 반환하며,
+        그릴 수 없으면 False를 반환합니다.
+        """
+        self._reset_axes()
+        pcm = None
+        kind = data['kind']
+        if kind == 'line':
+            if data.get('time_axis'):
+                self.figure.autofmt_xdate() # 시간 축 레이블 회전
+            line, = self.ax.plot(data['x'], data['y'])
+            self._artist = line
+            self._attach_series(line, data)
+
+        elif kind == 'profile':
+            line, = self.ax.plot(data['x'], data['y']) # 값 vs 깊이
+            self._artist = line
+            self._attach_series(line, data)
+            self.ax.invert_yaxis() # 깊이 플롯은 Y축을 반전하는 경우가 많음
+
+        elif kind == 'image':
+            self._display_error_message(data['message'])
+            self.ax.imshow(data['z'], aspect='auto', origin='lower', cmap=cmap, vmin=vmin, vmax=vmax, interpolation=self.options.get('interpolation', 'nearest'))
+            self.ax.set_xlabel('Dimension 2 Index')
+            self.ax.set_ylabel('Dimension 1 Index')
+
+        elif kind == 'raster':
+            x_data, y_data, raster = data['x'], data['y'], data['raster']
+            if data['time_axis']:
+                self.ax.xaxis_date()
+                self.figure.autofmt_xdate()
+            self._artist = self._draw_raster(raster, data['time_axis'])
+            self._grid = (tuple(raster['x_extent']), tuple(raster['y_extent']))
+            self._field = (x_data, y_data, data['z'])
+            if data['invert_y']:
+                self.ax.invert_yaxis()
+            # 이미지에는 값이 없으므로 컬러바는 같은 범위/컬러맵의 ScalarMappable로 그립니다.
+            pcm = ScalarMappable(norm=Normalize(raster['vmin'], raster['vmax']), cmap=cmap)
+
+        elif kind == 'mesh':
+            x_data, y_data, z_values = data['x'], data['y'], data['z']
+            if data['time_axis']:
+                self.figure.autofmt_xdate()
+            if data['invert_y']:
+                self.ax.invert_yaxis()
+
+            # Pcolormesh를 사용하여 더 유연하게 플롯
+            try:
+                pcm = self.ax.pcolormesh(x_data, y_data, z_values, 
+                                        cmap=cmap, vmin=vmin, vmax=vmax, shading='auto')
+            except ValueError as ve:
+                # 'shading'이 'auto'일 때 발생하는 오류 처리 (데이터/좌표 불일치)
+                logger.error(f"Pcolormesh 오류 발생 (shading='auto' 문제): {ve}. shading='flat'으로 재시도.")
+                try:
+                    pcm = self.ax.pcolormesh(x_data, y_data, z_values, 
+                                            cmap=cmap, vmin=vmin, vmax=vmax, shading='flat')
+                except Exception as e:
+                    self._display_error_message(f"플롯 오류 (2D): {e}")
+                    logger.error(f"2D 플롯 최종 실패: {e}")
+                    return False
+            self._artist = pcm
+            self._grid = (x_data, y_data, np.shape(z_values))
+
+        if kind in ('mesh', 'raster'):
+            if data.get('overlays'):
+                # 오버레이는 플롯 범위로 잘라내고 캔버스 픽셀 크기에 맞는 단순화 단계로 그립니다.
+                x_range = (float(np.nanmin(x_data)), float(np.nanmax(x_data)))
+                y_range = (float(np.nanmin(y_data)), float(np.nanmax(y_data)))
+                lon_range, lat_range = (y_range, x_range) if data['overlay_swap_xy'] else (x_range, y_range)
+            for overlay in data.get('overlays', ()):
+                collection = get_overlay_line_collection(overlay, swap_xy=data['overlay_swap_xy'],
+                                                         lon_range=lon_range, lat_range=lat_range,
+                                                         pixels=self.canvas.width())
+                if collection is not None:
+                    self.ax.add_collection(collection, autolim=False) # 지도 범위는 데이터 기준으로 유지
+            self._attach_refiner(data, pcm)
+        return pcm
+
+    def _render_plot(self, data: dict):
+        """
+        _read_plot_data()가 읽어온 데이터를 GUI 스레드에서 그립니다.
+        같은 종류/격자의 플롯이면 기존 아티스트와 컬러바를 제자리에서 갱신하고(슬라이스 이동, 색 옵션 변경 등),
+        그렇지 않을 때만 축을 비우고 새로 그립니다.
+        """
+        if 'error' in data:
+            self._display_error_message(data['error'])
+            return
+        self._prefetch_neighbours()
+
+        cmap = get_mpl_colormap(self.options.get('cmap', 'viridis')) # .pal 컬러맵도 matplotlib에서 사용
+        vmin = self.options.get('vmin')
+        vmax = self.options.get('vmax')
+
+        in_place = self._can_update_in_place(data)
+        before = self._canvas_state()
+        if in_place:
+            pcm = self._update_artists(data, cmap, vmin, vmax)
+        else:
+            pcm = self._create_artists(data, cmap, vmin, vmax)
+            if pcm is False:
+                return
+        self._render_key_value = self._render_key(data)
+        self._kind = data['kind']
+        self._data_labels = {key: data[key] for key in ('xlabel', 'ylabel') if key in data}
+        self._apply_colorbar(pcm)
+        self._apply_style()
+
+        if in_place:
+            # 축 범위, 레이블, 색 범위가 그대로면 축 영역만 다시 그립니다.
+            self._redraw(data_only=self._canvas_state() == before)
+        else:
+            self.figure.tight_layout() # 레이아웃 조정
+            self.canvas.draw_idle()
+        logger.info(f"PlotWindow '{self.windowTitle()}' 플롯 {'갱신' if in_place else '새로고침'} 완료. Type: {self.plot_type}")
+
+    def _font(self, family_key, size_key):
+        """옵션에 글꼴이 지정되어 있으면 matplotlib 텍스트 인자({'fontfamily', 'fontsize'})로 반환합니다."""
+        font = {'fontfamily': self.options.get(family_key), 'fontsize': self.options.get(size_key)}
+        return {key: value for key, value in font.items() if value}
+
+    def _apply_style(self):
+        """제목, 축 레이블, 격자, 컬러바 레이블과 글꼴(plot_font_*, title_font_*)을 현재 옵션으로 적용합니다."""
+        kind = self._kind
+        if kind == 'image':
+            return # 좌표 없는 이미지는 인덱스 레이블과 오류 메시지를 유지합니다.
+        xlabel = self.options.get('xlabel', 'X-axis')
+        ylabel = self.options.get('ylabel', 'Y-axis')
+        if kind == 'line':
+            xlabel = self._data_labels['xlabel']
+        elif kind == 'profile':
+            ylabel = self._data_labels['ylabel'] # x축은 보통 값
+        font = self._font('plot_font_family', 'plot_font_size')
+        self.ax.set_title(self.options.get('title', self.variable_name),
+                          **{**font, **self._font('title_font_family', 'title_font_size')}) # 제목 글꼴이 없으면 플롯 글꼴
+        self.ax.set_xlabel(xlabel, **font)
+        self.ax.set_ylabel(ylabel, **font)
+        if 'fontsize' in font:
+            self.ax.tick_params(labelsize=font['fontsize'])
+        if 'fontfamily' in font:
+            self.ax.tick_params(labelfontfamily=font['fontfamily'])
+        self.ax.grid(self.options.get('grid', True))
+        if self._colorbar is not None:
+            # 2D 플롯의 값 축 레이블
+            self._colorbar.set_label(self.options.get('colorbar_label', self.variable_name), **font)
+
+    def _apply_colorbar(self, mappable):
+        """컬러바는 창마다 하나만 두고 새 mappable에 다시 연결합니다 (1D 플롯이면 없앱니다)."""
+        self._mappable = mappable
+        if mappable is None:
+            self._remove_colorbar()
+            return
+        log_scale = self._apply_norm(mappable)
+        if self._colorbar is None:
+            self._colorbar = self.figure.colorbar(mappable, ax=self.ax)
+        else:
+            self._colorbar.update_normal(mappable)
+        # 컬러바는 창이 살아 있는 동안 유지되므로 로그 스케일을 끄면 축도 선형으로 되돌려야 합니다.
+        if log_scale:
+            self._colorbar.ax.set_yscale('log')
+        else:
+            self._colorbar.ax.set_yscale('linear')
+
+    def _apply_norm(self, mappable):
+        """
+        log_scale 옵션에 맞게 mappable의 norm을 LogNorm/Normalize로 바꾸고, 로그 스케일로 그렸는지 반환합니다.
+        RGBA 이미지(raster)는 작업 스레드에서 선형으로 색을 입히므로 항상 선형이며,
+        양수 값이 없어 로그 범위를 정할 수 없을 때도 선형으로 그립니다.
+        """
+        norm = mappable.norm
+        log_scale = bool(self.options.get('log_scale', False)) and self._kind == 'mesh'
+        if log_scale:
+            vmin, vmax = norm.vmin, norm.vmax
+            if vmin is None or vmin <= 0:
+                values = np.ma.masked_invalid(mappable.get_array())
+                positive = values[values > 0].compressed()
+                vmin = float(positive.min()) if positive.size else None
+            if vmin is None or vmax is None or not vmax > vmin:
+                logger.warning(f"PlotWindow: '{self.variable_name}'에 로그 스케일로 그릴 양수 범위가 없어 선형으로 그립니다.")
+                log_scale = False
+            elif not isinstance(norm, LogNorm) or norm.vmin != vmin:
+                mappable.set_norm(LogNorm(vmin, vmax))
+        if not log_scale and isinstance(norm, LogNorm):
+            # 로그 norm이 잘라낸 0 이하 값까지 포함하도록 옵션의 범위에서 다시 정합니다.
+            mappable.set_norm(Normalize(self.options.get('vmin'), self.options.get('vmax')))
+            mappable.autoscale_None()
+        if self._refined_artist is not None and self._refine is not None and not self._refine['raster']:
+            self._refined_artist.set_norm(mappable.norm)
+        return log_scale
+
+    def _apply_colors(self):
+        """
+        이미 그린 2D 데이터에 컬러맵/값 범위만 다시 적용합니다. RGBA 이미지는 보관한 개요에 다시 색을 입히고,
+        확대 구간은 새 색으로 다시 읽습니다.
+        """
+        cmap_name = self.options.get('cmap', 'viridis')
+        cmap = get_mpl_colormap(cmap_name)
+        vmin = self.options.get('vmin')
+        vmax = self.options.get('vmax')
+        if self._kind == 'mesh':
+            mappable = self._artist
+            mappable.set_cmap(cmap)
+            mappable.norm.vmin = vmin
+            mappable.norm.vmax = vmax
+            mappable.autoscale_None()
+        elif self._kind == 'raster':
+            x_data, y_data, z_values = self._field
+            raster = rasterize(x_data, y_data, z_values, cmap_name, vmin, vmax)
+            self._artist.set_data(raster['rgba'])
+            mappable = self._mappable
+            mappable.set_cmap(cmap)
+            mappable.set_clim(raster['vmin'], raster['vmax'])
+        else:
+            return # 1D 플롯에는 적용할 색 옵션이 없습니다.
+        if self._refine is not None:
+            self._refine.update({'cmap': mappable.cmap, 'cmap_name': cmap_name,
+                                 'vmin': mappable.norm.vmin, 'vmax': mappable.norm.vmax})
+            if self._refined_artist is not None and not self._refine['raster']:
+                self._refined_artist.set_cmap(mappable.cmap)
+                self._refined_artist.set_clim(mappable.norm.vmin, mappable.norm.vmax)
+            elif self._refined_artist is not None:
+                self._set_refined_artist(None, redraw=False)
+                self._view_timer.start() # 확대 구간 이미지를 새 색으로 다시 만듭니다.
+        self._apply_colorbar(mappable)
+
+    def _canvas_state(self):
+        """축 영역 밖(눈금, 레이블, 컬러바)에 그려지는 상태. 갱신 전후가 같으면 축 영역만 blit해도 됩니다."""
+        clim = (self._mappable.norm.vmin, self._mappable.norm.vmax, self._mappable.cmap.name) \
+            if self._mappable is not None else None
+        return (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_title(), self.ax.get_xlabel(),
+                self.ax.get_ylabel(), clim, self._colorbar.ax.get_ylabel() if self._colorbar is not None else None,
+                self.options.get('grid', True), self.options.get('log_scale', False))
+
+    def _redraw(self, data_only=False):
+        """
+        data_only이면 축 안의 아티스트만 다시 그려 해당 영역을 blit하고, 아니면 draw_idle로 전체를 다시 그립니다.
+        아직 한 번도 그려지지 않았거나 캔버스가 blit을 지원하지 않으면 항상 draw_idle을 사용합니다.
+        """
+        if data_only and self._drawn and self.canvas.supports_blit:
+            self.ax.redraw_in_frame()
+            self.canvas.blit(self.ax.bbox)
+        else:
+            self.canvas.draw_idle()
+
+    def _reset_axes(self):
+        """축을 비우고 축에 딸린 상태(아티스트, 확대/축소 콜백)를 초기화합니다. 컬러바는 유지됩니다."""
+        self.ax.clear()
+        self._series = None
+        self._refine = None
+        self._refined_artist = None
+        self._artist = None
+        self._mappable = None
+        self._grid = None
+        self._render_key_value = None
+        self._view_cids = [] # ax.clear()가 콜백 목록을 새로 만듭니다.
+
+    def _remove_colorbar(self):
+        if self._colorbar is None:
+            return
+        mappable = self._colorbar.mappable
+        if isinstance(mappable, Artist) and mappable.axes is None:
+            # ax.clear()로 축에서 빠진 mesh: Colorbar.remove()는 컬러바 축을 지운 뒤 마지막 단계인
+            # mappable 축 크기 복원(mappable.axes.set_subplotspec)에서만 실패하므로, 그 단계는 아래에서 직접 합니다.
+            try:
+                self._colorbar.remove()
+            except AttributeError as e:
+                logger.debug(f"PlotWindow: 축에서 빠진 mappable의 컬러바 제거 중 축 복원 생략: {e}")
+        else:
+            self._colorbar.remove() # ScalarMappable(raster)은 축이 없어 복원 단계를 건너뜁니다.
+        self.ax.set_subplotspec(self._ax_subplotspec)
+        self._colorbar = None
 
     def _display_error_message(self, message: str):
         """플롯 영역에 오류 메시지를 표시합니다."""
-        self.ax.clear()
+        self._reset_axes()
+        self._remove_colorbar()
         self.ax.text(0.5, 0.5, message,
                      horizontalalignment='center', verticalalignment='center',
                      transform=self.ax.transAxes, color='red', fontsize=12, wrap=True)
@@ -207,11 +789,24 @@ class PlotWindow(QMainWindow):
 
     def update_plot_options(self, new_options: dict):
         """
-        새로운 옵션으로 플롯을 업데이트하고 새로고침합니다.
+        새로운 옵션으로 플롯을 업데이트합니다. 바뀐 옵션의 종류에 따라 가장 싼 경로를 고릅니다:
+        제목/레이블/격자는 레이블만, 컬러맵/값 범위는 색만 다시 적용하고, 그 밖의 변경은 데이터를 다시 읽습니다.
+        적용한 변경 종류(OPTION_CHANGE_*)를 반환합니다.
         """
+        change = classify_option_change(self.options, new_options)
         self.options.update(new_options)
-        self.refresh_plot()
-        logger.info(f"PlotWindow '{self.windowTitle()}' 옵션 업데이트 및 새로고침 완료.")
+        if change == OPTION_CHANGE_NONE:
+            return change
+        if change == OPTION_CHANGE_DATA or self._artist is None:
+            self.refresh_plot()
+            logger.info(f"PlotWindow '{self.windowTitle()}' 옵션 업데이트 및 새로고침 완료.")
+            return OPTION_CHANGE_DATA
+        if change != OPTION_CHANGE_STYLE:
+            self._apply_colors()
+        self._apply_style()
+        self.canvas.draw_idle()
+        logger.info(f"PlotWindow '{self.windowTitle()}' 옵션 업데이트 완료 (데이터 다시 읽기 없음).")
+        return change
 
     def export_plot(self):
         """
@@ -233,7 +828,14 @@ class PlotWindow(QMainWindow):
 
     def closeEvent(self, event):
         """윈도우가 닫힐 때 Matplotlib figure를 닫아 메모리 누수를 방지합니다."""
+        if self.dataset_manager.loader is not None:
+            self.dataset_manager.loader.cancel_key(("plot", self.plot_id))
+            self.dataset_manager.loader.cancel_key(("plot-refine", self.plot_id))
+        self._view_timer.stop()
+        self._series = None
+        self._refine = None
         plt.close(self.figure)
+        self._release_dataset()
         logger.info(f"PlotWindow '{self.windowTitle()}' 닫힘. ID: {self.plot_id}")
         super().closeEvent(event)
 
@@ -339,8 +941,12 @@ class PlotWindowManager:
         """
         active_window = self.get_active_plot_window()
         if active_window:
-            active_window.update_plot_options(options)
-            self._report_status(f"플롯 '{active_window.windowTitle()}' 옵션 업데이트 완료.", 2000)
+            # 창이 바뀐 옵션을 분류해 레이블만/색만 다시 적용하거나 데이터를 다시 읽습니다.
+            change = active_window.update_plot_options(options)
+            if change == OPTION_CHANGE_NONE:
+                self._report_status(f"플롯 '{active_window.windowTitle()}' 옵션 변경 없음.", 2000)
+            else:
+                self._report_status(f"플롯 '{active_window.windowTitle()}' 옵션 업데이트 완료.", 2000)
         else:
             self._report_status("옵션을 업데이트할 활성화된 플롯 창이 없습니다.", 3000)
             logger.warning("PlotWindowManager: 옵션을 업데이트할 활성화된 플롯 창이 없습니다.")
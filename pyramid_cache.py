@@ -0,0 +1,238 @@
+# oceanocal_v2/pyramid_cache.py
+
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .bookmarks import APP_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+PYRAMID_CACHE_DIR = os.path.join(APP_DATA_DIR, "pyramid_cache")
+PYRAMID_FORMAT_VERSION = 1 # .npz 형식이 바뀌면 올려서 이전 파일을 무효화합니다.
+PYRAMID_MIN_CELLS = 2048 * 2048 # 이보다 작은 2D 슬라이스는 피라미드 없이 바로 읽습니다.
+PYRAMID_MIN_LEVEL_SIZE = 256 # 가장 작은 단계의 긴 변이 이 크기 이하가 될 때까지 2배씩 줄입니다.
+PYRAMID_STRIP_ROWS = 1024 # 빌드할 때 한 번에 읽는 행 수 (가장 큰 배율의 배수로 맞춥니다)
+PYRAMID_MEMORY_ENTRIES = 4 # 메모리에 보관하는 피라미드 수 (LRU)
+
+
+def _pool_coord(coord, factor):
+    """좌표를 factor개씩 묶어 평균합니다 (마지막 묶음은 남은 개수로). 시간 좌표도 지원합니다."""
+    coord = np.asarray(coord)
+    is_time = np.issubdtype(coord.dtype, np.datetime64)
+    values = coord.astype("datetime64[ns]").astype(np.int64) if is_time else coord.astype(np.float64)
+    starts = np.arange(0, len(values), factor)
+    pooled = np.add.reduceat(values.astype(np.float64), starts) / np.diff(np.append(starts, len(values)))
+    return pooled.astype(np.int64).astype("datetime64[ns]") if is_time else pooled
+
+
+def _pool_block(block, factor):
+    """(h, w) 블록을 factor×factor 칸마다 NaN을 뺀 평균으로 줄입니다. h, w는 factor의 배수여야 합니다."""
+    h, w = block.shape
+    valid = np.isfinite(block)
+    shape = (h // factor, factor, w // factor, factor)
+    total = np.where(valid, block, 0.0).reshape(shape).sum(axis=(1, 3))
+    count = valid.reshape(shape).sum(axis=(1, 3))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (total / count).astype(np.float32) # 값이 하나도 없는 칸은 NaN
+
+
+class PyramidLevel:
+    """원본을 factor×factor 평균으로 줄인 한 단계. rows/cols는 묶음별 평균 좌표입니다."""
+    __slots__ = ("factor", "rows", "cols", "values")
+
+    def __init__(self, factor, rows, cols, values):
+        self.factor = factor
+        self.rows = rows
+        self.cols = cols
+        self.values = values
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.rows.nbytes + self.cols.nbytes
+
+
+class Pyramid:
+    """
+    2D 슬라이스(row_dim × col_dim, 나머지 차원은 첫 인덱스)의 다중 해상도 개요.
+    levels는 배율(2, 4, 8, ...) 오름차순이며, 원본(배율 1)은 포함하지 않습니다.
+    """
+    def __init__(self, row_dim, col_dim, shape, levels):
+        self.row_dim = row_dim
+        self.col_dim = col_dim
+        self.shape = tuple(shape)
+        self.levels = levels
+
+    def select(self, pixels_rows, pixels_cols):
+        """화면 해상도(행/열 픽셀 수)를 덮는 가장 작은 단계. 어떤 단계도 충분하지 않으면 None (원본을 읽어야 함)."""
+        covering = [level for level in self.levels
+                    if level.values.shape[0] >= min(pixels_rows, self.shape[0])
+                    and level.values.shape[1] >= min(pixels_cols, self.shape[1])]
+        return covering[-1] if covering else None
+
+    def read_window(self, indexers):
+        """
+        원본 인덱스 기준 간격 슬라이스 indexers({dim: slice})를 가장 성긴 적합 단계에서 잘라 (rows, cols, values)로 반환합니다.
+        단계의 배율이 두 슬라이스 간격 이하여야 하며, 그런 단계가 없으면 None.
+        """
+        row_slice, col_slice = indexers[self.row_dim], indexers[self.col_dim]
+        step = min(row_slice.step or 1, col_slice.step or 1)
+        usable = [level for level in self.levels if level.factor <= step]
+        if not usable:
+            return None
+        level = usable[-1]
+        factor = level.factor
+
+        def scaled(index_slice, length):
+            start, stop, step = index_slice.indices(length)
+            return slice(start // factor, -(-stop // factor), max(step // factor, 1))
+
+        rows = scaled(row_slice, self.shape[0])
+        cols = scaled(col_slice, self.shape[1])
+        return level.rows[rows], level.cols[cols], level.values[rows, cols]
+
+    @property
+    def nbytes(self):
+        return sum(level.nbytes for level in self.levels)
+
+    @classmethod
+    def build(cls, data_array, row_dim, col_dim):
+        """
+        DataArray를 PYRAMID_STRIP_ROWS 행씩 읽으면서 모든 단계를 한 번에 평균 풀링해 만듭니다.
+        원본 전체를 한꺼번에 메모리에 올리지 않습니다.
+        """
+        fixed = {dim: 0 for dim in data_array.dims if dim not in (row_dim, col_dim)}
+        field = (data_array.isel(fixed) if fixed else data_array).transpose(row_dim, col_dim)
+        n_rows, n_cols = field.shape
+        factors = []
+        factor = 2
+        while True:
+            factors.append(factor)
+            if max(n_rows, n_cols) / factor <= PYRAMID_MIN_LEVEL_SIZE:
+                break
+            factor *= 2
+        largest = factors[-1]
+        strip_rows = max(PYRAMID_STRIP_ROWS // largest, 1) * largest
+        padded_cols = -(-n_cols // largest) * largest
+        pooled = {factor: [] for factor in factors}
+        for start in range(0, n_rows, strip_rows):
+            block = np.asarray(field[start:start + strip_rows].values, dtype=np.float64)
+            height = -(-block.shape[0] // largest) * largest
+            padded = np.full((height, padded_cols), np.nan)
+            padded[:block.shape[0], :n_cols] = block
+            for factor in factors:
+                pooled[factor].append(_pool_block(padded, factor))
+
+        rows_coord = field[row_dim].values if row_dim in field.coords else np.arange(n_rows)
+        cols_coord = field[col_dim].values if col_dim in field.coords else np.arange(n_cols)
+        levels = []
+        for factor in factors:
+            rows = _pool_coord(rows_coord, factor)
+            cols = _pool_coord(cols_coord, factor)
+            values = np.concatenate(pooled[factor])[:len(rows), :len(cols)]
+            levels.append(PyramidLevel(factor, rows, cols, np.ascontiguousarray(values)))
+        return cls(row_dim, col_dim, (n_rows, n_cols), levels)
+
+
+class PyramidCache:
+    """
+    (파일, 변수, 차원)별 Pyramid를 메모리 LRU와 선택적 디스크(.npz) 캐시에 보관합니다.
+    디스크 항목은 원본 파일의 크기와 수정 시각(mtime)이 같을 때만 사용됩니다.
+    처음 플롯할 때 작업 스레드에서 만들어지며, 작은 변수(PYRAMID_MIN_CELLS 미만)는 만들지 않습니다.
+    """
+    def __init__(self, cache_dir=PYRAMID_CACHE_DIR, use_disk=True, max_entries=PYRAMID_MEMORY_ENTRIES,
+                 min_cells=PYRAMID_MIN_CELLS):
+        self.cache_dir = cache_dir
+        self.use_disk = use_disk
+        self.max_entries = max(1, int(max_entries))
+        self.min_cells = min_cells
+        self._memory = OrderedDict() # {key: (signature, Pyramid)}
+        self._lock = threading.Lock()
+        self._build_locks = {} # 같은 피라미드를 두 창에서 동시에 만들지 않도록 키별 잠금
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime
+
+    def _cache_file_path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{os.path.splitext(os.path.basename(key[0]))[0]}-{digest}.npz")
+
+    def get(self, filepath, var_path, data_array, row_dim, col_dim):
+        """피라미드를 반환합니다. 슬라이스가 작거나 만들 수 없으면 None."""
+        if data_array.sizes[row_dim] * data_array.sizes[col_dim] < self.min_cells:
+            return None
+        signature = self._signature(filepath)
+        key = (os.path.abspath(filepath), var_path, row_dim, col_dim)
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            with self._lock:
+                cached = self._memory.get(key)
+                if cached is not None and cached[0] == signature:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return cached[1]
+            self.misses += 1
+            pyramid = self._load(key, signature) if self.use_disk else None
+            if pyramid is None:
+                try:
+                    pyramid = Pyramid.build(data_array, row_dim, col_dim)
+                except (ValueError, MemoryError, OSError) as e:
+                    logger.error(f"피라미드 생성 실패 ({var_path}): {e}")
+                    return None
+                logger.info(f"피라미드 생성: {var_path} {pyramid.shape} -> 단계 {[level.factor for level in pyramid.levels]}")
+                if self.use_disk and signature is not None:
+                    self._save(key, signature, pyramid)
+            with self._lock:
+                self._memory[key] = (signature, pyramid)
+                while len(self._memory) > self.max_entries:
+                    self._memory.popitem(last=False)
+            return pyramid
+
+    def _load(self, key, signature):
+        cache_path = self._cache_file_path(key)
+        if signature is None or not os.path.exists(cache_path):
+            return None
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                if (int(data["version"]) != PYRAMID_FORMAT_VERSION or
+                        (int(data["source_size"]), float(data["source_mtime"])) != signature):
+                    return None
+                levels = [PyramidLevel(int(factor), data[f"rows_{factor}"], data[f"cols_{factor}"], data[f"values_{factor}"])
+                          for factor in data["factors"]]
+                return Pyramid(key[2], key[3], tuple(data["shape"]), levels)
+        except Exception as e:
+            logger.warning(f"피라미드 캐시를 읽을 수 없습니다 ({cache_path}): {e}")
+            return None
+
+    def _save(self, key, signature, pyramid):
+        cache_path = self._cache_file_path(key)
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        arrays = {}
+        for level in pyramid.levels:
+            arrays[f"rows_{level.factor}"] = level.rows
+            arrays[f"cols_{level.factor}"] = level.cols
+            arrays[f"values_{level.factor}"] = level.values
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(f, factors=np.array([level.factor for level in pyramid.levels]), shape=np.array(pyramid.shape),
+                         version=PYRAMID_FORMAT_VERSION, source_size=signature[0], source_mtime=signature[1], **arrays)
+            os.replace(tmp_path, cache_path) # 다른 스레드가 반쯤 쓰인 파일을 읽지 않도록 교체
+        except OSError as e:
+            logger.warning(f"피라미드 캐시를 저장할 수 없습니다 ({cache_path}): {e}")
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
@@ -1,8 +1,10 @@
 from PyQt6.QtWidgets import QApplication
 from main_window import MainWindow
+from web_view_pool import limit_renderer_processes
 import sys
 
 if __name__ == "__main__":
+    limit_renderer_processes() # Chromium은 QApplication 생성 전에 설정된 플래그만 읽습니다.
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
@@ -10,6 +10,8 @@ from PyQt6.QtGui import QColor, QFont
 from PyQt6.QtCore import Qt
 import logging
 
+from .handlers.colorbar_handler import list_colormaps
+
 class SettingsDialog(QDialog):
     def __init__(self, settings_manager, parent=None):
         super().__init__(parent)
@@ -144,13 +146,13 @@ class SettingsDialog(QDialog):
         layout.addStretch(1)
 
     def _populate_colormaps(self, combo_box):
-        colorbar_dir = os.path.join(self.settings_manager.BASE_DIR, "resources", "colorbars")
-        if os.path.exists(colorbar_dir):
-            colormaps = [f.split('.')[0] for f in os.listdir(colorbar_dir) if f.endswith('.pal')]
-            combo_box.addItems(sorted(colormaps))
+        # resources/colorbars의 .pal 목록은 컬러맵 레지스트리가 한 번만 스캔합니다.
+        colormaps = list_colormaps()
+        if colormaps:
+            combo_box.addItems(colormaps)
         else:
             combo_box.addItems(["jet", "viridis", "plasma", "inferno", "magma", "cividis"]) # Fallback
-            logging.warning(f"컬러바 디렉토리를 찾을 수 없습니다: {colorbar_dir}. 기본 컬러맵 사용.")
+            logging.warning("컬러바 파일을 찾을 수 없습니다. 기본 컬러맵 사용.")
 
     def _select_default_font(self):
         initial_font = QFont(self._temp_plot_options.get('plot_font_family', 'Arial'),
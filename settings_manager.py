@@ -17,7 +17,10 @@ class SettingsManager:
             'cmap': 'jet',
             'theme': 'Light', # Plotly theme
             'plot_font_family': 'Arial',
-            'plot_font_size': 12
+            'plot_font_size': 12,
+            'render_mode': 'auto', # 2D 필드 렌더링: auto / mesh / rgba (큰 격자를 RGBA 이미지로)
+            'raster_threshold': 1000000, # auto 모드에서 RGBA 이미지로 전환하는 격자 셀 수
+            'webgl_threshold': 100000 # Plotly 선/점 트레이스를 WebGL(Scattergl, Scattermap)로 그리는 점 수
         }
         self.load_settings()
         logging.info("SettingsManager 초기화.")
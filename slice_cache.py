@@ -0,0 +1,120 @@
+# oceanocal_v2/slice_cache.py
+
+import logging
+import threading
+from collections import OrderedDict
+
+from .dataset_manager import load_slice
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLICE_CACHE_BYTES = 256 * 1024 * 1024 # 슬라이스 캐시 메모리 예산
+DEFAULT_PREFETCH_COUNT = 3 # 이동 방향으로 미리 읽는 이웃 인덱스 수
+
+
+def _indexer_key(indexers):
+    """indexers({dim: int 또는 slice})를 해시 가능한 튜플로 바꿉니다."""
+    items = []
+    for dim, value in sorted(indexers.items()):
+        if isinstance(value, slice):
+            value = ("slice", value.start, value.stop, value.step)
+        items.append((dim, value))
+    return tuple(items)
+
+
+class SliceCache:
+    """
+    변수별로 읽은 슬라이스(NumPy 배열)를 바이트 예산 안에서 LRU로 보관하는 캐시.
+    시간/깊이를 넘겨볼 때 같은 슬라이스를 다시 isel로 읽지 않으며,
+    prefetch()는 마지막 위치와 비교한 이동 방향으로 이웃 인덱스를 작업 스레드에서 미리 읽어 둡니다.
+    owner는 (파일 경로, 변수 경로) 튜플로 변수를 구분합니다.
+    """
+    def __init__(self, max_bytes=DEFAULT_SLICE_CACHE_BYTES, prefetch_count=DEFAULT_PREFETCH_COUNT):
+        self.max_bytes = int(max_bytes)
+        self.prefetch_count = max(0, int(prefetch_count))
+        self._entries = OrderedDict() # {key: ndarray}, 앞쪽이 가장 오래 사용되지 않은 항목
+        self._bytes = 0
+        self._positions = {} # {(owner, dim): 마지막으로 요청된 인덱스} 이동 방향 판단용
+        self._lock = threading.Lock() # 작업 스레드(읽기/미리 읽기)와 GUI 스레드에서 함께 사용
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(owner, indexers, keep_dims):
+        return owner, _indexer_key(indexers), tuple(keep_dims)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def read(self, owner, data_array, indexers, keep_dims):
+        """
+        load_slice(data_array, indexers, keep_dims)의 결과를 캐시에서 찾아 반환하고, 없으면 읽어서 저장합니다.
+        반환된 배열은 캐시와 공유되므로 수정하지 마십시오.
+        """
+        key = self._key(owner, indexers, keep_dims)
+        with self._lock:
+            values = self._entries.get(key)
+            if values is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return values
+            self.misses += 1
+        values = load_slice(data_array, indexers, keep_dims)
+        self._store(key, values)
+        return values
+
+    def _store(self, key, values):
+        if values.nbytes > self.max_bytes:
+            return # 예산보다 큰 슬라이스는 보관하지 않습니다.
+        values.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = values
+            self._bytes += values.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def prefetch(self, loader, owner, data_array, indexers, keep_dims, dim):
+        """
+        indexers[dim] 위치를 기록하고, 직전 위치에서 움직인 방향으로 prefetch_count개의 이웃 슬라이스를 미리 읽습니다.
+        처음 요청이거나 같은 위치이면 양쪽 한 개씩 읽습니다. loader(AsyncLoader)가 없으면 아무것도 하지 않습니다.
+        """
+        index = int(indexers[dim])
+        with self._lock:
+            last = self._positions.get((owner, dim))
+            self._positions[(owner, dim)] = index
+        if loader is None or self.prefetch_count == 0:
+            return
+        if last is None or last == index:
+            offsets = (1, -1)
+        else:
+            direction = 1 if index > last else -1
+            offsets = tuple(direction * step for step in range(1, self.prefetch_count + 1))
+        size = data_array.sizes[dim]
+        for offset in offsets:
+            neighbour = index + offset
+            if not 0 <= neighbour < size:
+                continue
+            neighbour_indexers = {**indexers, dim: neighbour}
+            if self._key(owner, neighbour_indexers, keep_dims) in self:
+                continue
+            # 같은 오프셋의 이전 미리 읽기가 아직 시작 전이면 취소되므로 빠르게 넘겨도 작업이 쌓이지 않습니다.
+            loader.submit(self.read, owner, data_array, neighbour_indexers, keep_dims,
+                          key=("slice-prefetch", owner, dim, offset),
+                          on_error=lambda e: logger.debug(f"슬라이스 미리 읽기 실패: {e}"))
+
+    def invalidate(self, filepath=None):
+        """filepath 파일의 항목(None이면 전체)을 비웁니다. 파일을 닫을 때 호출됩니다."""
+        with self._lock:
+            for key in [key for key in self._entries if filepath is None or key[0][0] == filepath]:
+                self._bytes -= self._entries.pop(key).nbytes
+            for position in [position for position in self._positions if filepath is None or position[0][0] == filepath]:
+                del self._positions[position]
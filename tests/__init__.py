@@ -0,0 +1,2 @@
+# oceanocal_v2/tests/__init__.py
+# 패키지 모듈을 상대 경로로 가져오도록 tests를 패키지로 둡니다.
@@ -0,0 +1,14 @@
+# oceanocal_v2/tests/conftest.py
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen") # 화면 없이 Qt 위젯/이벤트 루프 사용
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """테스트 세션에서 하나만 만드는 QApplication (플롯 창과 AsyncLoader 신호에 필요)."""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
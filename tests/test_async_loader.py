@@ -0,0 +1,88 @@
+# oceanocal_v2/tests/test_async_loader.py
+
+import threading
+import time
+
+import pytest
+
+from ..async_loader import AsyncLoader
+
+
+@pytest.fixture
+def loader(qapp):
+    loader = AsyncLoader(max_workers=1) # 작업 하나만 실행되어 나머지는 대기열에 남습니다.
+    yield loader
+    loader.shutdown()
+
+
+def wait_until(qapp, condition, timeout=5.0):
+    """GUI 스레드로 전달되는 결과 시그널을 처리하며 condition()이 참이 될 때까지 기다립니다."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "제한 시간 안에 작업이 끝나지 않았습니다"
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def blocking_task(started, release, value):
+    started.set()
+    release.wait(5)
+    return value
+
+
+def test_same_key_supersedes_previous_tasks(qapp, loader):
+    started, release = threading.Event(), threading.Event()
+    events = []
+    loader.submit(blocking_task, started, release, "first", key="plot",
+                  on_done=lambda r: events.append(("done", r)), on_cancel=lambda r: events.append(("cancel", r)))
+    started.wait(5)
+    loader.submit(lambda: events.append(("ran", "second")), key="plot") # 대기 중에 대체되어 실행되지 않음
+    loader.submit(lambda: "third", key="plot", on_done=lambda r: events.append(("done", r)))
+    assert loader.pending_count() == 1
+    release.set()
+    wait_until(qapp, lambda: ("done", "third") in events and ("cancel", "first") in events)
+    assert sorted(events) == [("cancel", "first"), ("done", "third")]
+
+
+def test_cancelled_running_task_hands_late_result_to_on_cancel(qapp, loader):
+    started, release = threading.Event(), threading.Event()
+    done, cancelled = [], []
+    task_id = loader.submit(blocking_task, started, release, "handle", on_done=done.append, on_cancel=cancelled.append)
+    started.wait(5)
+    assert loader.cancel(task_id)
+    assert not loader.cancel(task_id) # 이미 취소됨
+    release.set()
+    wait_until(qapp, lambda: cancelled)
+    assert cancelled == ["handle"] and done == []
+    assert loader._cancelled == {}
+
+
+def test_cancel_all_drops_running_and_queued_tasks(qapp, loader):
+    started, release = threading.Event(), threading.Event()
+    done, cancelled, messages = [], [], []
+    loader.status_callback = lambda message, timeout: messages.append(message)
+    loader.submit(blocking_task, started, release, 1, on_done=done.append, on_cancel=cancelled.append)
+    started.wait(5)
+    for value in (2, 3):
+        loader.submit(lambda value=value: value, on_done=done.append, on_cancel=cancelled.append)
+    assert loader.cancel_all() == 3
+    assert loader.pending_count() == 0
+    assert messages[-1] == "작업 3개 취소됨."
+    release.set()
+    wait_until(qapp, lambda: cancelled)
+    assert cancelled == [1] and done == [] # 시작하지 않은 작업은 실행되지 않습니다.
+
+
+def test_errors_reach_on_error_and_a_failing_callback_is_contained(qapp, loader):
+    errors, done = [], []
+
+    def failing_callback(error):
+        errors.append(error)
+        raise RuntimeError("콜백 오류")
+
+    loader.submit(lambda: 1 / 0, description="나누기", on_error=failing_callback)
+    loader.submit(lambda: "next", on_done=done.append)
+    wait_until(qapp, lambda: done)
+    assert len(errors) == 1 and isinstance(errors[0], ZeroDivisionError)
+    assert done == ["next"] # 콜백 오류가 이후 작업 전달을 막지 않습니다.
+    assert loader.pending_count() == 0
@@ -0,0 +1,40 @@
+# oceanocal_v2/tests/test_colorbar_handler.py
+
+import numpy as np
+import pytest
+
+from ..handlers.colorbar_handler import ColormapRegistry, FALLBACK_COLORS
+
+
+@pytest.fixture
+def registry(tmp_path):
+    (tmp_path / "bw.pal").write_text("# black to white\n0 0 0\n255 255 255\n", encoding="utf-8")
+    (tmp_path / "broken.pal").write_text("10 20\n", encoding="utf-8") # 색이 2개 미만이면 기본 3색
+    return ColormapRegistry(str(tmp_path))
+
+
+def test_names_and_pal_suffix(registry):
+    assert registry.names() == ["broken", "bw"]
+    assert "bw.pal" in registry
+    assert registry.rgb("bw.pal") is registry.rgb("bw")
+
+
+def test_lut_interpolates_linearly_and_is_memoised(registry):
+    lut = registry.lut("bw", size=5)
+    assert lut.dtype == np.uint8
+    assert lut[:, 0].tolist() == [0, 64, 128, 191, 255]
+    assert (lut[:, 0] == lut[:, 2]).all()
+    assert registry.lut("bw", size=5) is lut
+    assert not lut.flags.writeable
+
+
+def test_builtin_and_unknown_colormaps(registry):
+    viridis = registry.lut("viridis")
+    assert viridis.shape == (256, 3)
+    assert not np.array_equal(viridis[0], viridis[-1])
+    np.testing.assert_array_equal(registry.rgb("no-such-map"), FALLBACK_COLORS)
+    np.testing.assert_array_equal(registry.rgb("broken"), FALLBACK_COLORS)
+
+
+def test_plotly_colorscale_spans_zero_to_one(registry):
+    assert registry.plotly_colorscale("bw") == [(0.0, "#000000"), (1.0, "#ffffff")]
@@ -0,0 +1,96 @@
+# oceanocal_v2/tests/test_dataset_handle_pool.py
+
+import threading
+import time
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from .. import dataset_manager
+from ..dataset_manager import DatasetHandlePool
+
+
+def write_file(path, value=0.0, group=None):
+    xr.Dataset({"v": (("x",), np.full(3, value))}).to_netcdf(path, group=group, mode="a" if path.exists() else "w")
+    return str(path)
+
+
+@pytest.fixture
+def files(tmp_path):
+    return [write_file(tmp_path / f"f{i}.nc", i) for i in range(3)]
+
+
+def test_handles_are_shared_with_a_refcount(files):
+    pool = DatasetHandlePool()
+    first = pool.acquire(files[0])
+    assert pool.acquire(files[0]) is first
+    assert pool.refcount(files[0]) == 2
+    assert pool.stats()["hits"] == 1 and pool.stats()["misses"] == 1
+    pool.release(files[0])
+    pool.release(files[0])
+    pool.release(files[0]) # 빌려가지 않은 반환은 무시
+    assert pool.refcount(files[0]) == 0
+    assert pool.peek(files[0]) is first # 유휴 핸들은 바로 닫지 않습니다.
+    pool.close_all()
+
+
+def test_only_idle_handles_are_evicted_in_lru_order(files):
+    pool = DatasetHandlePool(max_handles=2)
+    pool.acquire(files[0]) # 계속 사용 중
+    pool.acquire(files[1])
+    pool.release(files[1])
+    pool.acquire(files[2])
+    assert pool.peek(files[1]) is None # 유휴 핸들만 닫힘
+    assert pool.peek(files[0]) is not None and pool.peek(files[2]) is not None
+    pool.acquire(files[1]) # 남은 두 핸들이 모두 사용 중이면 최대 개수를 넘어도 닫지 않습니다.
+    assert pool.stats()["open_handles"] == 3 and pool.stats()["evictions"] == 1
+    pool.close_all()
+
+
+def test_concurrent_acquire_opens_one_handle(files, monkeypatch):
+    opened = []
+    open_dataset = xr.open_dataset
+
+    def slow_open(*args, **kwargs):
+        opened.append(args[0])
+        time.sleep(0.05) # 다른 스레드가 여는 중에 같은 키를 요청하도록
+        return open_dataset(*args, **kwargs)
+
+    monkeypatch.setattr(dataset_manager.xr, "open_dataset", slow_open)
+    pool = DatasetHandlePool()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.acquire(files[0]))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert opened == [files[0]]
+    assert all(ds is results[0] for ds in results)
+    assert pool.refcount(files[0]) == 8
+    pool.close_all()
+
+
+def test_failed_open_leaves_no_pending_entry(tmp_path):
+    pool = DatasetHandlePool()
+    path = tmp_path / "late.nc"
+    with pytest.raises(Exception):
+        pool.acquire(str(path))
+    assert pool._opening == {} and pool.refcount(str(path)) == 0
+    write_file(path)
+    assert pool.acquire(str(path))["v"].size == 3 # 다음 요청은 기다리지 않고 다시 엽니다.
+    pool.close_all()
+
+
+def test_groups_are_keyed_by_file_and_group(tmp_path):
+    path = write_file(tmp_path / "groups.nc", 1.0)
+    write_file(tmp_path / "groups.nc", 2.0, group="ocean")
+    pool = DatasetHandlePool()
+    root = pool.acquire(path)
+    ocean = pool.acquire(path, group="/ocean")
+    assert ocean is not root
+    assert pool.acquire(path, group="ocean/") is ocean # 그룹 경로는 정규화됩니다.
+    assert float(ocean["v"][0]) == 2.0 and float(root["v"][0]) == 1.0
+    assert (pool.refcount(path), pool.refcount(path, "/ocean")) == (1, 2)
+    assert pool.acquire(path, group="/") is root # 루트 그룹은 파일 경로 키
+    pool.close_all()
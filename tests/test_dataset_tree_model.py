@@ -0,0 +1,112 @@
+# oceanocal_v2/tests/test_dataset_tree_model.py
+
+import pytest
+from PyQt6.QtCore import QModelIndex, Qt
+
+from ..dataset_tree_model import (DatasetTreeModel, NameRole, KIND_FILE, KIND_DATA_VARIABLE, KIND_ATTRIBUTE)
+from ..metadata_index import MetadataIndex, VariableMeta
+
+
+def make_index(filepath, group="/", groups=(), data_vars=("sst",)):
+    variables = {name: VariableMeta(name, ("lat",), (3,), "float64", (("units", "degC"),)) for name in data_vars}
+    variables["lat"] = VariableMeta("lat", ("lat",), (3,), "float64", ())
+    return MetadataIndex(filepath, (("lat", 3),), ("lat",), tuple(data_vars), variables, (("title", "test"),),
+                         group=group, groups=groups)
+
+
+@pytest.fixture
+def model(qapp):
+    return DatasetTreeModel()
+
+
+def child(model, parent, label):
+    """parent를 펼치고 label 행의 인덱스를 반환합니다."""
+    if model.canFetchMore(parent):
+        model.fetchMore(parent)
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        if model.data(index) == label:
+            return index
+    raise AssertionError(f"{label!r} 행이 없습니다")
+
+
+def test_children_are_created_only_when_fetched(model):
+    model.add_file(make_index("/data/a.nc"))
+    file_index = model.index(0, 0)
+    assert model.data(file_index, Qt.ItemDataRole.UserRole) == KIND_FILE
+    assert model.hasChildren(file_index) and model.canFetchMore(file_index)
+    assert model.rowCount(file_index) == 0 # 펼치기 전에는 자식 행이 없습니다.
+    model.fetchMore(file_index)
+    assert not model.canFetchMore(file_index)
+    assert [model.data(model.index(row, 0, file_index)) for row in range(model.rowCount(file_index))] == \
+        ["Dimensions", "Coordinates", "Data Variables", "Global Attributes"]
+    variables = child(model, file_index, "Data Variables")
+    assert model.hasChildren(variables) and model.rowCount(variables) == 0
+    sst = child(model, variables, "sst")
+    assert model.data(sst, Qt.ItemDataRole.UserRole) == KIND_DATA_VARIABLE
+    assert model.parent(sst) == variables
+    units = child(model, child(model, sst, "Attributes"), "units: degC")
+    assert model.data(units, Qt.ItemDataRole.UserRole) == KIND_ATTRIBUTE
+    assert model.data(units, NameRole) == "units"
+    assert model.metadata_index(units).filepath == "/data/a.nc"
+
+
+def test_fetch_more_twice_does_not_duplicate_rows(model):
+    model.add_file(make_index("/data/a.nc"))
+    file_index = model.index(0, 0)
+    model.fetchMore(file_index)
+    model.fetchMore(file_index)
+    assert model.rowCount(file_index) == 4
+
+
+def test_add_and_remove_files_keep_rows_in_order(model):
+    inserted, removed = [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((parent.isValid(), first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((parent.isValid(), first, last)))
+    paths = ["/data/a.nc", "/data/b.nc", "/data/c.nc"]
+    assert [model.add_file(make_index(path)) for path in paths] == [0, 1, 2]
+    assert model.add_file(make_index("/data/b.nc")) == 1 # 이미 있는 파일은 다시 추가하지 않습니다.
+    assert inserted == [(False, 0, 0), (False, 1, 1), (False, 2, 2)]
+    model.fetchMore(model.file_index("/data/c.nc")) # 펼친 파일의 하위 트리는 행이 옮겨져도 유지됩니다.
+
+    assert model.remove_file("/data/a.nc")
+    assert not model.remove_file("/data/a.nc")
+    assert removed == [(False, 0, 0)]
+    assert model.file_paths() == ["/data/b.nc", "/data/c.nc"]
+    c_index = model.file_index("/data/c.nc")
+    assert c_index.row() == 1 and model.data(c_index) == "c.nc"
+    variables = model.index(2, 0, c_index)
+    assert model.parent(variables).row() == 1 # 자식의 부모 인덱스도 새 행 번호를 가리킵니다.
+    assert not model.file_index("/data/a.nc").isValid()
+
+
+def test_group_nodes_request_their_index_once_and_fill_in(model):
+    requests = []
+    model.group_index_requested.connect(lambda filepath, group: requests.append((filepath, group)))
+    model.add_file(make_index("/data/g.nc", groups=("ocean",)))
+    ocean = child(model, child(model, model.index(0, 0), "Groups"), "ocean")
+    assert model.data(ocean, NameRole) == "/ocean"
+    assert model.hasChildren(ocean) and model.canFetchMore(ocean)
+    model.fetchMore(ocean)
+    model.fetchMore(ocean) # 응답을 기다리는 동안 다시 펼쳐도 한 번만 요청합니다.
+    assert requests == [("/data/g.nc", "/ocean")]
+    assert model.rowCount(ocean) == 0
+
+    model.set_group_index(make_index("/data/g.nc", group="/ocean", groups=("deep",), data_vars=("sst",)))
+    assert model.data(model.index(3, 0, ocean)) == "Groups"
+    assert model.metadata_index(child(model, ocean, "Data Variables")).variable_path("sst") == "/ocean/sst"
+    deep = child(model, child(model, ocean, "Groups"), "deep")
+    assert model.data(deep, NameRole) == "/ocean/deep"
+    model.fetchMore(deep)
+    assert requests[-1] == ("/data/g.nc", "/ocean/deep")
+
+
+def test_failed_group_load_can_be_requested_again(model):
+    requests = []
+    model.group_index_requested.connect(lambda filepath, group: requests.append(group))
+    model.add_file(make_index("/data/g.nc", groups=("ocean",)))
+    ocean = child(model, child(model, model.index(0, 0), "Groups"), "ocean")
+    model.fetchMore(ocean)
+    model.group_load_failed("/data/g.nc", "/ocean")
+    model.fetchMore(ocean)
+    assert requests == ["/ocean", "/ocean"]
@@ -0,0 +1,74 @@
+# oceanocal_v2/tests/test_decimation_handler.py
+
+import numpy as np
+
+from ..handlers.decimation_handler import (DECIMATION_FACTOR, minmax_indices, thin_indices, coord_sort_key,
+                                           DecimatedSeries)
+
+
+def test_minmax_indices_keeps_short_series():
+    assert minmax_indices(np.arange(8.0), 2).tolist() == list(range(8)) # 8 <= 4점 × 2구간
+
+
+def test_minmax_indices_keeps_first_min_max_last_per_bin():
+    values = np.array([5.0, 9.0, 1.0, 4.0, 3.0, 2.0, 8.0, 0.0, 6.0, 7.0])
+    # 5개씩 두 구간: [5, 9, 1, 4, 3] -> 0, 1, 2, 4 / [2, 8, 0, 6, 7] -> 5, 6, 7, 9
+    assert minmax_indices(values, 2).tolist() == [0, 1, 2, 4, 5, 6, 7, 9]
+
+
+def test_minmax_indices_preserves_extremes_and_order():
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=100_000)
+    values[12_345] = 50.0
+    values[67_890] = -50.0
+    indices = minmax_indices(values, 500)
+    assert len(indices) <= DECIMATION_FACTOR * 500
+    assert (np.diff(indices) > 0).all()
+    assert {0, 12_345, 67_890, len(values) - 1} <= set(indices.tolist())
+
+
+def test_minmax_indices_skips_nan_extremes():
+    values = np.arange(40.0)
+    values[10:20] = np.nan # 한 구간 전체가 NaN이면 처음/마지막 인덱스만 남아 결측 간격이 됩니다.
+    indices = minmax_indices(values, 4)
+    assert indices[(indices >= 10) & (indices < 20)].tolist() == [10, 19]
+    assert {0, 9, 20, 29, 30, 39} <= set(indices.tolist())
+
+
+def test_thin_indices_includes_extremes():
+    values = np.linspace(0, 1, 1000)
+    values[501] = 10.0
+    values[503] = -10.0
+    indices = thin_indices(values, 50)
+    assert len(indices) <= 50
+    assert 501 in indices and 503 in indices
+    assert thin_indices(values[:10], 50).tolist() == list(range(10))
+
+
+def test_coord_sort_key_converts_time_to_nanoseconds():
+    times = np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]")
+    assert np.diff(coord_sort_key(times))[0] == 86_400 * 10**9
+
+
+def test_decimated_series_view_windows_ascending_coord():
+    coord = np.arange(100_000.0)
+    series = DecimatedSeries(coord, np.sin(coord / 100))
+    x, y = series.view(pixels=100)
+    assert len(x) <= DECIMATION_FACTOR * 100 and x[0] == 0 and x[-1] == coord[-1]
+    x, y = series.view(1000.5, 1100.5, pixels=1000) # 좁은 구간은 줄이지 않고 양 옆 한 점까지
+    assert x[0] == 1000 and x[-1] == 1101 and len(x) == 102
+
+
+def test_decimated_series_view_handles_descending_and_time_coords():
+    depth = np.arange(50.0)[::-1]
+    x, _ = DecimatedSeries(depth, np.arange(50.0)).view(10, 20)
+    assert x.max() == 21 and x.min() == 9
+    times = np.arange("2020-01-01", "2020-03-01", dtype="datetime64[D]")
+    x, _ = DecimatedSeries(times, np.arange(len(times))).view(np.datetime64("2020-02-01"), np.datetime64("2020-02-03"))
+    assert x[0] == np.datetime64("2020-01-31") and x[-1] == np.datetime64("2020-02-04")
+
+
+def test_decimated_series_fills_masked_values():
+    values = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+    series = DecimatedSeries(np.arange(3), values)
+    assert np.isnan(series.values[1]) and len(series) == 3
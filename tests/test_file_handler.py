@@ -0,0 +1,87 @@
+# oceanocal_v2/tests/test_file_handler.py
+
+import netCDF4
+import numpy as np
+import pytest
+
+from ..dataset_manager import DatasetManager
+from ..handlers.file_handler import (NetCDFFileHandler, join_group_path, normalize_group_path, read_group_entry,
+                                     split_variable_path)
+
+
+@pytest.fixture
+def grouped_file(tmp_path):
+    """루트(depth) / ocean(sst, lat 좌표) / ocean/deep(temp) 구조의 작은 NetCDF4 파일."""
+    path = str(tmp_path / "groups.nc")
+    with netCDF4.Dataset(path, "w") as root:
+        root.createDimension("depth", 2)
+        root.createVariable("depth", "f8", ("depth",))[:] = [0.0, 10.0]
+        ocean = root.createGroup("ocean")
+        ocean.title = "ocean group"
+        ocean.createDimension("lat", 3)
+        ocean.createVariable("lat", "f8", ("lat",))[:] = [10.0, 20.0, 30.0]
+        ocean.createVariable("sst", "f4", ("lat",))[:] = [1.0, 2.0, 3.0]
+        deep = ocean.createGroup("deep")
+        deep.createDimension("x", 2)
+        deep.createVariable("temp", "f4", ("x",))[:] = [4.0, 5.0]
+    return path
+
+
+def test_group_path_helpers():
+    assert normalize_group_path(None) == "/" and normalize_group_path("ocean/deep/") == "/ocean/deep"
+    assert join_group_path("/", "ocean") == "/ocean" and join_group_path("ocean", "deep") == "/ocean/deep"
+    assert split_variable_path("/ocean/deep/temp") == ("/ocean/deep", "temp")
+    assert split_variable_path("depth") == ("/", "depth")
+
+
+def test_read_group_entry(grouped_file):
+    assert read_group_entry(grouped_file, "/") == (("ocean",), ("depth",))
+    assert read_group_entry(grouped_file, "ocean") == (("deep",), ("lat", "sst"))
+    assert read_group_entry(grouped_file, "/ocean/deep") == ((), ("temp",))
+    with pytest.raises(KeyError):
+        read_group_entry(grouped_file, "/missing")
+
+
+def test_handler_resolves_and_caches_variable_paths(grouped_file, monkeypatch):
+    handler = NetCDFFileHandler()
+    assert handler.load_file(grouped_file) == ("ocean",)
+    assert handler.peek_group("/ocean") is None # 펼치기 전에는 읽지 않습니다.
+    assert handler.get_variable_by_path("/ocean/deep/temp") == ("/ocean/deep", "temp")
+    assert handler.get_variable_by_path("/ocean/missing") is None
+    assert handler.get_variable_by_path("/nope/sst") is None
+    monkeypatch.setattr(handler, "list_variables", lambda group: pytest.fail("캐시된 경로는 다시 읽지 않아야 합니다"))
+    assert handler.get_variable_by_path("/ocean/deep/temp") == ("/ocean/deep", "temp")
+    handler.add_group("/other", ((), ("v",)))
+    assert handler.peek_group("other/") == ((), ("v",))
+
+
+def test_dataset_manager_opens_groups_by_variable_path(grouped_file):
+    manager = DatasetManager()
+    manager.open_file(grouped_file)
+    assert manager.list_groups(grouped_file) == ("ocean",)
+    assert manager.resolve_variable_path(grouped_file, "depth") == ("/", "depth")
+    assert manager.resolve_variable_path(grouped_file, "/ocean/sst") == ("/ocean", "sst")
+    sst = manager.get_variable_by_path(grouped_file, "/ocean/sst")
+    np.testing.assert_array_equal(sst.values, [1.0, 2.0, 3.0])
+    assert manager.get_dataset(grouped_file, "/ocean") is not None # 변수 경로로 그룹이 열렸습니다.
+    assert manager.get_variable_by_path(grouped_file, "/ocean/deep/missing") is None
+
+    ds = manager.get_dataset(grouped_file, "/ocean")
+    index = manager._build_metadata_index(grouped_file, ds, "/ocean")
+    assert index.groups == ("deep",) and index.data_vars == ("sst",)
+    assert ("title", "ocean group") in index.global_attrs
+    assert index.variable_path("sst") == "/ocean/sst"
+
+    manager.close_file(grouped_file)
+    assert manager.group_datasets == {} and manager.handle_pool.refcount(grouped_file, "/ocean") == 0
+    manager.handle_pool.close_all()
+
+
+def test_group_entries_read_in_the_worker_are_remembered(grouped_file):
+    manager = DatasetManager()
+    entry = manager._read_group_entry(grouped_file, "/ocean")
+    assert entry == (("deep",), ("lat", "sst"))
+    assert grouped_file not in manager.group_handlers # 작업 스레드 쪽은 캐시를 바꾸지 않습니다.
+    manager._remember_group(grouped_file, "/ocean", entry)
+    assert manager.group_handlers[grouped_file].peek_group("/ocean") == entry
+    assert manager._read_group_entry(grouped_file, "/missing") is None
@@ -0,0 +1,79 @@
+# oceanocal_v2/tests/test_metadata_cache.py
+
+import os
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from .. import metadata_cache
+from ..metadata_cache import MetadataCache
+from ..metadata_index import MetadataIndex
+
+
+def snapshot(index):
+    return {name: getattr(index, name) for name in MetadataIndex.__slots__}
+
+
+@pytest.fixture
+def nc_file(tmp_path):
+    path = str(tmp_path / "a.nc")
+    xr.Dataset(
+        {"sst": (("time", "lat"), np.arange(6.0).reshape(2, 3), {"units": "degC", "valid_max": np.float32(40)})},
+        coords={"time": np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[ns]"), "lat": [10.0, 20.0, 30.0]},
+        attrs={"title": "test"},
+    ).to_netcdf(path)
+    return path
+
+
+@pytest.fixture
+def index(nc_file):
+    with xr.open_dataset(nc_file) as ds:
+        return MetadataIndex.from_dataset(nc_file, ds)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MetadataCache(str(tmp_path / "cache.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def test_index_dict_round_trip(index):
+    assert index.coord_ranges["lat"] == ("10.0", "30.0")
+    assert index.coord_ranges["time"][0].startswith("2020-01-01")
+    assert snapshot(MetadataIndex.from_dict(index.to_dict())) == snapshot(index)
+
+
+def test_put_get_round_trip(cache, index, nc_file):
+    assert cache.get(nc_file) is None
+    cache.put(index)
+    cached = cache.get(nc_file)
+    assert snapshot(cached) == snapshot(index)
+    assert cached.get_variable("sst").attrs == (("units", "degC"), ("valid_max", "40.0"))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get(nc_file, group="/ocean") is None # 하위 그룹은 다른 키
+
+
+def test_changed_mtime_invalidates(cache, index, nc_file):
+    cache.put(index)
+    stat = os.stat(nc_file)
+    os.utime(nc_file, (stat.st_atime, stat.st_mtime + 10))
+    assert cache.get(nc_file) is None
+    os.utime(nc_file, (stat.st_atime, stat.st_mtime))
+    assert cache.get(nc_file) is None # 무효한 항목은 지워집니다.
+
+
+def test_changed_size_invalidates(cache, index, nc_file):
+    cache.put(index)
+    stat = os.stat(nc_file)
+    with open(nc_file, "ab") as f:
+        f.write(b"\0")
+    os.utime(nc_file, (stat.st_atime, stat.st_mtime)) # mtime은 그대로 두고 크기만 바꿉니다.
+    assert cache.get(nc_file) is None
+
+
+def test_format_version_change_invalidates(cache, index, nc_file, monkeypatch):
+    cache.put(index)
+    monkeypatch.setattr(metadata_cache, "CACHE_FORMAT_VERSION", metadata_cache.CACHE_FORMAT_VERSION + 1)
+    assert cache.get(nc_file) is None
@@ -0,0 +1,30 @@
+# oceanocal_v2/tests/test_option_change_handler.py
+
+from ..handlers.option_change_handler import (
+    OPTION_CHANGE_COLOR, OPTION_CHANGE_DATA, OPTION_CHANGE_NONE, OPTION_CHANGE_STYLE,
+    changed_options, classify_option_change,
+)
+
+BASE = {'title': 'SST', 'cmap': 'viridis', 'vmin': 0.0, 'vmax': 30.0, 'time_index': 0}
+
+
+def test_changed_options_compares_new_keys_with_none():
+    assert changed_options(BASE, dict(BASE)) == set()
+    assert changed_options(BASE, {**BASE, 'cmap': 'jet', 'grid': True}) == {'cmap', 'grid'}
+    assert changed_options(BASE, {**BASE, 'log_scale': None}) == set() # 없던 키 = None
+
+
+def test_unchanged_options_need_no_update():
+    assert classify_option_change(BASE, dict(BASE)) == OPTION_CHANGE_NONE
+
+
+def test_style_and_color_changes():
+    assert classify_option_change(BASE, {**BASE, 'title': 'Temp'}) == OPTION_CHANGE_STYLE
+    assert classify_option_change(BASE, {**BASE, 'vmax': 25.0}) == OPTION_CHANGE_COLOR
+    # 여러 종류가 함께 바뀌면 가장 비싼 갱신을 따릅니다.
+    assert classify_option_change(BASE, {**BASE, 'title': 'Temp', 'log_scale': True}) == OPTION_CHANGE_COLOR
+
+
+def test_data_and_unknown_options_reload_data():
+    assert classify_option_change(BASE, {**BASE, 'time_index': 1}) == OPTION_CHANGE_DATA
+    assert classify_option_change(BASE, {**BASE, 'title': 'Temp', 'some_new_option': 1}) == OPTION_CHANGE_DATA
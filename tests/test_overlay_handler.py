@@ -0,0 +1,197 @@
+# oceanocal_v2/tests/test_overlay_handler.py
+
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from ..handlers import overlay_handler
+from ..handlers.overlay_handler import CompiledOverlay, load_overlay
+
+SEGMENT_TEXT = """segment 1  rank 1  points 3
+10.0 20.0
+11.0 21.0
+12.0 20.0
+segment 2  rank 1  points 2
+-30.0 -5.0
+-31.0 -6.0
+"""
+
+
+@pytest.fixture
+def overlay_cache(tmp_path, monkeypatch):
+    """컴파일 캐시를 임시 디렉토리에 두고 메모리 LRU를 비웁니다."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(overlay_handler, "OVERLAY_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(overlay_handler, "_overlay_lru", OrderedDict())
+    return cache_dir
+
+
+def _overlay(*segments, color="black"):
+    return CompiledOverlay.from_segments([(np.asarray(coords, dtype=float), f"s{i}", color)
+                                          for i, coords in enumerate(segments)])
+
+
+def test_from_segments_packs_coords_and_offsets():
+    overlay = _overlay([[0, 0], [1, 1], [2, 0]], [[5, 5], [6, 6]])
+    assert len(overlay) == 2
+    assert overlay.n_points == 5
+    assert overlay.offsets.tolist() == [0, 3, 5]
+    lons, lats, name, color = list(overlay.segments())[1]
+    assert lons.tolist() == [5, 6] and lats.tolist() == [5, 6]
+    assert (name, color) == ("s1", "black")
+
+
+def test_from_segments_drops_empty_segments():
+    overlay = _overlay([[0, 0], [1, 1]], np.empty((0, 2)))
+    assert len(overlay) == 1
+
+
+def test_load_overlay_writes_and_reuses_compiled_cache(tmp_path, overlay_cache, monkeypatch):
+    source = tmp_path / "coast.txt"
+    source.write_text(SEGMENT_TEXT, encoding="utf-8")
+    overlay = load_overlay(str(source))
+    assert len(overlay) == 2
+    assert len(list(overlay_cache.glob("coast-*.npz"))) == 1
+
+    # 메모리 LRU를 비워도 원본을 다시 파싱하지 않고 .npz에서 읽어야 합니다.
+    monkeypatch.setattr(overlay_handler, "_overlay_lru", OrderedDict())
+    monkeypatch.setattr(overlay_handler, "compile_overlay", lambda path: pytest.fail("recompiled"))
+    cached = load_overlay(str(source))
+    np.testing.assert_array_equal(cached.coords, overlay.coords)
+    np.testing.assert_array_equal(cached.offsets, overlay.offsets)
+    np.testing.assert_array_equal(cached.importance, overlay.importance)
+
+
+def test_load_overlay_recompiles_when_source_changes(tmp_path, overlay_cache):
+    source = tmp_path / "coast.txt"
+    source.write_text(SEGMENT_TEXT, encoding="utf-8")
+    assert len(load_overlay(str(source))) == 2
+    source.write_text(SEGMENT_TEXT.split("segment 2")[0], encoding="utf-8")
+    assert len(load_overlay(str(source))) == 1
+
+
+def test_load_overlay_missing_file_returns_none(tmp_path, overlay_cache):
+    assert load_overlay(str(tmp_path / "missing.txt")) is None
+
+
+def test_parse_segment_file_splits_on_header_point_counts(tmp_path):
+    source = tmp_path / "bdy.txt"
+    source.write_text(SEGMENT_TEXT, encoding="utf-8")
+    overlay = overlay_handler._parse_segment_file(str(source), "bdy.txt")
+    assert overlay.offsets.tolist() == [0, 3, 5]
+    assert overlay.coords[:, 0].tolist() == [10, 11, 12, -30, -31] # [lon, lat] 순서
+    assert overlay.coords[:, 1].tolist() == [20, 21, 20, -5, -6]
+    assert overlay.names[0] == "bdy.txt segment 1  rank 1  points 3"
+
+
+def test_parse_segment_file_drops_empty_segments(tmp_path):
+    source = tmp_path / "bdy.txt"
+    source.write_text("segment 1 rank 1 points 0\n" + SEGMENT_TEXT.replace("segment 1", "segment 9"), encoding="utf-8")
+    overlay = overlay_handler._parse_segment_file(str(source), "bdy.txt")
+    assert len(overlay) == 2
+    assert overlay.offsets.tolist() == [0, 3, 5]
+
+
+def test_parse_segment_file_rejects_count_mismatch(tmp_path):
+    source = tmp_path / "bdy.txt"
+    source.write_text(SEGMENT_TEXT.replace("points 2", "points 4"), encoding="utf-8")
+    assert overlay_handler._parse_segment_file(str(source), "bdy.txt") is None
+
+
+def test_compile_overlay_matches_line_by_line_parser(tmp_path):
+    source = tmp_path / "bdy.txt"
+    source.write_text(SEGMENT_TEXT, encoding="utf-8")
+    fast = overlay_handler.compile_overlay(str(source))
+    slow = CompiledOverlay.from_segments(overlay_handler._parse_text(str(source), "bdy.txt"))
+    np.testing.assert_array_equal(fast.coords, slow.coords)
+    np.testing.assert_array_equal(fast.offsets, slow.offsets)
+
+
+def test_compile_overlay_reads_csv_lines_as_lat_lon_pairs(tmp_path):
+    source = tmp_path / "track.csv"
+    source.write_text("20,10,21,11\n1,2,3\n", encoding="utf-8") # 두 번째 줄은 홀수 개수라 버립니다.
+    overlay = overlay_handler.compile_overlay(str(source))
+    assert len(overlay) == 1
+    assert overlay.coords.tolist() == [[10, 20], [11, 21]]
+    assert overlay.colors[0] == overlay_handler.CSV_LINE_COLOR
+
+
+def test_merged_joins_segments_per_color_with_nan_separators():
+    overlay = CompiledOverlay.from_segments([
+        (np.array([[0.0, 0.0], [1.0, 1.0]]), "a", "black"),
+        (np.array([[5.0, 5.0], [6.0, 6.0], [7.0, 5.0]]), "b", "blue"),
+        (np.array([[2.0, 2.0], [3.0, 3.0]]), "c", "black"),
+    ])
+    merged = overlay.merged()
+    assert set(merged) == {"black", "blue"}
+    lon, lat = merged["black"]
+    np.testing.assert_array_equal(lon, [0, 1, np.nan, 2, 3])
+    np.testing.assert_array_equal(lat, [0, 1, np.nan, 2, 3])
+    np.testing.assert_array_equal(merged["blue"][0], [5, 6, 7])
+    assert overlay.merged() is merged # 오버레이 객체에 캐시됩니다.
+
+
+def test_dp_importance_marks_endpoints_and_caps_by_parent():
+    coords = np.array([[0, 0], [1, 0.1], [2, 1], [4, 0]], dtype=float)
+    importance = overlay_handler._dp_importance(coords, np.array([0, 4]))
+    assert np.isinf(importance[0]) and np.isinf(importance[3])
+    assert importance[2] == pytest.approx(1.0) # 현(0,0)-(4,0)에서 가장 먼 점
+    assert importance[1] == pytest.approx(0.8 / np.sqrt(5)) # 하위 현(0,0)-(2,1)까지의 거리
+    assert importance[1] <= importance[2]
+
+
+def test_dp_importance_zeroes_points_below_smallest_level():
+    coords = np.array([[0, 0], [1, 0.001], [2, 0]], dtype=float)
+    assert overlay_handler._dp_importance(coords, np.array([0, 3]))[1] == 0
+
+
+def test_simplified_picks_coarsest_level_within_tolerance():
+    overlay = _overlay([[0, 0], [1, 0.5], [2, 0]], [[10, 0], [11, 0.001], [12, 0]])
+    assert overlay.simplified(0.001) is overlay # 가장 작은 단계보다 작으면 원본
+    simplified = overlay.simplified(0.01)
+    assert simplified.offsets.tolist() == [0, 3, 5] # 두 번째 선분의 가운데 점만 빠집니다.
+    assert overlay.simplified(0.01) is simplified # 단계별로 캐시됩니다.
+    assert overlay.simplified(1.0).n_points == 5 # 0.25 단계: 0.5 떨어진 점은 남습니다.
+
+
+def test_clipped_keeps_neighbours_and_splits_at_gaps():
+    overlay = _overlay([[0, 0], [1, 5], [2, 6], [3, 5], [4, 0]])
+    clipped = overlay.clipped((-1, 5), (-1, 1))
+    assert clipped.offsets.tolist() == [0, 2, 4]
+    assert clipped.coords[:, 0].tolist() == [0, 1, 3, 4]
+    assert overlay.clipped((-10, 10), (-10, 10)) is overlay
+
+
+def test_view_simplifies_by_pixel_size():
+    overlay = _overlay([[0, 0], [1, 0.1], [2, 0]])
+    # 지구 전체(360도)를 1000픽셀에 그리면 0.25 단계이므로 0.1 떨어진 점은 빠집니다.
+    assert overlay.view(pixels=1000).n_points == 2
+    assert overlay.view((0, 2), (-1, 1), pixels=1000).n_points == 3
+
+
+def test_segment_grid_index_query_matches_brute_force():
+    rng = np.random.default_rng(0)
+    lon0, lat0 = rng.uniform(-180, 170, 200), rng.uniform(-90, 80, 200)
+    bounds = np.column_stack((lon0, lat0, lon0 + rng.uniform(0, 30, 200), lat0 + rng.uniform(0, 10, 200)))
+    index = overlay_handler.SegmentGridIndex(bounds)
+    for lon_range, lat_range in [((-20, 15), (-5, 40)), ((100, 101), (0, 1)), ((-180, 180), (-90, 90))]:
+        expected = np.flatnonzero((bounds[:, 0] <= lon_range[1]) & (bounds[:, 2] >= lon_range[0]) &
+                                  (bounds[:, 1] <= lat_range[1]) & (bounds[:, 3] >= lat_range[0]))
+        assert index.query(lon_range, lat_range).tolist() == expected.tolist()
+
+
+def test_segment_grid_index_keeps_out_of_grid_longitudes():
+    # 0~360 경도 좌표는 가장자리 칸에 들어가므로 조회에서 빠지지 않아야 합니다.
+    bounds = np.array([[300.0, 10.0, 310.0, 20.0]])
+    index = overlay_handler.SegmentGridIndex(bounds)
+    assert index.query((295, 305), (0, 30)).tolist() == [0]
+
+
+def test_select_returns_only_segments_in_extent():
+    overlay = _overlay([[0, 0], [1, 1]], [[100, 50], [101, 51]], [[0.5, 0.5], [2, 2], [3, 1]])
+    selected = overlay.select((-1, 4), (-1, 4))
+    assert selected.names.tolist() == ["s0", "s2"]
+    assert selected.offsets.tolist() == [0, 2, 5]
+    np.testing.assert_array_equal(selected.coords[2:], [[0.5, 0.5], [2, 2], [3, 1]])
+    assert overlay.select((-180, 180), (-90, 90)) is overlay
@@ -0,0 +1,89 @@
+# oceanocal_v2/tests/test_plot_manager.py
+
+import base64
+
+import numpy as np
+import pytest
+import xarray as xr
+
+pytest.importorskip("PyQt6.QtWebEngineWidgets", exc_type=ImportError) # plot_manager는 QtWebEngine이 있어야 임포트됩니다.
+
+from PyQt6.QtWidgets import QWidget # noqa: E402
+
+from ..dataset_manager import DatasetManager # noqa: E402
+from ..plot_manager import QMessageBox, PlotWindow, _PlotBridge, _typed_array # noqa: E402
+from ..settings_manager import SettingsManager # noqa: E402
+from ..web_view_pool import WebViewPool # noqa: E402
+
+
+def decode(spec):
+    return np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+
+
+def test_masked_integers_are_widened_to_float_with_nan():
+    values = np.ma.masked_array(np.array([1, 2, 3], dtype=np.int64), mask=[False, True, False])
+    spec = _typed_array(values)
+    assert spec["dtype"] == "f8"
+    np.testing.assert_array_equal(decode(spec), [1.0, np.nan, 3.0])
+
+
+def test_masked_floats_keep_their_width():
+    spec = _typed_array(np.ma.masked_invalid(np.array([1.0, np.inf], dtype=np.float32)))
+    assert spec["dtype"] == "f4"
+    assert np.isnan(decode(spec)[1])
+
+
+def test_big_endian_input_is_sent_little_endian():
+    values = np.array([[1.5, -2.0], [3.25, 4.0]], dtype=">f4")
+    spec = _typed_array(values)
+    assert spec["dtype"] == "f4" and spec["shape"] == "2, 2"
+    np.testing.assert_array_equal(decode(spec).reshape(2, 2), values)
+    assert _typed_array(np.array([7], dtype=">i8"))["dtype"] == "i4" # int32에 들어가면 int32로
+
+
+def test_int64_outside_int32_and_non_numeric_values():
+    spec = _typed_array(np.array([0, 2 ** 40], dtype=np.int64))
+    assert spec["dtype"] == "f8" and decode(spec)[1] == 2.0 ** 40
+    labels = np.array(["a", "b"])
+    assert _typed_array(labels) is not None and _typed_array(labels).dtype.kind == "U"
+
+
+@pytest.fixture
+def plotly_window(qapp, monkeypatch, tmp_path):
+    """페이지 없이 브리지만 가진 뷰 풀과 메모리 데이터셋으로 만든 Plotly 창. 반환 횟수를 함께 돌려줍니다."""
+    errors = []
+    monkeypatch.setattr(QMessageBox, "critical", lambda parent, title, text: errors.append(text)) # 모달 대신 기록
+
+    def create_view():
+        view = QWidget()
+        view.plot_bridge = _PlotBridge(view)
+        return view
+
+    pool = WebViewPool(create_view, max_idle=2)
+    manager = DatasetManager()
+    released = []
+    dataset = xr.Dataset({"sst": (("x",), np.arange(5.0))})
+    monkeypatch.setattr(manager, "acquire_dataset", lambda filepath, group=None: dataset)
+    monkeypatch.setattr(manager, "release_dataset", lambda filepath, group=None: released.append(filepath))
+    window = PlotWindow(settings_manager=SettingsManager(str(tmp_path / "settings.json")), var_name="sst",
+                        plot_type="1D_generic", filepath="/data/a.nc", dataset_manager=manager, web_view_pool=pool)
+    assert errors == [] and window._figure is not None
+    return window, pool, released
+
+
+def test_reject_returns_the_view_and_dataset(plotly_window):
+    window, pool, released = plotly_window
+    view = window.browser
+    window.reject() # Esc와 같은 경로: closeEvent 없이 done()으로 닫힙니다.
+    assert window.browser is None and view in pool._idle
+    assert released == ["/data/a.nc"]
+    window.close() # 다시 닫아도 두 번 반환하지 않습니다.
+    assert released == ["/data/a.nc"] and pool._idle.count(view) == 1
+
+
+def test_close_returns_the_view_and_dataset(plotly_window):
+    window, pool, released = plotly_window
+    window.show()
+    window.close()
+    assert window.browser is None and len(pool._idle) == 1
+    assert released == ["/data/a.nc"]
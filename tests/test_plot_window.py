@@ -0,0 +1,128 @@
+# oceanocal_v2/tests/test_plot_window.py
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ..dataset_manager import DatasetManager
+from ..handlers import plot_handler
+from ..handlers.option_change_handler import OPTION_CHANGE_STYLE
+from ..plot_window_manager import PlotWindow
+
+FILE_PATH = "/data/field.nc"
+
+
+@pytest.fixture
+def open_window(qapp, monkeypatch):
+    """메모리의 데이터셋을 빌려주는 DatasetManager로 동기(loader 없음) PlotWindow를 만듭니다."""
+    windows = []
+
+    def open_window(dataset, variable_name, plot_type, options=None):
+        manager = DatasetManager()
+        monkeypatch.setattr(manager, "acquire_dataset", lambda filepath, group=None: dataset)
+        monkeypatch.setattr(manager, "release_dataset", lambda filepath, group=None: None)
+        window = PlotWindow("plot-1", "test", manager, FILE_PATH, variable_name, plot_type, dict(options or {}))
+        windows.append(window)
+        return window
+
+    yield open_window
+    for window in windows:
+        window.close()
+
+
+def test_large_field_is_rasterized_in_auto_mode(open_window):
+    # 4096x4096 필드: 메모리를 쓰지 않도록 한 줄을 broadcast한 읽기 전용 배열
+    row = np.arange(4096, dtype=np.float32)
+    dataset = xr.Dataset({"sst": (("lat", "lon"), np.broadcast_to(row, (4096, 4096)))},
+                         coords={"lat": np.arange(4096.0), "lon": np.arange(4096.0)})
+    window = open_window(dataset, "sst", "2d_heatmap", {"render_mode": "auto"})
+    data = window._read_plot_data()
+    assert data["kind"] == "raster"
+    assert data["z"].size < 4096 * 4096 # 그리는 것은 화면 해상도의 개요
+    assert window._kind == "raster"
+
+
+def test_small_field_stays_a_mesh_in_auto_mode(open_window):
+    dataset = xr.Dataset({"sst": (("lat", "lon"), np.arange(12.0).reshape(3, 4))},
+                         coords={"lat": np.arange(3.0), "lon": np.arange(4.0)})
+    window = open_window(dataset, "sst", "2d_heatmap", {"render_mode": "auto"})
+    assert window._kind == "mesh"
+
+
+@pytest.fixture
+def mesh_window(open_window):
+    dataset = xr.Dataset({"sst": (("lat", "lon"), np.arange(12.0).reshape(3, 4))},
+                         coords={"lat": np.arange(3.0), "lon": np.arange(4.0)})
+    return open_window(dataset, "sst", "2d_heatmap", {"title": "SST", "cmap": "viridis"})
+
+
+def test_style_change_updates_title_and_fonts_without_reading(mesh_window, monkeypatch):
+    monkeypatch.setattr(mesh_window, "refresh_plot", lambda: pytest.fail("스타일 변경은 데이터를 다시 읽지 않아야 합니다"))
+    change = mesh_window.update_plot_options({"title": "Temperature", "plot_font_size": 17})
+    assert change == OPTION_CHANGE_STYLE
+    assert mesh_window.ax.get_title() == "Temperature"
+    assert mesh_window.ax.title.get_fontsize() == 17
+    assert mesh_window.ax.xaxis.label.get_fontsize() == 17
+
+
+def test_options_dialog_names_reach_the_window(mesh_window, monkeypatch):
+    class FakeDialog:
+        def __init__(self, parent, current_options=None, settings_manager=None):
+            pass
+
+        def exec(self):
+            return True
+
+        def get_options(self):
+            return {"title_text": "From dialog", "xaxis_label": "", "yaxis_label": "Latitude", "cbar_label": "",
+                    "cmap": "viridis", "theme": "Light", "plot_font_family": "DejaVu Sans", "plot_font_size": 12}
+
+    class WindowManager:
+        def get_current_plot_options(self):
+            return mesh_window.get_current_plot_options()
+
+        def update_plot_options(self, options):
+            mesh_window.update_plot_options(options)
+
+    monkeypatch.setattr(plot_handler, "PlotLabelDialog", FakeDialog)
+    xlabel = mesh_window.ax.get_xlabel()
+    plot_handler.PlotHandler(None, None, WindowManager(), None).show_plot_options_dialog()
+    assert mesh_window.ax.get_title() == "From dialog"
+    assert mesh_window.ax.get_ylabel() == "Latitude"
+    assert mesh_window.ax.get_xlabel() == xlabel # 비워 둔 칸은 현재 값 유지
+
+
+def test_slice_position_is_recorded_on_the_gui_thread_only(open_window):
+    # 캔버스보다 큰 3D 필드: 개요는 건너뛰며 읽히고 확대하면 보이는 구간을 다시 읽습니다.
+    row = np.arange(2000, dtype=np.float32)[None, :, None]
+    dataset = xr.Dataset({"sst": (("lat", "lon", "time"), np.broadcast_to(row, (2000, 2000, 3)))},
+                         coords={"lat": np.arange(2000.0), "lon": np.arange(2000.0)})
+    window = open_window(dataset, "sst", "2d_heatmap", {"render_mode": "mesh"})
+    indexers, keep_dims = window._last_read
+    assert keep_dims == ("lat", "lon") and indexers["time"] == 0
+    overview = dict(indexers)
+
+    window._last_read = None
+    data = window._read_plot_data() # 작업 스레드에서 하는 읽기
+    assert window._last_read is None
+    assert data["slice"] == (overview, ("lat", "lon"))
+
+    window._on_plot_data(data)
+    zoom = window._read_refined_window({"lat": slice(0, 100), "lon": slice(0, 100)})
+    assert zoom["z"].shape == (100, 100) # 확대 구간 읽기는 기록하지 않습니다.
+    assert window._last_read == (overview, ("lat", "lon"))
+
+    window.step_slice(1)
+    assert window._last_read[0]["time"] == 1
+
+
+@pytest.mark.parametrize("render_mode", ["mesh", "rgba"])
+def test_colorbar_is_removed_with_the_axes_restored(open_window, render_mode):
+    dataset = xr.Dataset({"sst": (("lat", "lon"), np.arange(12.0).reshape(3, 4))},
+                         coords={"lat": np.arange(3.0), "lon": np.arange(4.0)})
+    window = open_window(dataset, "sst", "2d_heatmap", {"render_mode": render_mode})
+    assert window._colorbar is not None and len(window.figure.axes) == 2
+    window._display_error_message("error") # 축을 비운 뒤(mesh는 축에서 빠진 상태) 컬러바를 없앱니다.
+    assert window._colorbar is None
+    assert window.figure.axes == [window.ax]
+    assert window.ax.get_subplotspec() is window._ax_subplotspec
@@ -0,0 +1,85 @@
+# oceanocal_v2/tests/test_pyramid_cache.py
+
+import os
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from .. import pyramid_cache
+from ..pyramid_cache import _pool_block, _pool_coord, Pyramid, PyramidCache
+
+
+@pytest.fixture
+def field(monkeypatch):
+    """작은 단계까지 만들어지도록 크기 기준을 줄인 40x24 필드 (앞에 고정될 time 차원 포함)."""
+    monkeypatch.setattr(pyramid_cache, "PYRAMID_MIN_LEVEL_SIZE", 5)
+    monkeypatch.setattr(pyramid_cache, "PYRAMID_STRIP_ROWS", 16) # 여러 줄 묶음으로 나눠 읽기
+    values = np.arange(2 * 40 * 24, dtype=np.float64).reshape(2, 40, 24)
+    return xr.DataArray(values, dims=("time", "lat", "lon"),
+                        coords={"lat": np.arange(40.0), "lon": np.arange(24.0) * 2})
+
+
+def test_pool_block_averages_ignoring_nan():
+    block = np.array([[1.0, 3.0, np.nan, np.nan],
+                      [5.0, np.nan, np.nan, np.nan]])
+    pooled = _pool_block(block, 2)
+    assert pooled[0, 0] == pytest.approx(3.0)
+    assert np.isnan(pooled[0, 1])
+    assert pooled.dtype == np.float32
+
+
+def test_pool_coord_averages_groups_including_remainder():
+    np.testing.assert_allclose(_pool_coord(np.arange(5.0), 2), [0.5, 2.5, 4.0])
+    times = np.array(["2020-01-01", "2020-01-03"], dtype="datetime64[D]")
+    assert _pool_coord(times, 2)[0] == np.datetime64("2020-01-02")
+
+
+def test_build_matches_direct_pooling(field):
+    pyramid = Pyramid.build(field, "lat", "lon")
+    assert pyramid.shape == (40, 24)
+    assert [level.factor for level in pyramid.levels] == [2, 4, 8]
+    first = field.isel(time=0).values
+    level = pyramid.levels[0]
+    np.testing.assert_allclose(level.values, first.reshape(20, 2, 12, 2).mean(axis=(1, 3)))
+    np.testing.assert_allclose(level.cols, np.arange(12) * 4 + 1)
+    # 8배 단계는 24열을 3칸으로, 40행을 5칸으로 (마지막 칸은 남은 값만 평균)
+    assert pyramid.levels[2].values.shape == (5, 3)
+
+
+def test_select_and_read_window(field):
+    pyramid = Pyramid.build(field, "lat", "lon")
+    assert pyramid.select(5, 3).factor == 8
+    assert pyramid.select(10, 6).factor == 4
+    assert pyramid.select(20, 12).factor == 2
+    assert pyramid.select(30, 24) is None # 20행 단계로는 부족하면 원본을 읽어야 합니다.
+    rows, cols, values = pyramid.read_window({"lat": slice(0, 40, 4), "lon": slice(8, 24, 4)})
+    np.testing.assert_array_equal(values, pyramid.levels[1].values[0:10, 2:6])
+    assert pyramid.read_window({"lat": slice(0, 40, 1), "lon": slice(0, 24, 1)}) is None
+
+
+def test_cache_skips_small_fields_and_reuses_disk_entries(tmp_path, field, monkeypatch):
+    source = tmp_path / "data.nc"
+    source.write_bytes(b"x")
+    cache = PyramidCache(cache_dir=str(tmp_path / "cache"), min_cells=10_000)
+    assert cache.get(str(source), "v", field, "lat", "lon") is None
+
+    cache = PyramidCache(cache_dir=str(tmp_path / "cache"), min_cells=1)
+    built = cache.get(str(source), "v", field, "lat", "lon")
+    assert cache.get(str(source), "v", field, "lat", "lon") is built and cache.hits == 1
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    # 새 캐시 객체(앱 재시작)는 다시 만들지 않고 .npz에서 읽어야 합니다.
+    monkeypatch.setattr(Pyramid, "build", classmethod(lambda cls, *args: pytest.fail("rebuilt")))
+    pyramid = PyramidCache(cache_dir=str(tmp_path / "cache"), min_cells=1).get(str(source), "v", field, "lat", "lon")
+    for a, b in zip(pyramid.levels, built.levels):
+        np.testing.assert_array_equal(a.values, b.values)
+
+
+def test_cache_rebuilds_when_source_changes(tmp_path, field):
+    source = tmp_path / "data.nc"
+    source.write_bytes(b"x")
+    cache = PyramidCache(cache_dir=str(tmp_path / "cache"), min_cells=1)
+    first = cache.get(str(source), "v", field, "lat", "lon")
+    source.write_bytes(b"xy")
+    assert cache.get(str(source), "v", field, "lat", "lon") is not first
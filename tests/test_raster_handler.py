@@ -0,0 +1,89 @@
+# oceanocal_v2/tests/test_raster_handler.py
+
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from ..handlers.colorbar_handler import get_colormap_lut
+from ..handlers.raster_handler import (is_uniform, should_rasterize, limit_raster_size, colorize, encode_png,
+                                       cell_extent, rasterize)
+
+
+def test_is_uniform():
+    assert is_uniform(np.arange(10.0))
+    assert is_uniform(np.linspace(10, 0, 11)) # 감소하는 좌표도 일정한 간격
+    assert is_uniform(np.arange("2020-01-01", "2020-01-05", dtype="datetime64[D]"))
+    assert not is_uniform(np.array([0.0, 1.0, 3.0]))
+    assert not is_uniform(np.array([1.0]))
+    assert not is_uniform(np.array(["a", "b"]))
+
+
+def test_should_rasterize_modes():
+    x, y = np.arange(4.0), np.arange(3.0)
+    assert should_rasterize((3, 4), x, y, "rgba")
+    assert not should_rasterize((3, 4), x, y, "mesh")
+    assert not should_rasterize((3, 4), x, y, "auto") # 기본 임계값보다 작음
+    assert should_rasterize((3, 4), x, y, "auto", threshold=12)
+    assert not should_rasterize((3, 4), np.array([0.0, 1.0, 3.0, 4.0]), y, "auto", threshold=12)
+    assert not should_rasterize((3, 4), np.arange(5.0), y, "rgba") # 셀 경계 좌표는 메쉬로
+    assert should_rasterize((3, 4), x, y, "auto", cells=4096 * 4096) # 개요의 원본 크기로 판단
+
+
+def test_limit_raster_size_strides_long_sides():
+    x, y, z = np.arange(10), np.arange(3), np.zeros((3, 10))
+    x2, y2, z2 = limit_raster_size(x, y, z, max_size=4)
+    assert z2.shape == (3, 4) and x2.tolist() == [0, 3, 6, 9] and len(y2) == 3
+
+
+def test_colorize_maps_range_onto_lut_and_masks_nan():
+    lut = get_colormap_lut("viridis")
+    rgba, vmin, vmax = colorize(np.array([[0.0, 0.5, 1.0, np.nan]]), "viridis")
+    assert (vmin, vmax) == (0.0, 1.0)
+    assert rgba.shape == (1, 4, 4) and rgba.dtype == np.uint8
+    np.testing.assert_array_equal(rgba[0, 0, :3], lut[0])
+    np.testing.assert_array_equal(rgba[0, 2, :3], lut[-1])
+    assert rgba[0, :, 3].tolist() == [255, 255, 255, 0]
+
+
+def test_colorize_clips_to_given_range_and_accepts_masked_ints():
+    lut = get_colormap_lut("viridis")
+    z = np.ma.masked_array(np.array([[-5, 5, 50]]), mask=[[False, False, True]])
+    rgba, vmin, vmax = colorize(z, "viridis", vmin=0, vmax=10)
+    np.testing.assert_array_equal(rgba[0, 0, :3], lut[0])
+    assert rgba[0, 2, 3] == 0
+
+
+def test_encode_png_round_trips_pixels():
+    rgba = np.arange(2 * 3 * 4, dtype=np.uint8).reshape(2, 3, 4)
+    png = encode_png(rgba)
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", png[16:24])
+    assert (width, height) == (3, 2)
+    idat_length = struct.unpack(">I", png[33:37])[0]
+    raw = np.frombuffer(zlib.decompress(png[41:41 + idat_length]), dtype=np.uint8).reshape(2, 13)
+    assert (raw[:, 0] == 0).all() # 필터 없음
+    np.testing.assert_array_equal(raw[:, 1:].reshape(2, 3, 4), rgba)
+
+
+def test_cell_extent_adds_half_cells():
+    assert cell_extent(np.array([0.0, 1.0, 2.0])) == (-0.5, 2.5)
+    assert cell_extent(np.array([2.0, 0.0])) == (3.0, -1.0)
+    start, stop = cell_extent(np.array(["2020-01-01", "2020-01-02"], dtype="datetime64[D]"))
+    assert start == np.datetime64("2019-12-31T12:00")
+
+
+def test_rasterize_orders_rows_and_columns_increasing():
+    z = np.array([[0.0, 1.0], [2.0, 3.0]])
+    raster = rasterize(np.array([1.0, 0.0]), np.array([1.0, 0.0]), z, "viridis")
+    expected, _, _ = colorize(z[::-1, ::-1], "viridis")
+    np.testing.assert_array_equal(raster["rgba"], expected)
+    assert raster["x_extent"] == (-0.5, 1.5) and raster["y_extent"] == (-0.5, 1.5)
+    assert (raster["vmin"], raster["vmax"]) == (0.0, 3.0)
+
+
+def test_rasterize_keeps_masked_cells_transparent():
+    z = np.ma.masked_array(np.array([[0.0, 1.0], [2.0, 3.0]]), mask=[[False, True], [False, False]])
+    raster = rasterize(np.arange(2.0), np.arange(2.0), z, "viridis")
+    assert raster["rgba"][..., 3].tolist() == [[255, 0], [255, 255]]
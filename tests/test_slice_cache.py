@@ -0,0 +1,83 @@
+# oceanocal_v2/tests/test_slice_cache.py
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ..slice_cache import SliceCache
+
+OWNER = ("/data/a.nc", "sst")
+
+
+class RecordingLoader:
+    """AsyncLoader.submit 대신 요청된 슬라이스만 기록합니다."""
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, func, owner, data_array, indexers, keep_dims, **kwargs):
+        self.submitted.append(indexers["time"])
+
+
+@pytest.fixture
+def variable():
+    return xr.DataArray(np.arange(10 * 4 * 5, dtype=np.float64).reshape(10, 4, 5), dims=("time", "lat", "lon"))
+
+
+def test_read_caches_read_only_slices(variable):
+    cache = SliceCache()
+    first = cache.read(OWNER, variable, {"time": 3}, ("lat", "lon"))
+    np.testing.assert_array_equal(first, variable.values[3])
+    assert cache.read(OWNER, variable, {"time": 3}, ("lat", "lon")) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not first.flags.writeable
+    assert cache.nbytes == first.nbytes
+
+
+def test_store_evicts_least_recently_used(variable):
+    slice_bytes = variable.values[0].nbytes
+    cache = SliceCache(max_bytes=2 * slice_bytes)
+    for index in (0, 1):
+        cache.read(OWNER, variable, {"time": index}, ("lat", "lon"))
+    cache.read(OWNER, variable, {"time": 0}, ("lat", "lon")) # 0을 최근 사용으로
+    cache.read(OWNER, variable, {"time": 2}, ("lat", "lon"))
+    assert cache._key(OWNER, {"time": 0}, ("lat", "lon")) in cache
+    assert cache._key(OWNER, {"time": 1}, ("lat", "lon")) not in cache
+    assert cache.nbytes == 2 * slice_bytes
+
+
+def test_slices_larger_than_budget_are_not_kept(variable):
+    cache = SliceCache(max_bytes=8)
+    cache.read(OWNER, variable, {"time": 0}, ("lat", "lon"))
+    assert cache.nbytes == 0
+
+
+def test_prefetch_follows_direction_of_travel(variable):
+    cache = SliceCache(prefetch_count=3)
+    loader = RecordingLoader()
+    cache.prefetch(loader, OWNER, variable, {"time": 5}, ("lat", "lon"), "time")
+    assert loader.submitted == [6, 4] # 처음에는 양쪽 한 개씩
+    loader.submitted.clear()
+    cache.read(OWNER, variable, {"time": 8}, ("lat", "lon"))
+    cache.prefetch(loader, OWNER, variable, {"time": 6}, ("lat", "lon"), "time")
+    assert loader.submitted == [7, 9] # 앞으로: 이미 읽은 8은 건너뜁니다.
+    loader.submitted.clear()
+    cache.prefetch(loader, OWNER, variable, {"time": 1}, ("lat", "lon"), "time")
+    assert loader.submitted == [0] # 뒤로: 범위를 벗어난 인덱스는 건너뜁니다.
+
+
+def test_prefetch_without_loader_only_records_position(variable):
+    cache = SliceCache()
+    cache.prefetch(None, OWNER, variable, {"time": 2}, ("lat", "lon"), "time")
+    assert cache.nbytes == 0
+
+
+def test_invalidate_by_file(variable):
+    cache = SliceCache()
+    other = ("/data/b.nc", "sst")
+    cache.read(OWNER, variable, {"time": 0}, ("lat", "lon"))
+    cache.read(other, variable, {"time": 0}, ("lat", "lon"))
+    cache.invalidate("/data/a.nc")
+    assert cache._key(OWNER, {"time": 0}, ("lat", "lon")) not in cache
+    assert cache._key(other, {"time": 0}, ("lat", "lon")) in cache
+    cache.invalidate()
+    assert cache.nbytes == 0
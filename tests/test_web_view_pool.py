@@ -0,0 +1,63 @@
+# oceanocal_v2/tests/test_web_view_pool.py
+
+import time
+
+import pytest
+from PyQt6.QtWidgets import QWidget
+
+from ..web_view_pool import WebViewPool
+
+
+@pytest.fixture
+def pool(qapp):
+    """QtWebEngine 대신 일반 위젯을 만드는 풀. 초기화(reset)된 뷰를 기록합니다."""
+    pool = WebViewPool(QWidget, reset=lambda view: pool.reset_views.append(view), max_idle=2)
+    pool.reset_views = []
+    yield pool
+    pool.clear()
+
+
+def process_events(qapp, seconds=0.05):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+
+
+def test_acquire_schedules_one_spare_view(qapp, pool):
+    first = pool.acquire()
+    pool.acquire() # 예비 뷰가 만들어지기 전이면 다시 예약하지 않습니다.
+    assert pool.created == 2 and pool._idle == []
+    process_events(qapp)
+    assert pool.created == 3 and len(pool._idle) == 1 # 이벤트 루프가 한가할 때 하나만 만들어 둡니다.
+    spare = pool._idle[0]
+    assert pool.acquire() is spare and pool.reused == 1
+    assert first is not spare
+
+
+def test_released_views_are_reset_and_reused(qapp, pool):
+    parent = QWidget()
+    view = pool.acquire()
+    view.setParent(parent)
+    pool.release(view)
+    assert view.parent() is None and view.isHidden()
+    assert pool.reset_views == [view]
+    assert pool.acquire() is view
+
+
+def test_idle_views_are_capped_at_max_idle(qapp, pool):
+    views = [pool.acquire() for _ in range(4)]
+    for view in views:
+        pool.release(view)
+    assert pool._idle == views[:2]
+    assert pool.reset_views == views[:2] # 넘치는 뷰는 초기화하지 않고 삭제합니다.
+    pool.prewarm(5)
+    assert len(pool._idle) == 2 and pool.created == 4
+
+
+def test_pool_without_idle_views_never_prewarms(qapp):
+    pool = WebViewPool(QWidget, max_idle=0)
+    view = pool.acquire()
+    process_events(qapp)
+    assert pool.created == 1 and pool._idle == []
+    pool.release(view)
+    assert pool._idle == []
@@ -0,0 +1,81 @@
+# oceanocal_v2/web_view_pool.py
+
+import os
+import logging
+
+from PyQt6.QtCore import QTimer
+
+logger = logging.getLogger(__name__)
+
+WEB_VIEW_POOL_SIZE = 2 # 닫힌 창에서 회수해 보관하는 유휴 뷰 수
+RENDERER_PROCESS_LIMIT = 4 # Chromium 렌더러 프로세스 최대 수 (뷰가 더 많으면 프로세스를 함께 사용)
+_CHROMIUM_FLAGS_ENV = "QTWEBENGINE_CHROMIUM_FLAGS"
+
+
+def limit_renderer_processes(limit=RENDERER_PROCESS_LIMIT):
+    """
+    Chromium 렌더러 프로세스 수를 제한합니다. Chromium은 QtWebEngine이 시작될 때 플래그를 한 번만 읽으므로
+    QApplication을 만들기 전에 호출해야 합니다 (run_app 참고). 환경 변수에 이미 지정된 값은 그대로 둡니다.
+    """
+    flags = os.environ.get(_CHROMIUM_FLAGS_ENV, "")
+    if "--renderer-process-limit" not in flags:
+        os.environ[_CHROMIUM_FLAGS_ENV] = f"{flags} --renderer-process-limit={int(limit)}".strip()
+
+
+class WebViewPool:
+    """
+    QWebEngineView 재사용 풀.
+    뷰마다 Chromium 렌더러 프로세스(약 100MB, 수백 ms)가 시작되므로, factory()로 만든 뷰(페이지까지 로드된 상태)를
+    예비로 하나 준비해 두고 닫힌 창의 뷰를 회수해 다시 씁니다. reset(view)은 회수한 뷰의 이전 내용을 지웁니다.
+    렌더러 프로세스 수 제한은 앱 시작 시 limit_renderer_processes()로 설정합니다.
+    """
+    def __init__(self, factory, reset=None, max_idle=WEB_VIEW_POOL_SIZE):
+        self._factory = factory
+        self._reset = reset
+        self.max_idle = max(0, int(max_idle))
+        self._idle = [] # 회수했거나 미리 만든 뷰 (부모 없음, 숨김 상태)
+        self._spare_pending = False
+        self.created = 0
+        self.reused = 0
+
+    def prewarm(self, count=1):
+        """유휴 뷰가 count개(최대 max_idle)가 되도록 미리 만듭니다. 뷰를 내준 뒤 이벤트 루프가 한가할 때 호출됩니다."""
+        self._spare_pending = False
+        while len(self._idle) < min(count, self.max_idle):
+            self._idle.append(self._create())
+
+    def acquire(self):
+        """유휴 뷰를 꺼내거나 새로 만들어 반환합니다. 유휴 뷰가 바닥나면 다음 창을 위한 예비 뷰를 예약합니다."""
+        if self._idle:
+            view = self._idle.pop()
+            self.reused += 1
+        else:
+            view = self._create()
+        if not self._idle and self.max_idle and not self._spare_pending:
+            # 이벤트 루프가 한가해지면 만들어 두므로 다음 창은 렌더러 시작을 기다리지 않습니다.
+            self._spare_pending = True
+            QTimer.singleShot(0, self.prewarm)
+        return view
+
+    def release(self, view):
+        """창이 닫힐 때 뷰를 돌려받습니다. 유휴 뷰가 max_idle개를 넘으면 뷰를 삭제해 렌더러 프로세스를 반환합니다."""
+        view.setParent(None)
+        view.hide()
+        if len(self._idle) >= self.max_idle:
+            view.deleteLater()
+            return
+        if self._reset is not None:
+            self._reset(view)
+        self._idle.append(view)
+        logger.debug(f"웹 뷰 회수 (유휴 {len(self._idle)}개)")
+
+    def _create(self):
+        self.created += 1
+        logger.debug(f"웹 뷰 생성 ({self.created}번째)")
+        return self._factory()
+
+    def clear(self):
+        """유휴 뷰를 모두 삭제합니다."""
+        for view in self._idle:
+            view.deleteLater()
+        self._idle.clear()